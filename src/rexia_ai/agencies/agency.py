@@ -1,6 +1,5 @@
 """Agency class for ReXia.AI"""
 
-import json5
 import logging
 from typing import List, Dict, Any
 from dataclasses import dataclass
@@ -96,8 +95,7 @@ class ManagerAgent:
 
         try:
             response = self.llm.invoke(prompt)
-            cleaned_response = self._clean_response(response)
-            parsed_response = json5.loads(cleaned_response)
+            parsed_response = self._parse_response(response)
             self.subtasks = self._process_parsed_response(parsed_response)
             logging.info("Generated subtasks:")
             for idx, subtask in enumerate(self.subtasks, 1):
@@ -289,8 +287,10 @@ class ManagerAgent:
         Raises:
             AgencyError: If there's an error in executing the assignment.
         """
+        context = None
         try:
-            result = assignment.agent.invoke(assignment.task)
+            context = assignment.agent.create_context(assignment.task)
+            result = assignment.agent.invoke(context=context)
             summary = (
                 "Subtask: "
                 + assignment.task
@@ -306,7 +306,7 @@ class ManagerAgent:
             self.collaboration_channel.put(
                 error_message
                 + "\n\nAgent messages:"
-                + "\n".join(assignment.agent.workflow.channel.messages)
+                + "\n".join(context.channel.messages if context is not None else [])
             )
             raise AssignmentError(error_message)
 
@@ -321,19 +321,18 @@ class ManagerAgent:
             return "No previous results."
         return "\n\n".join(self.collaboration_channel.messages)
 
-    def _clean_response(self, response: str) -> str:
+    def _parse_response(self, response: str) -> Any:
         """
-        Clean the response from the model.
+        Extract and parse the JSON in the response from the model.
 
         Args:
             response: The response from the model.
 
         Returns:
-            The cleaned response.
+            The parsed response.
         """
         cleaned_response = Utility.extract_json_string(response)
-        cleaned_response = Utility.fix_json_errors(cleaned_response)
-        return cleaned_response
+        return Utility.parse_json(cleaned_response)
 
 
 class Agency:
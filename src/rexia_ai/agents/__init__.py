@@ -1,9 +1,11 @@
 """agents module for ReXia.AI."""
 
 from .component import Component
+from .component_graph import ComponentGraph
 from .agent import Agent
 
 __all__ = [
     "Component",
+    "ComponentGraph",
     "Agent",
 ]
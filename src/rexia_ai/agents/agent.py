@@ -1,17 +1,24 @@
 """Agent class for ReXia.AI."""
 
+import asyncio
 import logging
 import re
-from typing import Type, Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, AsyncIterator, Iterable, Iterator, Type, Optional, List, Tuple
 from ..workflows import ReflectWorkflow
 from ..structure import RexiaAIResponse
 from ..base import BaseWorkflow
+from ..common import RunContext
 from .routers import TaskComplexityRouter
 from ..llms import RexiaAIOpenAI
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
+
+# Tasks run at once by invoke_many and ainvoke_many unless the caller chooses otherwise.
+DEFAULT_MAX_CONCURRENCY = 8
+
 class Agent:
     """
     Agent class for ReXia AI.
@@ -24,7 +31,6 @@ class Agent:
         task (str): The task assigned to the agent.
         verbose (bool): Flag for enabling verbose mode.
         router (Optional[TaskComplexityRouter]): The task complexity router, if used.
-        task_complexity (Optional[int]): The complexity of the task, if router is used.
     """
 
     def __init__(
@@ -70,7 +76,6 @@ class Agent:
             )
         else:
             self.router = None
-            self.task_complexity = None
         
         self.llm = llm
 
@@ -81,17 +86,37 @@ class Agent:
             verbose=verbose,
         )
 
-    def run_workflow(self) -> List[str]:
+    def run_workflow(self, context: Optional[RunContext] = None) -> List[str]:
         """
         Run the workflow and return the messages.
 
+        Args:
+            context: The run to execute. Defaults to a new run of the agent's task.
+
+        Returns:
+            The messages from the workflow.
+        """
+        context = context or self.create_context()
+        logger.info("Starting workflow...")
+        self.workflow.run(context)
+        logger.info("Workflow completed.")
+        return context.channel.messages
+
+    async def arun_workflow(self, context: Optional[RunContext] = None) -> List[str]:
+        """
+        Asynchronously run the workflow and return the messages.
+
+        Args:
+            context: The run to execute. Defaults to a new run of the agent's task.
+
         Returns:
             The messages from the workflow.
         """
+        context = context or self.create_context()
         logger.info("Starting workflow...")
-        self.workflow.run()
+        await self.workflow.arun(context)
         logger.info("Workflow completed.")
-        return self.workflow.channel.messages
+        return context.channel.messages
 
     def get_task_result(self, messages: List[str]) -> Optional[str]:
         """
@@ -109,38 +134,204 @@ class Agent:
 
         return messages[-1]
 
-    def invoke(self, task: str = None) -> Optional[RexiaAIResponse]:
+    def invoke(self, task: str = None, context: Optional[RunContext] = None) -> Optional[RexiaAIResponse]:
         """
         Invoke method for the agent.
 
         This method runs the workflow, gets the task result and the plan, updates the buffer manager with the plan,
         and returns the accepted answer if it exists.
 
+        Each call runs in a RunContext of its own, so one agent can serve concurrent calls from
+        several threads. The agent's task and workflow are left unchanged. To read a run's chat
+        afterwards, create its context with create_context and pass it in.
+
+        Args:
+            task: The task to run. Defaults to the agent's task.
+            context: The run to execute. Defaults to a new run of the task.
+
         Returns:
             The accepted answer if it exists, None otherwise.
         """
         try:
-            self.workflow.clear_channel()
-            if task:
-                logging.info("New task set.")
-                self.task = task
-                self.workflow.channel.task = task
-                self.workflow.task = task
-                if self.router:
-                    self.task_complexity = self.router.route(task)
-                    self.llm = (
-                        self.router.complex_llm
-                        if self.task_complexity > self.router.task_complexity_threshold
-                        else self.router.base_llm
-                    )
-                    self.workflow.llm = self.llm
-            messages = self.run_workflow()
+            context = context or self.create_context(task)
+            messages = self.run_workflow(context)
             task_result = self.get_task_result(messages)
             accepted_answer = self.format_accepted_answer(task_result)
             return accepted_answer
         except Exception as e:
             logging.error(f"Unexpected error: {e}")
 
+    async def ainvoke(self, task: str = None, context: Optional[RunContext] = None) -> Optional[RexiaAIResponse]:
+        """
+        Asynchronously invoke the agent.
+
+        Mirrors invoke, awaiting the router and the workflow so that model calls
+        do not block the event loop.
+
+        Args:
+            task: The task to run. Defaults to the agent's task.
+            context: The run to execute. Defaults to a new run of the task.
+
+        Returns:
+            The accepted answer if it exists, None otherwise.
+        """
+        try:
+            context = context or await self.acreate_context(task)
+            messages = await self.arun_workflow(context)
+            task_result = self.get_task_result(messages)
+            accepted_answer = self.format_accepted_answer(task_result)
+            return accepted_answer
+        except Exception as e:
+            logging.error(f"Unexpected error: {e}")
+
+    def invoke_many(
+        self, tasks: Iterable[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Iterator[Tuple[int, Optional[RexiaAIResponse]]]:
+        """
+        Invoke the agent on many independent tasks concurrently.
+
+        Each task runs in a RunContext of its own on the agent's workflow, so tasks cannot see
+        each other's messages and the agent's own task and workflow are left untouched. The
+        tasks share the agent's LLM, and at most max_concurrency of them run at once.
+
+        Args:
+            tasks: The tasks to run.
+            max_concurrency: The maximum number of tasks running at once. Defaults to 8.
+
+        Yields:
+            Tuple[int, Optional[RexiaAIResponse]]: The index of a task in tasks and its accepted
+                answer, or None if it failed, in the order the tasks complete.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        futures = {
+            executor.submit(self._invoke_isolated, task): index
+            for index, task in enumerate(tasks)
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Tasks not yet started are dropped if the caller stops iterating early.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def ainvoke_many(
+        self, tasks: Iterable[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> AsyncIterator[Tuple[int, Optional[RexiaAIResponse]]]:
+        """
+        Asynchronously invoke the agent on many independent tasks concurrently.
+
+        Mirrors invoke_many, running the tasks on the event loop instead of in threads.
+
+        Args:
+            tasks: The tasks to run.
+            max_concurrency: The maximum number of tasks running at once. Defaults to 8.
+
+        Yields:
+            Tuple[int, Optional[RexiaAIResponse]]: The index of a task in tasks and its accepted
+                answer, or None if it failed, in the order the tasks complete.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(index: int, task: str) -> Tuple[int, Optional[RexiaAIResponse]]:
+            async with semaphore:
+                return index, await self._ainvoke_isolated(task)
+
+        pending = [asyncio.ensure_future(run(index, task)) for index, task in enumerate(tasks)]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def create_context(self, task: Optional[str] = None) -> RunContext:
+        """
+        Create the context for a run, choosing its LLM with the router if one is configured.
+
+        Args:
+            task: The task for the run. Defaults to the agent's task, which is not routed.
+
+        Returns:
+            RunContext: A new run context with a channel of its own, and the task's complexity if
+                it was routed.
+        """
+        if not (task and self.router):
+            return self.workflow.create_context(task or self.task, self.llm)
+        task_complexity = self.router.route(task)
+        context = self.workflow.create_context(task, self._llm_for_complexity(task_complexity))
+        context.task_complexity = task_complexity
+        return context
+
+    async def acreate_context(self, task: Optional[str] = None) -> RunContext:
+        """
+        Asynchronously create the context for a run, awaiting the router if one is configured.
+
+        Args:
+            task: The task for the run. Defaults to the agent's task, which is not routed.
+
+        Returns:
+            RunContext: A new run context with a channel of its own, and the task's complexity if
+                it was routed.
+        """
+        if not (task and self.router):
+            return self.workflow.create_context(task or self.task, self.llm)
+        task_complexity = await self.router.aroute(task)
+        context = self.workflow.create_context(task, self._llm_for_complexity(task_complexity))
+        context.task_complexity = task_complexity
+        return context
+
+    def _invoke_isolated(self, task: str) -> Optional[RexiaAIResponse]:
+        """
+        Run a batched task in a context of its own, without changing the agent's state.
+
+        Args:
+            task: The task to run.
+
+        Returns:
+            The accepted answer if it exists, None otherwise.
+        """
+        try:
+            context = self.create_context(task)
+            self.workflow.run(context)
+            return self.format_accepted_answer(self.get_task_result(context.channel.messages))
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return None
+
+    async def _ainvoke_isolated(self, task: str) -> Optional[RexiaAIResponse]:
+        """
+        Asynchronously run a batched task in a context of its own, without changing the agent's state.
+
+        Args:
+            task: The task to run.
+
+        Returns:
+            The accepted answer if it exists, None otherwise.
+        """
+        try:
+            context = await self.acreate_context(task)
+            await self.workflow.arun(context)
+            return self.format_accepted_answer(self.get_task_result(context.channel.messages))
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return None
+
+    def _llm_for_complexity(self, task_complexity: int) -> Any:
+        """
+        Choose the LLM for a task of the given complexity.
+
+        Args:
+            task_complexity: The complexity returned by the router.
+
+        Returns:
+            The router's complex LLM if the complexity is over the threshold, otherwise its base LLM.
+        """
+        if task_complexity > self.router.task_complexity_threshold:
+            return self.router.complex_llm
+        return self.router.base_llm
+
     def format_accepted_answer(self, answer: str) -> Optional[RexiaAIResponse]:
         """
         Format the accepted answer by removing any single word before the JSON object.
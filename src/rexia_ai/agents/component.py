@@ -1,9 +1,9 @@
 """Component class for ReXia.AI."""
 
 import logging
-from typing import Any
+from typing import Any, List, Optional, Sequence
 from ..base import BaseWorker
-from ..common import CollaborationChannel
+from ..common import CollaborationChannel, RunContext
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
@@ -12,59 +12,135 @@ class Component:
     """
     A general component that uses specialised workers to perform different tasks.
 
+    A component holds no state of its own between runs. Each run passes a RunContext
+    with its task, channel and model, so one component can serve concurrent runs.
+
     Attributes:
         name: The name of the component.
-        channel: The channel used by the component.
+        channel: The channel used when the component is run without a run context.
         worker: The worker used by the component.
+        depends_on: Names of the components whose messages this component needs, when it is
+            run as part of a ComponentGraph.
     """
 
     name: str
     channel: CollaborationChannel
     worker: BaseWorker
+    depends_on: List[str]
 
     def __init__(
         self,
         name: str,
         channel: CollaborationChannel,
         worker: BaseWorker,
+        depends_on: Optional[Sequence[str]] = None,
     ):
         """
         Initialize a Component instance.
 
         Args:
             name: The name of the component.
-            channel: The channel used by the component.
+            channel: The channel used when the component is run without a run context.
             worker: The worker used by the component.
+            depends_on: Names of the components whose messages this component needs. Defaults to none.
         """
         self.name = name
         self.channel = channel
         self.worker = worker
+        self.depends_on = list(depends_on or [])
 
-    def run(self) -> Any:
+    def run(
+        self, context: Optional[RunContext] = None, messages: Optional[List[Any]] = None
+    ) -> Any:
         """
         Run the component and return the response.
 
+        Args:
+            context: The run to work on. Defaults to a run on the component's own channel.
+            messages: The messages to include in the prompt. Defaults to all the messages in the run's channel.
+
         Returns:
             The response from performing the task.
         """
         logging.info(f"Component {self.name} running.")
-        response = self.perform_task()
+        response = self.perform_task(context, messages)
         logging.info(f"Component {self.name} finished running.")
         return response
 
-    def perform_task(self) -> Any:
+    def perform_task(
+        self, context: Optional[RunContext] = None, messages: Optional[List[Any]] = None
+    ) -> Any:
         """
         Perform the task assigned to the component and return the response.
 
-        The task is retrieved from the channel, a prompt is created using the worker,
+        The task is retrieved from the run's channel, a prompt is created using the worker,
         an action is performed using the worker and the prompt, and the response is put into the channel.
+        The run is bound while the worker acts, so the worker uses the run's model.
+
+        Args:
+            context: The run to work on. Defaults to a run on the component's own channel.
+            messages: The messages to include in the prompt. Defaults to all the messages in the run's channel.
 
         Returns:
             The response from performing the action.
         """
-        task = self.channel.task
-        messages = self.channel.messages
-        prompt = self.worker.create_prompt(task=task, messages=messages)
-        response = self.worker.action(prompt=prompt, worker_name=self.name)
-        self.channel.put(response)
+        context = context or self._default_context()
+        with context.bind():
+            if messages is None:
+                messages = context.channel.messages
+            prompt = self.worker.create_prompt(task=context.task, messages=messages)
+            response = self.worker.action(prompt=prompt, worker_name=self.name)
+        context.channel.put(response)
+        return response
+
+    async def arun(
+        self, context: Optional[RunContext] = None, messages: Optional[List[Any]] = None
+    ) -> Any:
+        """
+        Asynchronously run the component and return the response.
+
+        Args:
+            context: The run to work on. Defaults to a run on the component's own channel.
+            messages: The messages to include in the prompt. Defaults to all the messages in the run's channel.
+
+        Returns:
+            The response from performing the task.
+        """
+        logging.info(f"Component {self.name} running.")
+        response = await self.aperform_task(context, messages)
+        logging.info(f"Component {self.name} finished running.")
         return response
+
+    async def aperform_task(
+        self, context: Optional[RunContext] = None, messages: Optional[List[Any]] = None
+    ) -> Any:
+        """
+        Asynchronously perform the task assigned to the component and return the response.
+
+        Mirrors perform_task, but awaits the worker's asynchronous action so the
+        model call does not block the event loop.
+
+        Args:
+            context: The run to work on. Defaults to a run on the component's own channel.
+            messages: The messages to include in the prompt. Defaults to all the messages in the run's channel.
+
+        Returns:
+            The response from performing the action.
+        """
+        context = context or self._default_context()
+        with context.bind():
+            if messages is None:
+                messages = context.channel.messages
+            prompt = self.worker.create_prompt(task=context.task, messages=messages)
+            response = await self.worker.aaction(prompt=prompt, worker_name=self.name)
+        context.channel.put(response)
+        return response
+
+    def _default_context(self) -> RunContext:
+        """
+        Build a run on the component's own channel, for callers that do not pass one.
+
+        Returns:
+            RunContext: A run using the channel's task and the worker's own model.
+        """
+        return RunContext(task=self.channel.task, channel=self.channel)
@@ -0,0 +1,222 @@
+"""ComponentGraph class for ReXia.AI."""
+
+import asyncio
+import contextvars
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from ..common import RunContext
+from .component import Component
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+class ComponentGraph:
+    """
+    Runs a workflow's components as a dependency graph.
+
+    Each component lists the components whose messages it needs in `depends_on`. A component
+    starts as soon as everything it depends on has finished, so components that do not depend
+    on each other run concurrently. A component sees the messages of all the components it
+    depends on, directly or indirectly, in the order the components were given, rather than
+    the order they happened to finish. A chain of components therefore sees exactly what it
+    would see if the components were run one after another.
+
+    Attributes:
+        components: The components, in order.
+    """
+
+    def __init__(self, components: Iterable[Component]):
+        """
+        Initialize a ComponentGraph instance.
+
+        Args:
+            components: The components, in order. Every dependency must be listed.
+
+        Raises:
+            ValueError: If two components share a name, a dependency is unknown, or the
+                dependencies form a cycle.
+        """
+        self.components: List[Component] = list(components)
+        self._by_name: Dict[str, Component] = {}
+        for component in self.components:
+            if component.name in self._by_name:
+                raise ValueError(f"Duplicate component name: {component.name}")
+            self._by_name[component.name] = component
+        for component in self.components:
+            for dependency in component.depends_on:
+                if dependency not in self._by_name:
+                    raise ValueError(f"Component {component.name} depends on unknown component {dependency}")
+        self._ancestors = {c.name: self._find_ancestors(c.name, []) for c in self.components}
+
+    def run(
+        self,
+        context: RunContext,
+        skip: Iterable[str] = (),
+        on_complete: Optional[Callable[[str, Any], Iterable[str]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the components, each as soon as its dependencies have finished.
+
+        Args:
+            context: The run to work on.
+            skip: Names of components not to run this time. Components that depend on them
+                run without their messages.
+            on_complete: Called with each component's name and response as it finishes. It
+                returns the names of any components not yet started that should be skipped.
+
+        Returns:
+            A dictionary of each component's response, by name.
+
+        Raises:
+            Exception: The first error raised by a component. Components already running are
+                allowed to finish, and no further components are started.
+        """
+        responses: Dict[str, Any] = {}
+        done: Set[str] = set(skip)
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(self.components))) as executor:
+            while True:
+                for component in self._ready(done, running.values()):
+                    logger.debug(f"Starting component {component.name}")
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        component.run,
+                        context,
+                        self._messages_for(component, responses),
+                    )
+                    running[future] = component.name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    responses[name] = future.result()
+                    done.add(name)
+                    done.update(self._completed(name, responses[name], on_complete))
+        return responses
+
+    async def arun(
+        self,
+        context: RunContext,
+        skip: Iterable[str] = (),
+        on_complete: Optional[Callable[[str, Any], Iterable[str]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Asynchronously run the components, each as soon as its dependencies have finished.
+
+        Args:
+            context: The run to work on.
+            skip: Names of components not to run this time.
+            on_complete: Called with each component's name and response as it finishes. It
+                returns the names of any components not yet started that should be skipped.
+
+        Returns:
+            A dictionary of each component's response, by name.
+
+        Raises:
+            Exception: The first error raised by a component. Components still running are cancelled.
+        """
+        responses: Dict[str, Any] = {}
+        done: Set[str] = set(skip)
+        running: Dict[asyncio.Future, str] = {}
+        try:
+            while True:
+                for component in self._ready(done, running.values()):
+                    logger.debug(f"Starting component {component.name}")
+                    task = asyncio.ensure_future(
+                        component.arun(context, self._messages_for(component, responses))
+                    )
+                    running[task] = component.name
+                if not running:
+                    break
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    name = running.pop(task)
+                    responses[name] = task.result()
+                    done.add(name)
+                    done.update(self._completed(name, responses[name], on_complete))
+        finally:
+            for task in running:
+                task.cancel()
+        return responses
+
+    @staticmethod
+    def _completed(
+        name: str, response: Any, on_complete: Optional[Callable[[str, Any], Iterable[str]]]
+    ) -> Iterable[str]:
+        """
+        Report a finished component to the caller's callback.
+
+        Args:
+            name: The name of the component.
+            response: The component's response.
+            on_complete: The caller's callback, if any.
+
+        Returns:
+            The names of the components to skip from now on.
+        """
+        if on_complete is None:
+            return ()
+        return on_complete(name, response) or ()
+
+    def _ready(self, done: Set[str], running: Iterable[str]) -> List[Component]:
+        """
+        Get the components that can start now.
+
+        Args:
+            done: Names of components that have finished or are skipped.
+            running: Names of components that are running.
+
+        Returns:
+            The components not yet started whose dependencies have all finished.
+        """
+        started = done | set(running)
+        return [
+            component
+            for component in self.components
+            if component.name not in started
+            and all(dependency in done for dependency in component.depends_on)
+        ]
+
+    def _messages_for(self, component: Component, responses: Dict[str, Any]) -> List[Any]:
+        """
+        Get the messages a component sees: those of its ancestors, in component order.
+
+        Args:
+            component: The component about to run.
+            responses: The responses of the components that have finished.
+
+        Returns:
+            The messages for the component's prompt.
+        """
+        ancestors = self._ancestors[component.name]
+        return [
+            responses[other.name]
+            for other in self.components
+            if other.name in ancestors and responses.get(other.name)
+        ]
+
+    def _find_ancestors(self, name: str, path: List[str]) -> Set[str]:
+        """
+        Find every component a component depends on, directly or indirectly.
+
+        Args:
+            name: The component's name.
+            path: The names on the current dependency path, used to detect cycles.
+
+        Returns:
+            The names of the component's ancestors.
+
+        Raises:
+            ValueError: If the dependencies form a cycle.
+        """
+        if name in path:
+            raise ValueError(f"Component dependencies form a cycle: {' -> '.join(path + [name])}")
+        ancestors: Set[str] = set()
+        for dependency in self._by_name[name].depends_on:
+            ancestors.add(dependency)
+            ancestors |= self._find_ancestors(dependency, path + [name])
+        return ancestors
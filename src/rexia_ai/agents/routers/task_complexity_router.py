@@ -1,6 +1,5 @@
 """TaskComplexityRouter class for ReXia.AI"""
 
-import json5
 import logging
 from typing import Dict, Any
 from ...llms import RexiaAIOpenAI
@@ -136,6 +135,25 @@ class TaskComplexityRouter:
             logger.error(f"Error in routing task: {e}. Setting complexity to complexity threshold for safety.")
             return self.task_complexity_threshold
 
+    async def aroute(self, task: str) -> int:
+        """
+        Asynchronously route the given task to the appropriate model based on its complexity.
+
+        Args:
+            task (str): The task to be routed and processed.
+        Returns:
+            int: The complexity score.
+        """
+        try:
+            complexity_score = await self._acalculate_complexity_score(task)
+            is_complex = complexity_score > self.task_complexity_threshold
+            model_type = "complex" if is_complex else "base"
+            logger.info(f"Task complexity: {complexity_score}. Use {model_type} model.")
+            return complexity_score
+        except Exception as e:
+            logger.error(f"Error in routing task: {e}. Setting complexity to complexity threshold for safety.")
+            return self.task_complexity_threshold
+
     def _calculate_complexity_score(self, task: str) -> int:
         """
         Calculate the complexity score of the given task.
@@ -155,8 +173,7 @@ class TaskComplexityRouter:
         try:
             prompt = PREDEFINED_PROMPT + "\n\n" + task
             response = self.router_llm.invoke(prompt)
-            cleaned_response = self._clean_router_response(response)
-            parsed_response = json5.loads(cleaned_response)
+            parsed_response = self._parse_router_response(response)
             complexity_score = parsed_response.get('complexity_score')
             
             if not isinstance(complexity_score, (int, float)) or complexity_score < 1 or complexity_score > 100:
@@ -167,21 +184,56 @@ class TaskComplexityRouter:
             try:
                 fix_json_errors_prompt = Utility.fix_json_errors_prompt(json_string=response, error=e)
                 fixed_response = self.base_llm.invoke(fix_json_errors_prompt)
-                parsed_response = json5.loads(fixed_response)
+                parsed_response = self._parse_router_response(fixed_response)
                 complexity_score = parsed_response.get('complexity_score')
                 
                 return int(complexity_score)
             except:
                 raise ValueError("Error parsing router model's response or calculating complexity score.")
 
-    def _clean_router_response(self, response: str) -> str:
+    async def _acalculate_complexity_score(self, task: str) -> int:
+        """
+        Asynchronously calculate the complexity score of the given task.
+
+        Args:
+            task (str): The task to be assessed for complexity.
+
+        Returns:
+            int: The calculated complexity score.
+
+        Raises:
+            ValueError: If there's an error in parsing the router model's response
+            or if the complexity score is invalid.
+        """
+        response = None
+        try:
+            prompt = PREDEFINED_PROMPT + "\n\n" + task
+            response = await self.router_llm.ainvoke(prompt)
+            parsed_response = self._parse_router_response(response)
+            complexity_score = parsed_response.get('complexity_score')
+
+            if not isinstance(complexity_score, (int, float)) or complexity_score < 1 or complexity_score > 100:
+                raise ValueError(f"Invalid complexity score: {complexity_score}")
+
+            return int(complexity_score)
+        except Exception as e:
+            try:
+                fix_json_errors_prompt = Utility.fix_json_errors_prompt(json_string=response, error=e)
+                fixed_response = await self.base_llm.ainvoke(fix_json_errors_prompt)
+                parsed_response = self._parse_router_response(fixed_response)
+                complexity_score = parsed_response.get('complexity_score')
+
+                return int(complexity_score)
+            except:
+                raise ValueError("Error parsing router model's response or calculating complexity score.")
+
+    def _parse_router_response(self, response: str) -> Any:
         """
-        Clean the JSON response from the router model.
+        Extract and parse the JSON response from the router model.
         Args:
             response (str): The JSON string response from the router model.
         Returns:
-            str: the cleaned JSON response.
+            Any: the parsed JSON response.
         """
         cleaned_response = Utility.extract_json_string(response)
-        cleaned_response = Utility.fix_json_errors(cleaned_response)
-        return cleaned_response
\ No newline at end of file
+        return Utility.parse_json(cleaned_response)
\ No newline at end of file
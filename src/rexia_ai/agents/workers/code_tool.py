@@ -2,10 +2,10 @@
 
 import logging
 from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
-from typing import Any, List, Dict
-from ...base import BaseWorker
+from typing import Any, List, Dict, Optional
+from ...base import BaseWorker, BaseExecutionBackend
 from ...structure import RexiaAIResponse
-from ...common import ContainerisedToolRunner
+from ...common import ContainerisedToolRunner, Utility
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -130,16 +130,23 @@ class CodeTool(BaseWorker):
         used to execute the generated code in a secure environment.
     """
 
-    def __init__(self, model: Any, verbose: bool = False):
+    def __init__(
+        self,
+        model: Any,
+        verbose: bool = False,
+        execution_backend: Optional[BaseExecutionBackend] = None,
+    ):
         """
         Initialize a CodeTool instance.
 
         Args:
             model (Any): The language model to be used for generating code.
             verbose (bool, optional): If True, enables verbose output. Defaults to False.
+            execution_backend (BaseExecutionBackend, optional): The backend that runs the generated
+                code. Defaults to the shared Docker container pool.
         """
         super().__init__(model, verbose=verbose)
-        self.tool_runner = ContainerisedToolRunner()
+        self.tool_runner = ContainerisedToolRunner(backend=execution_backend)
 
     def create_prompt(self, task: str, messages: List[str]) -> str:
         """
@@ -216,6 +223,55 @@ class CodeTool(BaseWorker):
             prompt = self._update_prompt_with_error(prompt, agent_response, str(e))
             raise ToolGenerationError(str(e))
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_fixed(1),
+        retry=retry_if_exception_type((ToolGenerationError, ToolExecutionError)),
+        before_sleep=lambda retry_state: logger.info(f"Retrying action (attempt {retry_state.attempt_number})"),
+        reraise=True,
+    )
+    async def aaction(self, prompt: str, worker_name: str) -> str:
+        """
+        Asynchronously generate and run a Python tool based on the given prompt.
+
+        The model call is awaited and the containerised execution runs in a worker thread,
+        with the same retry behaviour as action.
+
+        Args:
+            prompt (str): The prompt for generating the tool.
+            worker_name (str): The name of the worker executing this action.
+
+        Returns:
+            str: A formatted string containing the worker's response and tool execution results.
+
+        Raises:
+            RetryError: If all retry attempts fail.
+        """
+        agent_response = None
+        try:
+            agent_response = await self._ainvoke_model(prompt)
+            if not isinstance(agent_response, RexiaAIResponse):
+                raise ToolGenerationError(f"Expected RexiaAIResponse, got {type(agent_response)}")
+
+            code = self._extract_code(agent_response)
+            if self.verbose:
+                logger.info("Code to execute:")
+                logger.info(code)
+
+            result = await Utility.run_in_thread(self.tool_runner.execute_code, code)
+            if result.get("success"):
+                output = result.get("output", "No output")
+                logger.info(f"Tool execution successful. Output: {str(result)}")
+                return self._format_response(worker_name, agent_response, output)
+            else:
+                error_message = f"Error: {result['error']}"
+                if self.verbose:
+                    logger.error(error_message)
+                raise ToolExecutionError(error_message)
+        except Exception as e:
+            logger.error(f"Error during attempt: {str(e)}")
+            raise ToolGenerationError(str(e))
+
     def _update_prompt_with_error(self, prompt: str, agent_response: RexiaAIResponse, error_message: str) -> str:
         return f"""
         The Python code within the answer field of this JSON object returned an error.
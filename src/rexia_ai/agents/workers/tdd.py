@@ -1,11 +1,16 @@
 """TDD Worker class for ReXia.AI."""
 
+import ast
+import asyncio
 import inspect
+import itertools
 import logging
-from typing import Any, List, Dict
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, List, Dict, NamedTuple, Optional, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from ...base import BaseWorker
-from ...common import ContainerisedCodeTester
+from ...base import BaseWorker, BaseExecutionBackend
+from ...common import ContainerisedCodeTester, Utility
 from ...structure import RexiaAIResponse
 
 # Configure logging
@@ -18,6 +23,18 @@ class CodeGenerationError(Exception):
 class CodeExecutionError(Exception):
     pass
 
+
+# Sampling temperatures of best-of-N candidates, by position. A model configured for greedy
+# decoding would otherwise return the same code for every candidate.
+CANDIDATE_TEMPERATURES = (0.7, 0.8, 0.9, 1.0)
+
+
+class _Candidate(NamedTuple):
+    """A candidate implementation and its test results."""
+
+    response: RexiaAIResponse
+    result: Dict[str, Any]
+
 PREDEFINED_PROMPT = """
 ## Role
 As a test-driven development agent for ReXia.AI, implement Python function(s) to pass the given unit test.
@@ -105,17 +122,49 @@ class TDDWorker(BaseWorker):
     the provided unit tests.
     """
 
-    def __init__(self, model: Any, verbose: bool = False):
+    def __init__(
+        self,
+        model: Any,
+        verbose: bool = False,
+        execution_backend: Optional[BaseExecutionBackend] = None,
+        best_of_n: int = 1,
+        repair_rounds: int = 2,
+    ):
         """
         Initialize a TDDWorker instance.
 
         Args:
             model: The model used by the worker.
             verbose: A flag used for enabling verbose mode. Defaults to False.
+            execution_backend: The backend that runs the tests. Defaults to the shared Docker
+                container pool.
+            best_of_n: The number of candidate implementations to generate and test at once.
+                Defaults to 1, which generates one at a time and retries on failure.
+            repair_rounds: With best_of_n above 1, the number of further rounds seeded by the
+                best failing candidate. Defaults to 2.
+
+        Raises:
+            ValueError: If best_of_n is less than 1 or repair_rounds is negative.
         """
+        if best_of_n < 1 or repair_rounds < 0:
+            raise ValueError("best_of_n must be at least 1 and repair_rounds at least 0")
         super().__init__(model, verbose=verbose)
         self.test_class = None
         self.test_globals = {}
+        self.execution_backend = execution_backend
+        self.best_of_n = best_of_n
+        self.repair_rounds = repair_rounds
+        self._code_tester = None
+        self._seeds = itertools.count()
+
+    @property
+    def code_tester(self) -> ContainerisedCodeTester:
+        """The code tester, created on first use and shared by every attempt."""
+        if self._code_tester is None:
+            self._code_tester = ContainerisedCodeTester(
+                pool_size=max(2, self.best_of_n), backend=self.execution_backend
+            )
+        return self._code_tester
 
     def set_test_class(self, test_class: type):
         """Set the test class to be used for TDD."""
@@ -156,6 +205,42 @@ class TDDWorker(BaseWorker):
         prompt = super().create_prompt(PREDEFINED_PROMPT, task_prompt, messages)
         return prompt
 
+    def action(self, prompt: str, worker_name: str) -> str:
+        """
+        Generate code that passes the tests, one candidate at a time or best-of-N.
+
+        Args:
+            prompt (str): The initial prompt for code generation.
+            worker_name (str): The name of the worker executing this action.
+
+        Returns:
+            str: A string containing the worker name and the generated code.
+
+        Raises:
+            CodeGenerationError: If no code passed the tests.
+        """
+        if self.best_of_n > 1:
+            return self._best_of_n_action(prompt, worker_name)
+        return self._single_action(prompt, worker_name)
+
+    async def aaction(self, prompt: str, worker_name: str) -> str:
+        """
+        Asynchronously generate code that passes the tests, one candidate at a time or best-of-N.
+
+        Args:
+            prompt (str): The initial prompt for code generation.
+            worker_name (str): The name of the worker executing this action.
+
+        Returns:
+            str: A string containing the worker name and the generated code.
+
+        Raises:
+            CodeGenerationError: If no code passed the tests.
+        """
+        if self.best_of_n > 1:
+            return await self._abest_of_n_action(prompt, worker_name)
+        return await self._asingle_action(prompt, worker_name)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=60),
@@ -163,7 +248,7 @@ class TDDWorker(BaseWorker):
         before_sleep=lambda retry_state: logger.info(f"Retrying action (attempt {retry_state.attempt_number})"),
         reraise=True
     )
-    def action(self, prompt: str, worker_name: str) -> str:
+    def _single_action(self, prompt: str, worker_name: str) -> str:
         """
         Execute the action of generating and testing code based on the given prompt.
 
@@ -198,8 +283,7 @@ class TDDWorker(BaseWorker):
                 logger.info("Code to test:")
                 logger.info(code)
 
-            executor = ContainerisedCodeTester()
-            result = executor.execute_code(code, self.test_class)
+            result = self.code_tester.execute_code(code, self.test_class)
 
             if result.get("all_passed"):
                 logger.info("All tests passed successfully.")
@@ -216,8 +300,322 @@ class TDDWorker(BaseWorker):
             logger.error(f"Error during attempt: {str(e)}")
             raise CodeGenerationError(str(e))
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=60),
+        retry=retry_if_exception_type(CodeGenerationError),
+        before_sleep=lambda retry_state: logger.info(f"Retrying action (attempt {retry_state.attempt_number})"),
+        reraise=True
+    )
+    async def _asingle_action(self, prompt: str, worker_name: str) -> str:
+        """
+        Asynchronously generate and test code based on the given prompt.
+
+        The model call is awaited and the containerised test run happens in a worker thread,
+        with the same retry behaviour as _single_action.
+
+        Args:
+            prompt (str): The initial prompt for code generation.
+            worker_name (str): The name of the worker executing this action.
+
+        Returns:
+            str: A string containing the worker name and the generated code.
+
+        Raises:
+            RetryError: If all retry attempts fail.
+        """
+        try:
+            agent_response = await self._ainvoke_model(prompt)
+            if not isinstance(agent_response, RexiaAIResponse):
+                raise ValueError(f"Expected RexiaAIResponse, got {type(agent_response)}")
+
+            code = agent_response.answer
+
+            if self.verbose:
+                logger.info("Code to test:")
+                logger.info(code)
+
+            executor = await Utility.run_in_thread(lambda: self.code_tester)
+            result = await Utility.run_in_thread(executor.execute_code, code, self.test_class)
+
+            if result.get("all_passed"):
+                logger.info("All tests passed successfully.")
+                return f"{worker_name}: {agent_response}"
+            else:
+                error_message = self._format_error_message(result)
+                if self.verbose:
+                    logger.info("Attempt failed, retrying...")
+                    logger.error(error_message)
+                raise CodeGenerationError(error_message)
+
+        except Exception as e:
+            logger.error(f"Error during attempt: {str(e)}")
+            raise CodeGenerationError(str(e))
+
+    def _best_of_n_action(self, prompt: str, worker_name: str) -> str:
+        """
+        Generate best_of_n candidates at once and test the distinct ones in parallel.
+
+        The first candidate to pass every test is returned and the tests still queued are
+        cancelled. If none passes, the candidate that passed the most tests and its errors are
+        added to the prompt for the next round.
+
+        Args:
+            prompt (str): The initial prompt for code generation.
+            worker_name (str): The name of the worker executing this action.
+
+        Returns:
+            str: A string containing the worker name and the generated code.
+
+        Raises:
+            CodeGenerationError: If no candidate passed within repair_rounds further rounds.
+        """
+        round_prompt = prompt
+        error_message = "No candidate code was generated."
+        for round_number in range(1 + self.repair_rounds):
+            responses = self._unique_candidates(self._generate_candidates(round_prompt))
+            winner, best = self._test_candidates(responses)
+            if winner is not None:
+                logger.info(f"All tests passed successfully in round {round_number + 1}.")
+                return f"{worker_name}: {winner.response}"
+            if best is not None:
+                error_message = self._format_error_message(best.result)
+                round_prompt = self._update_prompt_with_error(prompt, best.response, error_message)
+            logger.info(f"No candidate passed in round {round_number + 1}.")
+        raise CodeGenerationError(error_message)
+
+    async def _abest_of_n_action(self, prompt: str, worker_name: str) -> str:
+        """
+        Asynchronously generate best_of_n candidates at once and test the distinct ones in parallel.
+
+        See _best_of_n_action.
+
+        Args:
+            prompt (str): The initial prompt for code generation.
+            worker_name (str): The name of the worker executing this action.
+
+        Returns:
+            str: A string containing the worker name and the generated code.
+
+        Raises:
+            CodeGenerationError: If no candidate passed within repair_rounds further rounds.
+        """
+        round_prompt = prompt
+        error_message = "No candidate code was generated."
+        for round_number in range(1 + self.repair_rounds):
+            responses = self._unique_candidates(await self._agenerate_candidates(round_prompt))
+            winner, best = await self._atest_candidates(responses)
+            if winner is not None:
+                logger.info(f"All tests passed successfully in round {round_number + 1}.")
+                return f"{worker_name}: {winner.response}"
+            if best is not None:
+                error_message = self._format_error_message(best.result)
+                round_prompt = self._update_prompt_with_error(prompt, best.response, error_message)
+            logger.info(f"No candidate passed in round {round_number + 1}.")
+        raise CodeGenerationError(error_message)
+
+    def _generate_candidates(self, prompt: str) -> List[RexiaAIResponse]:
+        """
+        Sample best_of_n responses from the model concurrently, each with its own sampling settings.
+
+        Args:
+            prompt: The prompt for code generation.
+
+        Returns:
+            List[RexiaAIResponse]: The responses that were generated. Failed calls are logged
+                and left out.
+        """
+        with ThreadPoolExecutor(max_workers=self.best_of_n) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._invoke_model,
+                    prompt,
+                    model=self._candidate_model(index),
+                )
+                for index in range(self.best_of_n)
+            ]
+        responses = []
+        for future in futures:
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                logger.error(f"Failed to generate a candidate: {str(e)}")
+        return responses
+
+    async def _agenerate_candidates(self, prompt: str) -> List[RexiaAIResponse]:
+        """
+        Asynchronously sample best_of_n responses from the model concurrently, each with its own
+        sampling settings.
+
+        Args:
+            prompt: The prompt for code generation.
+
+        Returns:
+            List[RexiaAIResponse]: The responses that were generated. Failed calls are logged
+                and left out.
+        """
+        results = await asyncio.gather(
+            *(
+                self._ainvoke_model(prompt, model=self._candidate_model(index))
+                for index in range(self.best_of_n)
+            ),
+            return_exceptions=True,
+        )
+        responses = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to generate a candidate: {str(result)}")
+            else:
+                responses.append(result)
+        return responses
+
+    def _candidate_model(self, index: int) -> Any:
+        """
+        Get the model that samples one candidate.
+
+        The candidate bypasses the response cache and is sampled with a seed of its own, at a
+        temperature from CANDIDATE_TEMPERATURES or the model's own if that is higher. Models
+        without with_sampling are used as they are.
+
+        Args:
+            index: The candidate's position in its round.
+
+        Returns:
+            The model to call for the candidate.
+        """
+        with_sampling = getattr(self.model, "with_sampling", None)
+        if with_sampling is None:
+            return self.model
+        temperature = CANDIDATE_TEMPERATURES[min(index, len(CANDIDATE_TEMPERATURES) - 1)]
+        temperature = max(temperature, getattr(self.model, "temperature", None) or 0.0)
+        return with_sampling(temperature, seed=next(self._seeds))
+
+    def _unique_candidates(self, responses: List[RexiaAIResponse]) -> List[RexiaAIResponse]:
+        """
+        Drop candidates whose code is the same as an earlier one's once normalised.
+
+        Args:
+            responses: The generated responses.
+
+        Returns:
+            List[RexiaAIResponse]: The first response for each distinct implementation.
+        """
+        unique = {}
+        for response in responses:
+            unique.setdefault(self._normalise_code(response.answer), response)
+        if self.verbose or len(unique) < len(responses):
+            logger.info(f"Testing {len(unique)} distinct candidates of {len(responses)} generated.")
+        return list(unique.values())
+
+    @staticmethod
+    def _normalise_code(code: Any) -> str:
+        """
+        Normalise code so that candidates differing only in formatting, comments or docstrings compare equal.
+
+        Args:
+            code: The code, as a string or a list of lines.
+
+        Returns:
+            str: A dump of the code's AST without docstrings, or the stripped code if it does not parse.
+        """
+        if isinstance(code, list):
+            code = "\n".join(str(line) for line in code)
+        try:
+            tree = ast.parse(str(code))
+        except SyntaxError:
+            return str(code).strip()
+        for node in ast.walk(tree):
+            body = getattr(node, "body", None)
+            if (
+                isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+                and body
+                and isinstance(body[0], ast.Expr)
+                and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)
+            ):
+                node.body = body[1:] or [ast.Pass()]
+        return ast.dump(tree)
+
+    def _test_candidates(
+        self, responses: List[RexiaAIResponse]
+    ) -> Tuple[Optional[_Candidate], Optional[_Candidate]]:
+        """
+        Test candidates in parallel until one passes every test.
+
+        Tests that have not started when a candidate passes are cancelled; tests already
+        running finish in the background and their results are discarded.
+
+        Args:
+            responses: The candidates.
+
+        Returns:
+            Tuple[Optional[_Candidate], Optional[_Candidate]]: The first candidate to pass, and
+                the candidate that passed the most tests.
+        """
+        if not responses:
+            return None, None
+        tester = self.code_tester
+        executor = ThreadPoolExecutor(max_workers=len(responses))
+        futures = {
+            executor.submit(
+                contextvars.copy_context().run, tester.execute_code, response.answer, self.test_class
+            ): response
+            for response in responses
+        }
+        try:
+            best = None
+            for future in as_completed(futures):
+                candidate = _Candidate(futures[future], future.result())
+                if candidate.result.get("all_passed"):
+                    return candidate, candidate
+                if best is None or len(candidate.result.get("passed", [])) > len(best.result.get("passed", [])):
+                    best = candidate
+            return None, best
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def _atest_candidates(
+        self, responses: List[RexiaAIResponse]
+    ) -> Tuple[Optional[_Candidate], Optional[_Candidate]]:
+        """
+        Asynchronously test candidates in parallel until one passes every test.
+
+        See _test_candidates.
+
+        Args:
+            responses: The candidates.
+
+        Returns:
+            Tuple[Optional[_Candidate], Optional[_Candidate]]: The first candidate to pass, and
+                the candidate that passed the most tests.
+        """
+        if not responses:
+            return None, None
+        tester = await Utility.run_in_thread(lambda: self.code_tester)
+
+        async def test(response: RexiaAIResponse) -> _Candidate:
+            result = await Utility.run_in_thread(tester.execute_code, response.answer, self.test_class)
+            return _Candidate(response, result)
+
+        tasks = [asyncio.ensure_future(test(response)) for response in responses]
+        try:
+            best = None
+            for next_done in asyncio.as_completed(tasks):
+                candidate = await next_done
+                if candidate.result.get("all_passed"):
+                    return candidate, candidate
+                if best is None or len(candidate.result.get("passed", [])) > len(best.result.get("passed", [])):
+                    best = candidate
+            return None, best
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def _update_prompt_with_error(self, prompt: str, agent_response: RexiaAIResponse, error_message: str) -> str:
-        updated_prompt = f"""\nThe Python code within the answer field of this JSON object returned an error.
+        updated_prompt = f"""{prompt}\n\nThe Python code within the answer field of this JSON object returned an error.
         JSON Object: {agent_response}\n\n 
         Error: {error_message}\n\n
         Please return the full previous JSON object with the answer updated to fix this error.
@@ -239,7 +637,10 @@ class TDDWorker(BaseWorker):
         for failure in result.get("failed", []):
             error_message += f"- Failed: {failure['name']}: {failure['error']}\n"
         for error in result.get("errors", []):
-            error_message += f"- Error: {error['type']}: {error['message']}\n"
+            if isinstance(error, dict):
+                error_message += f"- Error: {error['type']}: {error['message']}\n"
+            else:
+                error_message += f"- Error: {error}\n"
         if "error" in result:
             error_message += f"Error: {result['error']}\n"
-        return error_message
\ No newline at end of file
+        return error_message
@@ -1,14 +1,38 @@
 """ToolWorker class for ReXia.AI's tool interaction and management system."""
 
+import asyncio
+import contextvars
+import inspect
 import logging
-from typing import Any, List, Dict
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Dict, NamedTuple, Optional, Tuple
 from ...base import BaseWorker
+from ...common import ToolCache, Utility
 from ...structure import RexiaAIResponse
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
+MAX_TOOL_WORKERS = 8
+DEFAULT_TOOL_TIMEOUT = 60.0
+
+
+class _ToolCall(NamedTuple):
+    """A tool call ready to run, or the error that stops it running."""
+
+    key: str
+    tool_name: str
+    function_name: Optional[str] = None
+    function: Optional[Callable[..., Any]] = None
+    args: Dict[str, Any] = {}
+    timeout: float = DEFAULT_TOOL_TIMEOUT
+    cache: Optional[ToolCache] = None
+    cache_ttl: Optional[float] = None
+    error: Optional[str] = None
+
 
 PREDEFINED_PROMPT = """
 ## Role Overview
@@ -92,26 +116,82 @@ class ToolWorker(BaseWorker):
     Attributes:
         model (Any): The language model used for processing prompts and making decisions about tool usage.
         verbose (bool): Flag for enabling verbose output mode.
+        include_tools (bool): Always True, so prompts list the available tools.
+        max_tool_workers (int): The most tool calls that run at once.
+        tool_timeout (float): Seconds to wait for a tool call, unless the tool sets its own timeout.
 
     Inherits from:
         BaseWorker: Provides core functionality for AI workers in the ReXia.AI system.
     """
 
-    def __init__(self, model: Any, verbose: bool = False):
+    include_tools = True
+
+    def __init__(
+        self,
+        model: Any,
+        verbose: bool = False,
+        max_tool_workers: int = MAX_TOOL_WORKERS,
+        tool_timeout: float = DEFAULT_TOOL_TIMEOUT,
+    ):
         """
         Initialize a ToolWorker instance.
 
         Args:
             model (Any): The language model to be used for processing and decision-making.
             verbose (bool, optional): Enable verbose output for debugging. Defaults to False.
+            max_tool_workers (int, optional): The most tool calls that run at once. Defaults to 8.
+            tool_timeout (float, optional): Seconds to wait for a tool call, unless the tool sets
+                its own timeout. Defaults to 60.
         """
         super().__init__(model, verbose=verbose)
+        self.max_tool_workers = max_tool_workers
+        self.tool_timeout = tool_timeout
 
     def action(self, prompt: str, worker_name: str) -> str:
         """
         Execute the main action for the current task based on the provided prompt.
 
         This method processes the prompt, makes necessary tool calls, and formats the final response.
+        If the model is streaming, the tool calls start as soon as the 'tool_calls' field has been
+        received, while the model is still writing the rest of its response.
+
+        Args:
+            prompt (str): The input prompt containing task details and context.
+            worker_name (str): Identifier for the worker executing this action.
+
+        Returns:
+            str: Formatted response including tool call results and any additional insights.
+        """
+        if not getattr(self.model, "streaming", False):
+            agent_response = self._invoke_model(prompt)
+            return self._format_response(worker_name, agent_response, self._handle_tool_calls(agent_response))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            early_results: Optional[Future] = None
+
+            def on_field(name: str, value: Any) -> None:
+                nonlocal early_results
+                if name == "tool_calls" and isinstance(value, list) and early_results is None:
+                    early_results = executor.submit(
+                        contextvars.copy_context().run,
+                        self._handle_tool_calls,
+                        RexiaAIResponse.from_json({"tool_calls": value}),
+                    )
+
+            agent_response = self._invoke_model(prompt, on_field=on_field)
+            if early_results is not None:
+                results = early_results.result()
+            else:
+                results = self._handle_tool_calls(agent_response)
+        return self._format_response(worker_name, agent_response, results)
+
+    async def aaction(self, prompt: str, worker_name: str) -> str:
+        """
+        Asynchronously execute the main action for the current task based on the provided prompt.
+
+        The model call is awaited. Coroutine tools are awaited on the event loop and other tools
+        run in worker threads, so they do not block it. If the model is streaming, the tool calls
+        start as soon as the 'tool_calls' field has been received.
 
         Args:
             prompt (str): The input prompt containing task details and context.
@@ -120,8 +200,25 @@ class ToolWorker(BaseWorker):
         Returns:
             str: Formatted response including tool call results and any additional insights.
         """
-        agent_response = self._invoke_model(prompt)
-        results = self._handle_tool_calls(agent_response)
+        early_results: Optional[asyncio.Future] = None
+
+        def on_field(name: str, value: Any) -> None:
+            nonlocal early_results
+            if name == "tool_calls" and isinstance(value, list) and early_results is None:
+                early_results = asyncio.ensure_future(
+                    self._ahandle_tool_calls(RexiaAIResponse.from_json({"tool_calls": value}))
+                )
+
+        try:
+            agent_response = await self._ainvoke_model(prompt, on_field=on_field)
+        except BaseException:
+            if early_results is not None:
+                early_results.cancel()
+            raise
+        if early_results is not None:
+            results = await early_results
+        else:
+            results = await self._ahandle_tool_calls(agent_response)
         return self._format_response(worker_name, agent_response, results)
 
     def create_prompt(self, task: str, messages: List[str]) -> str:
@@ -139,32 +236,119 @@ class ToolWorker(BaseWorker):
             str: A formatted prompt string for the model to guide tool selection and usage.
         """
         prompt = super().create_prompt(PREDEFINED_PROMPT, task, messages)
-        prompt += f"\n\nAvailable Tools (Use only these, tools not here will fail):\n{self._get_available_tools()}\n\n"
         return prompt
 
     def _handle_tool_calls(self, rexia_ai_response: RexiaAIResponse) -> Dict[str, Any]:
         """
         Process and execute tool calls specified in the model's response.
 
-        This method iterates through tool calls, validates tool availability, executes
-        tool functions, and handles any errors or exceptions during the process.
+        The tool calls run concurrently on up to `max_tool_workers` threads. Coroutine tools are
+        run to completion in their thread. If the model has a tool cache, results of tools with a
+        `cache_ttl` are served from it, and identical calls share one fetch. A call that takes
+        longer than its timeout, counted from when the call starts, is reported as an error, its
+        result is discarded and its place goes to the next call.
+
+        Args:
+            rexia_ai_response (RexiaAIResponse): The response object containing tool calls to be processed.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping tool names to their execution results or error messages,
+                in call order. Repeated calls to a tool are keyed "name #2", "name #3" and so on.
+        """
+        calls = self._prepare_tool_calls(rexia_ai_response)
+        runnable = [call for call in calls if call.error is None]
+        if not runnable:
+            return {call.key: call.error for call in calls}
+
+        results: Dict[str, Any] = {call.key: call.error for call in calls if call.error is not None}
+        queued = deque(runnable)
+        running: Dict[Future, Tuple[_ToolCall, float]] = {}
+        # One thread per call, so a call that timed out and is still running does not hold up
+        # the calls after it; at most `max_tool_workers` of them are started at a time.
+        executor = ThreadPoolExecutor(max_workers=len(runnable))
+        try:
+            while queued or running:
+                while queued and len(running) < self.max_tool_workers:
+                    call = queued.popleft()
+                    future = executor.submit(contextvars.copy_context().run, self._run_tool_call, call)
+                    running[future] = (call, time.monotonic() + call.timeout)
+                next_deadline = min(deadline for _, deadline in running.values())
+                done, _ = wait(
+                    running, timeout=max(0.0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED
+                )
+                now = time.monotonic()
+                for future, (call, deadline) in list(running.items()):
+                    if future in done:
+                        results[call.key] = future.result()
+                    elif deadline <= now:
+                        future.cancel()
+                        results[call.key] = self._timeout_message(call)
+                    else:
+                        continue
+                    del running[future]
+        finally:
+            # Calls that timed out may still be running; do not wait for them.
+            executor.shutdown(wait=False)
+        return {call.key: results[call.key] for call in calls}
+
+    async def _ahandle_tool_calls(self, rexia_ai_response: RexiaAIResponse) -> Dict[str, Any]:
+        """
+        Asynchronously process and execute tool calls specified in the model's response.
+
+        Coroutine tools are awaited on the event loop and other tools run in worker threads.
+        Results are cached as in _handle_tool_calls. Up to `max_tool_workers` calls run at once,
+        and a call that takes longer than its timeout is cancelled and reported as an error.
+
+        Args:
+            rexia_ai_response (RexiaAIResponse): The response object containing tool calls to be processed.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping tool names to their execution results or error messages,
+                in call order. Repeated calls to a tool are keyed "name #2", "name #3" and so on.
+        """
+        calls = self._prepare_tool_calls(rexia_ai_response)
+        semaphore = asyncio.Semaphore(self.max_tool_workers)
+
+        async def run(call: _ToolCall) -> Any:
+            if call.error is not None:
+                return call.error
+            async with semaphore:
+                if inspect.iscoroutinefunction(call.function):
+                    pending = self._arun_tool_call(call)
+                else:
+                    pending = Utility.run_in_thread(self._run_tool_call, call)
+                try:
+                    return await asyncio.wait_for(pending, call.timeout)
+                except asyncio.TimeoutError:
+                    return self._timeout_message(call)
+
+        outputs = await asyncio.gather(*(run(call) for call in calls))
+        return {call.key: output for call, output in zip(calls, outputs)}
+
+    def _prepare_tool_calls(self, rexia_ai_response: RexiaAIResponse) -> List[_ToolCall]:
+        """
+        Look up the function and timeout for each tool call, in call order.
 
         Args:
             rexia_ai_response (RexiaAIResponse): The response object containing tool calls to be processed.
 
         Returns:
-            Dict[str, Any]: A dictionary mapping tool names to their execution results or error messages.
+            List[_ToolCall]: The calls, each with its result key and either its function or an error message.
         """
-        results = {}
         logger.info(f"Processing {len(rexia_ai_response.tool_calls)} tool calls")
+        calls = []
+        counts: Dict[str, int] = {}
         for tool_call in rexia_ai_response.tool_calls:
             tool_name = tool_call.get("name")
             tool_args = tool_call.get("parameters", {})
             logger.debug(f"Processing tool call: {tool_name}")
 
+            counts[tool_name] = counts.get(tool_name, 0) + 1
+            key = tool_name if counts[tool_name] == 1 else f"{tool_name} #{counts[tool_name]}"
+
             if tool_name not in self.model.tools:
                 logger.warning(f"Tool not found: {tool_name}")
-                results[tool_name] = f"Error: Tool {tool_name} not found."
+                calls.append(_ToolCall(key, tool_name, error=f"Error: Tool {tool_name} not found."))
                 continue
 
             tool = self.model.tools[tool_name]
@@ -173,23 +357,111 @@ class ToolWorker(BaseWorker):
 
             if not function_to_call:
                 logger.error(f"Function {function_name} not found in tool {tool_name}")
-                results[tool_name] = (
-                    f"Error: Function {function_name} not found in tool {tool_name}"
+                calls.append(
+                    _ToolCall(
+                        key,
+                        tool_name,
+                        function_name,
+                        error=f"Error: Function {function_name} not found in tool {tool_name}",
+                    )
                 )
                 continue
 
-            try:
-                results[tool_name] = function_to_call(**tool_args)
-                logger.info(f"Successfully executed {function_name}")
-            except Exception as e:
-                logger.exception(
-                    f"Error executing {function_name} in {tool_name}: {str(e)}"
-                )
-                results[tool_name] = (
-                    f"Error executing {function_name} in {tool_name}: {str(e)}"
+            timeout = getattr(tool, "timeout", None) or self.tool_timeout
+            calls.append(
+                _ToolCall(
+                    key,
+                    tool_name,
+                    function_name,
+                    function_to_call,
+                    tool_args,
+                    timeout,
+                    cache=getattr(self.model, "tool_cache", None),
+                    cache_ttl=getattr(tool, "cache_ttl", None),
                 )
+            )
+        return calls
+
+    @staticmethod
+    def _run_tool_call(call: _ToolCall) -> Any:
+        """
+        Execute a tool call, returning an error message if it raises.
+
+        Coroutine functions are run to completion on a new event loop.
+
+        Args:
+            call (_ToolCall): The tool call.
+
+        Returns:
+            Any: The function's result, or an error message.
+        """
+
+        def invoke(**tool_args: Any) -> Any:
+            if inspect.iscoroutinefunction(call.function):
+                return asyncio.run(call.function(**tool_args))
+            return call.function(**tool_args)
+
+        try:
+            if call.cache is not None:
+                result = call.cache.call(call.tool_name, call.args, call.cache_ttl, invoke)
+            else:
+                result = invoke(**call.args)
+            logger.info(f"Successfully executed {call.function_name}")
+            return result
+        except Exception as e:
+            return ToolWorker._error_message(call, e)
+
+    @staticmethod
+    async def _arun_tool_call(call: _ToolCall) -> Any:
+        """
+        Await a coroutine tool call, returning an error message if it raises.
+
+        Args:
+            call (_ToolCall): The tool call.
 
-        return results
+        Returns:
+            Any: The function's result, or an error message.
+        """
+        try:
+            if call.cache is not None:
+                result = await call.cache.acall(call.tool_name, call.args, call.cache_ttl, call.function)
+            else:
+                result = await call.function(**call.args)
+            logger.info(f"Successfully executed {call.function_name}")
+            return result
+        except Exception as e:
+            return ToolWorker._error_message(call, e)
+
+    @staticmethod
+    def _error_message(call: _ToolCall, error: Exception) -> str:
+        """
+        Log a failed tool call and describe it for the model.
+
+        Args:
+            call (_ToolCall): The tool call.
+            error (Exception): The error the function raised.
+
+        Returns:
+            str: The error message.
+        """
+        message = f"Error executing {call.function_name} in {call.tool_name}: {str(error)}"
+        logger.exception(message)
+        return message
+
+    @staticmethod
+    def _timeout_message(call: _ToolCall) -> str:
+        """
+        Log a tool call that timed out and describe it for the model.
+
+        Args:
+            call (_ToolCall): The tool call.
+
+        Returns:
+            str: The error message.
+        """
+        message = f"Error: {call.function_name} in {call.tool_name} timed out after {call.timeout} seconds."
+        logger.warning(message)
+        return message
 
     def _format_response(
         self, worker_name: str, agent_response: str, results: Dict
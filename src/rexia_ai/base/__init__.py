@@ -3,5 +3,7 @@
 from .base_worker import BaseWorker
 from .base_workflow import BaseWorkflow
 from .base_tool import BaseTool
+from .base_cache import BaseCache
+from .base_execution_backend import BaseExecutionBackend
 
-__all__ = ["BaseWorker", "BaseWorkflow", "BaseTool"]
+__all__ = ["BaseWorker", "BaseWorkflow", "BaseTool", "BaseCache", "BaseExecutionBackend"]
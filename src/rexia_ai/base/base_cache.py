@@ -0,0 +1,124 @@
+"""BaseCache class for ReXia.AI."""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class BaseCache(ABC):
+    """
+    BaseCache for ReXia.AI. Defines a standard interface for key-value caches.
+
+    Subclasses implement the storage (_get, _set, _clear, size). This class keeps
+    the hit and miss counters so that every backend reports the same statistics.
+
+    Attributes:
+        ttl: The default time to live for entries in seconds. None means entries never expire.
+    """
+
+    ttl: Optional[float]
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Initialize a BaseCache instance.
+
+        Args:
+            ttl: The default time to live for entries in seconds. Defaults to None (no expiry).
+        """
+        self.ttl = ttl
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The cached value, or None if the key is missing or has expired.
+        """
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to store. None values are not cached.
+            ttl: Time to live in seconds for this entry. Defaults to the cache's ttl.
+        """
+        if value is None:
+            return
+        evicted = self._set(key, value, self.ttl if ttl is None else ttl)
+        with self._stats_lock:
+            self._sets += 1
+            self._evictions += evicted
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics.
+
+        Returns:
+            A dictionary with hits, misses, sets, evictions, hit_ratio and size.
+        """
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "sets": self._sets,
+                "evictions": self._evictions,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "size": self.size(),
+            }
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Any]:
+        """
+        Look up a key in the backend.
+
+        Returns:
+            The stored value, or None if it is missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, value: Any, ttl: Optional[float]) -> int:
+        """
+        Store a value in the backend.
+
+        Returns:
+            The number of entries evicted to make room for it.
+        """
+        pass
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Remove every entry from the backend."""
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        """
+        Get the number of entries in the backend.
+
+        Returns:
+            The number of entries currently stored.
+        """
+        pass
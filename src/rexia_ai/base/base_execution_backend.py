@@ -0,0 +1,45 @@
+"""BaseExecutionBackend class for ReXia.AI."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+
+class BaseExecutionBackend(ABC):
+    """
+    BaseExecutionBackend for ReXia.AI. Defines a standard interface for running untrusted code.
+
+    A backend runs a job: it places the job's files in an empty working directory, runs a
+    command there and returns its exit status and output. A command starting with `python`
+    runs the backend's own interpreter. ContainerisedCodeTester and ContainerisedToolRunner
+    parse the output the same way whichever backend ran it.
+    """
+
+    @abstractmethod
+    def run(self, files: Dict[str, str], command: List[str], timeout: float) -> Tuple[int, str, str]:
+        """
+        Run a job.
+
+        Args:
+            files: The files the job needs, by path relative to the working directory.
+            command: The command to run in the working directory.
+            timeout: Seconds the command may run before it is killed.
+
+        Returns:
+            Tuple[int, str, str]: The exit status code, stdout and stderr. A job that timed out
+                has status 124 or 137.
+        """
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the backend's usage statistics.
+
+        Returns:
+            A dictionary with at least the number of jobs run, failures and timeouts.
+        """
+        pass
+
+    def close(self) -> None:
+        """Release the backend's resources. Backends that hold none need not override this."""
+        pass
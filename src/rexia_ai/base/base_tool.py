@@ -1,6 +1,6 @@
 """Rexia.AI BaseTool - Tools that work with ReXia.AI"""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from abc import ABC, abstractmethod
 
 
@@ -12,11 +12,16 @@ class BaseTool(ABC):
         name: The name of the tool.
         func: The function that the tool performs.
         description: A description of the tool.
+        timeout: Seconds a call to the tool may take, or None to use the worker's default.
+        cache_ttl: Seconds the tool's results can be reused by a ToolCache, or None if they must
+            never be cached.
     """
 
     name: str
     func: Any
     description: str
+    timeout: Optional[float] = None
+    cache_ttl: Optional[float] = None
 
     def __init__(self, name: str, func: Any, description: str):
         """
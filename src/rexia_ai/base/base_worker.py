@@ -2,29 +2,71 @@
 
 import json5
 import textwrap
+import functools
 import logging
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from abc import ABC
 from ..structure import LLMOutput
 from ..structure import RexiaAIResponse
-from ..common import Utility
+from ..structure import StreamingResponseParser
+from ..common.utility import Utility
+from ..common.prompt_template import PromptTemplate
+from ..common.run_context import RunContext
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
+
+# Templates kept per worker before the oldest are discarded.
+MAX_PROMPT_TEMPLATES = 32
+
+
+@functools.lru_cache(maxsize=None)
+def _render_structured_output_prompt() -> str:
+    """Render the structured output prompt once per process."""
+    output_structure = json5.dumps(LLMOutput.get_output_structure(), indent=2)
+
+    return textwrap.dedent(
+        f"""\
+        Structure your response using the following JSON format. It is critical that you
+        include no information outside this structure and adhere strictly to the format:
+
+        {output_structure}
+
+        Important guidelines:
+        1. Ensure all keys are exactly as shown above.
+        2. The 'question' field should contain the original question asked.
+        3. The 'plan' field is an array of strings, each representing a step in your plan.
+        4. The 'answer' field should be an array of strings, where each string represents a single line.
+        - Preserve indentation by including the appropriate number of spaces at the beginning of each line.
+        - Include empty lines as empty strings in the array.
+        5. The 'confidence_score' must be a float between 0.0 and 100.0.
+        6. The 'chain_of_reasoning' is an array of strings, each representing a step in your reasoning process.
+        7. The 'tool_calls' field is an array of objects. Each object must have a 'name' (string) and 'parameters' (object) field.
+        8. Do not include any explanations, notes, or text outside of this JSON structure.
+        9. Ensure that the JSON is valid and can be parsed without errors.
+        10. Double-check that all required fields are present and correctly formatted.
+        11. The code in the 'answer' field should follow all formatting and style guidelines provided in the original prompt.
+
+        Your entire response should be valid JSON that can be parsed by a JSON parser.
+        """
+    )
+
+
 class BaseWorker(ABC):
     """
     BaseWorker for ReXia.AI. Allows for the creation of workers from a standard interface.
 
     Attributes:
-        model: The model used by the worker.
+        model: The model used by the worker. While a run is bound, the run's model is used instead.
         verbose: A flag used for enabling verbose mode.
         nlp: The spaCy NLP model for text compression.
+        include_tools: Whether the worker's prompts list the model's tools.
     """
 
-    model: Any
     verbose: bool
     nlp: Any
+    include_tools: bool = False
 
     def __init__(self, model: Any, verbose: bool = False):
         """
@@ -36,6 +78,19 @@ class BaseWorker(ABC):
         """
         self.model = model
         self.verbose = verbose
+        self._prompt_templates: Dict[Tuple, PromptTemplate] = {}
+
+    @property
+    def model(self) -> Any:
+        """The model of the current run if one is bound and has a model, otherwise the worker's own model."""
+        context = RunContext.current()
+        if context is not None and context.llm is not None:
+            return context.llm
+        return self._model
+
+    @model.setter
+    def model(self, model: Any) -> None:
+        self._model = model
 
     def action(self, prompt: str, worker_name: str) -> str:
         """
@@ -55,26 +110,108 @@ class BaseWorker(ABC):
 
         return f"{worker_name}: {agent_response}"
 
+    async def aaction(self, prompt: str, worker_name: str) -> str:
+        """
+        Asynchronously perform an action based on the prompt and return the response.
+
+        Args:
+            prompt: The prompt for the action.
+            worker_name: The name of the worker performing the action.
+
+        Returns:
+            The response from the action.
+        """
+        agent_response = await self._ainvoke_model(prompt)
+
+        if self.verbose:
+            logger.debug(f"{worker_name}: {agent_response}")
+
+        return f"{worker_name}: {agent_response}"
+
     def create_prompt(self, prompt: str, task: str, messages: List[str]) -> str:
         """
         Create a prompt for the model with compression.
 
+        The static parts of the prompt come from a cached template, so only the task and
+        collaboration chat are formatted per call. If the model has prefix caching enabled,
+        the task and chat come last so consecutive prompts share as long a prefix as possible.
+
         Args:
             prompt: The base prompt.
             task: The task for which the prompt is created.
             messages: The messages from the collaboration chat.
-            memory: The memory object containing the history of the agent's tasks.
 
         Returns:
             The created prompt as a string.
         """
         additional_context = self._format_additional_context(messages, task)
+        return self.get_prompt_template(prompt).render(additional_context)
+
+    def get_prompt_template(self, prompt: str) -> PromptTemplate:
+        """
+        Get the template for a base prompt, rendering it on first use.
+
+        Templates are cached per base prompt, tool set and layout, so a template is rendered
+        again when the model's tools change.
+
+        Args:
+            prompt: The base prompt.
+
+        Returns:
+            PromptTemplate: The template holding the static parts of the prompt.
+        """
+        key = (prompt, self._get_tools_key(), self._uses_prefix_layout())
+        template = self._prompt_templates.get(key)
+        if template is None:
+            template = self._build_prompt_template(prompt)
+            if len(self._prompt_templates) >= MAX_PROMPT_TEMPLATES:
+                self._prompt_templates.clear()
+            self._prompt_templates[key] = template
+        return template
+
+    def _build_prompt_template(self, prompt: str) -> PromptTemplate:
+        """
+        Render the static parts of a prompt.
+
+        By default the base prompt comes before the task and chat, and the output structure
+        and tools after them. In the prefix caching layout everything static comes first,
+        ordered from most to least widely shared: the output structure, which every worker
+        uses, then the base prompt, then the tools. The task and chat are appended at the end.
+
+        Args:
+            prompt: The base prompt.
+
+        Returns:
+            PromptTemplate: The rendered template.
+        """
         structured_output_prompt = self.get_structured_output_prompt()
+        tools = ""
+        if self.include_tools:
+            tools = f"\n\nAvailable Tools (Use only these, tools not here will fail):\n{self._get_available_tools()}\n\n"
+        if self._uses_prefix_layout():
+            return PromptTemplate(prefix=f"{structured_output_prompt}\n\n{prompt}{tools}")
+        return PromptTemplate(prefix=f"{prompt}\n\n", suffix=f"\n\n{structured_output_prompt}{tools}")
 
-        final_prompt = (
-            f"{prompt}\n\n" f"{additional_context}\n\n" f"{structured_output_prompt}"
-        )
-        return final_prompt
+    def _uses_prefix_layout(self) -> bool:
+        """
+        Check whether prompts should be laid out for server-side prefix caching.
+
+        Returns:
+            True if the model has prefix caching enabled.
+        """
+        return bool(getattr(self.model, "prefix_caching", False))
+
+    def _get_tools_key(self) -> Optional[Tuple]:
+        """
+        Identify the model's current tool set, if this worker's prompts list tools.
+
+        Returns:
+            A tuple of tool names and tool objects, or None if tools are not listed.
+        """
+        if not self.include_tools:
+            return None
+        tools = getattr(self.model, "tools", None) or {}
+        return tuple(tools.items())
 
     def _format_additional_context(
         self, messages: List[str], task: str
@@ -82,6 +219,8 @@ class BaseWorker(ABC):
         """
         Format the task, messages and memory for the prompt.
 
+        If the model has a context window, the messages are first fitted into its token budget.
+
         Args:
             task: The task for which the prompt is created.
             messages: The messages from the collaboration chat.
@@ -89,6 +228,9 @@ class BaseWorker(ABC):
         Returns:
             The formatted task and messages as a string.
         """
+        context_window = getattr(self.model, "context_window", None)
+        if context_window is not None:
+            messages = context_window.build(task, messages)
         formatted = (
             "\n\nTask:\n\n"
             + task
@@ -97,20 +239,63 @@ class BaseWorker(ABC):
         )
         return formatted
 
-    def _invoke_model(self, prompt: str) -> RexiaAIResponse:
+    def _invoke_model(
+        self, prompt: str, on_field: Optional[Callable[[str, Any], None]] = None, model: Any = None
+    ) -> RexiaAIResponse:
         """
         Invoke the model with the given prompt and return the response.
 
         Args:
             prompt: The prompt for the model.
+            on_field: Called with the name and value of each response field as soon as it
+                closes, if the model is streaming. Defaults to None.
+            model: The model to call instead of the worker's own. Defaults to None.
+
+        Returns:
+            The response from the model.
+        """
+        model = model if model is not None else self.model
+        try:
+            response = self._get_model_response(prompt, on_field, model)
+            parsed_response = self._parse_response(response)
+            rexia_ai_response = RexiaAIResponse.from_json(parsed_response)
+            return rexia_ai_response
+        except Exception as e:
+            logger.error(f"Failed to get a valid response from the model. Error: {str(e)}")
+            logger.debug(f"Model Response: {response}")
+            logger.info("Attempting to fix the response...")
+            try:
+                fix_errors_prompt = Utility.fix_json_errors_prompt(
+                    json_string=response, error=e
+                )
+                fixed_response = model.invoke(fix_errors_prompt, **self._structured_output_kwargs())
+                logger.info("Successfully fixed the response")
+            except:
+                logger.error("Failed to get a valid response from the model.")
+                raise RuntimeError("Unable to get a valid response from the model.")
+            rexia_ai_response = RexiaAIResponse.from_json(self._parse_response(fixed_response))
+            return rexia_ai_response
+
+    async def _ainvoke_model(
+        self, prompt: str, on_field: Optional[Callable[[str, Any], None]] = None, model: Any = None
+    ) -> RexiaAIResponse:
+        """
+        Asynchronously invoke the model with the given prompt and return the response.
+
+        Args:
+            prompt: The prompt for the model.
+            on_field: Called with the name and value of each response field as soon as it
+                closes, if the model is streaming. Defaults to None.
+            model: The model to call instead of the worker's own. Defaults to None.
 
         Returns:
             The response from the model.
         """
+        model = model if model is not None else self.model
         try:
-            response = self.model.invoke(prompt)
-            cleaned_response = self._clean_response(response)
-            rexia_ai_response = RexiaAIResponse.from_json(cleaned_response)
+            response = await self._aget_model_response(prompt, on_field, model)
+            parsed_response = self._parse_response(response)
+            rexia_ai_response = RexiaAIResponse.from_json(parsed_response)
             return rexia_ai_response
         except Exception as e:
             logger.error(f"Failed to get a valid response from the model. Error: {str(e)}")
@@ -118,29 +303,110 @@ class BaseWorker(ABC):
             logger.info("Attempting to fix the response...")
             try:
                 fix_errors_prompt = Utility.fix_json_errors_prompt(
-                    self, json_string=response, error=e
+                    json_string=response, error=e
+                )
+                fixed_response = await model.ainvoke(
+                    fix_errors_prompt, **self._structured_output_kwargs()
                 )
-                fixed_response = self.model.invoke(fix_errors_prompt)
                 logger.info("Successfully fixed the response")
             except:
                 logger.error("Failed to get a valid response from the model.")
                 raise RuntimeError("Unable to get a valid response from the model.")
-            rexia_ai_response = RexiaAIResponse.from_json(fixed_response)
+            rexia_ai_response = RexiaAIResponse.from_json(self._parse_response(fixed_response))
             return rexia_ai_response
 
-    def _clean_response(self, response: str) -> str:
+    def _get_model_response(
+        self, prompt: str, on_field: Optional[Callable[[str, Any], None]] = None, model: Any = None
+    ) -> str:
+        """
+        Get the raw response text from the model, streaming it if the model has streaming enabled.
+
+        Args:
+            prompt: The prompt for the model.
+            on_field: Called with the name and value of each response field as soon as it closes.
+            model: The model to call instead of the worker's own. Defaults to None.
+
+        Returns:
+            The full response text.
+        """
+        model = model if model is not None else self.model
+        kwargs = self._structured_output_kwargs()
+        if not getattr(model, "streaming", False):
+            return model.invoke(prompt, **kwargs)
+
+        parser = StreamingResponseParser()
+        for chunk in model.stream_text(prompt, **kwargs):
+            for name, value in parser.feed(chunk):
+                self._on_streamed_field(name, value, on_field)
+        return parser.text
+
+    async def _aget_model_response(
+        self, prompt: str, on_field: Optional[Callable[[str, Any], None]] = None, model: Any = None
+    ) -> str:
+        """
+        Asynchronously get the raw response text from the model, streaming it if the model has streaming enabled.
+
+        Args:
+            prompt: The prompt for the model.
+            on_field: Called with the name and value of each response field as soon as it closes.
+            model: The model to call instead of the worker's own. Defaults to None.
+
+        Returns:
+            The full response text.
+        """
+        model = model if model is not None else self.model
+        kwargs = self._structured_output_kwargs()
+        if not getattr(model, "streaming", False):
+            return await model.ainvoke(prompt, **kwargs)
+
+        parser = StreamingResponseParser()
+        async for chunk in model.astream_text(prompt, **kwargs):
+            for name, value in parser.feed(chunk):
+                self._on_streamed_field(name, value, on_field)
+        return parser.text
+
+    def _structured_output_kwargs(self) -> Dict[str, Any]:
         """
-        Clean the response from the model.
+        Get the arguments that ask the model to constrain its response to the output schema.
+
+        Returns:
+            The response schema argument if the model has structured output enabled, otherwise nothing.
+        """
+        if getattr(self.model, "structured_output", None):
+            return {"response_schema": LLMOutput.get_json_schema()}
+        return {}
+
+    def _on_streamed_field(
+        self, name: str, value: Any, on_field: Optional[Callable[[str, Any], None]]
+    ) -> None:
+        """
+        Handle a response field that has finished streaming.
+
+        Args:
+            name: The name of the field.
+            value: The parsed value of the field.
+            on_field: The caller's callback, if any.
+        """
+        if self.verbose:
+            logger.debug(f"Streamed field {name}: {value}")
+        if on_field is not None:
+            on_field(name, value)
+
+    def _parse_response(self, response: str) -> Any:
+        """
+        Extract and parse the JSON in the response from the model.
 
         Args:
             response: The response from the model.
 
         Returns:
-            The cleaned response.
+            The parsed response.
+
+        Raises:
+            ValueError: If the response cannot be parsed or repaired.
         """
         cleaned_response = Utility.extract_json_string(response)
-        cleaned_response = Utility.fix_json_errors(cleaned_response)
-        return cleaned_response
+        return Utility.parse_json(cleaned_response)
 
     def get_structured_output_prompt(self) -> str:
         """
@@ -149,33 +415,7 @@ class BaseWorker(ABC):
         Returns:
             The structured output prompt.
         """
-        output_structure = json5.dumps(LLMOutput.get_output_structure(), indent=2)
-
-        return textwrap.dedent(
-            f"""\
-            Structure your response using the following JSON format. It is critical that you
-            include no information outside this structure and adhere strictly to the format:
-
-            {output_structure}
-
-            Important guidelines:
-            1. Ensure all keys are exactly as shown above.
-            2. The 'question' field should contain the original question asked.
-            3. The 'plan' field is an array of strings, each representing a step in your plan.
-            4. The 'answer' field should be an array of strings, where each string represents a single line.
-            - Preserve indentation by including the appropriate number of spaces at the beginning of each line.
-            - Include empty lines as empty strings in the array.
-            5. The 'confidence_score' must be a float between 0.0 and 100.0.
-            6. The 'chain_of_reasoning' is an array of strings, each representing a step in your reasoning process.
-            7. The 'tool_calls' field is an array of objects. Each object must have a 'name' (string) and 'parameters' (object) field.
-            8. Do not include any explanations, notes, or text outside of this JSON structure.
-            9. Ensure that the JSON is valid and can be parsed without errors.
-            10. Double-check that all required fields are present and correctly formatted.
-            11. The code in the 'answer' field should follow all formatting and style guidelines provided in the original prompt.
-
-            Your entire response should be valid JSON that can be parsed by a JSON parser.
-            """
-        )
+        return _render_structured_output_prompt()
 
     def _get_available_tools(self) -> str:
         """
@@ -1,8 +1,10 @@
 """Base Workflow module for ReXia.AI's task execution and management system."""
 
-from typing import Any
+from typing import Any, Optional
 from abc import ABC, abstractmethod
-from ..common import CollaborationChannel
+from ..common.collaboration_channel import CollaborationChannel
+from ..common.utility import Utility
+from ..common.run_context import RunContext
 
 class BaseWorkflow(ABC):
     """
@@ -17,9 +19,11 @@ class BaseWorkflow(ABC):
         task (str): The specific task or objective that the workflow is designed to accomplish.
         verbose (bool): Flag for enabling detailed logging and output for debugging purposes.
         channel (CollaborationChannel): Communication channel for task-related interactions and data sharing.
+            Used by runs that are not given a RunContext.
 
     The BaseWorkflow class is designed to be subclassed, with concrete implementations
-    providing specific logic for the `run` method.
+    providing specific logic for the `run` method. A run given its own RunContext keeps its
+    task, channel, model and status there, so one workflow can serve concurrent runs.
     """
 
     llm: Any
@@ -58,15 +62,49 @@ class BaseWorkflow(ABC):
         """
         self.channel.clear_messages()
 
+    def create_context(self, task: Optional[str] = None, llm: Any = None) -> RunContext:
+        """
+        Create the context for a new run of this workflow, with a channel of its own.
+
+        Args:
+            task: The task for the run. Defaults to the workflow's task.
+            llm: The language model for the run. Defaults to the workflow's language model.
+
+        Returns:
+            RunContext: The new run context.
+        """
+        return RunContext(task=task or self.task, llm=llm or self.llm)
+
+    def _resolve_context(self, context: Optional[RunContext]) -> RunContext:
+        """
+        Get the context a run works on.
+
+        Args:
+            context: The context passed to the run, if any.
+
+        Returns:
+            RunContext: The given context, using the workflow's model if it has none, or a context
+                on the workflow's own task, model and channel.
+        """
+        if context is None:
+            return RunContext(task=self.task, llm=self.llm, channel=self.channel)
+        if context.llm is None:
+            context.llm = self.llm
+        return context
+
     @abstractmethod
-    def run(self) -> str:
+    def run(self, context: Optional[RunContext] = None) -> str:
         """
         Execute the workflow to complete the specified task.
 
         This abstract method must be implemented by all subclasses to define
         the specific steps and logic of the workflow. The implementation should
         utilize the language model, task information, and collaboration channel
-        to process the task and produce a result.
+        of the run context to process the task and produce a result.
+
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
 
         Returns:
             str: The result or output of the workflow execution.
@@ -74,4 +112,23 @@ class BaseWorkflow(ABC):
         Raises:
             NotImplementedError: If the method is not implemented by a subclass.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def arun(self, context: Optional[RunContext] = None) -> Any:
+        """
+        Asynchronously execute the workflow to complete the specified task.
+
+        The built-in workflows override this with a native asynchronous implementation.
+        The default runs the synchronous `run` method in a worker thread, so custom
+        workflows that only implement `run` can still be awaited.
+
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
+        Returns:
+            Any: The result or output of the workflow execution.
+        """
+        if context is None:
+            return await Utility.run_in_thread(self.run)
+        return await Utility.run_in_thread(self.run, context)
@@ -2,14 +2,35 @@
 
 from .task_status import TaskStatus
 from .collaboration_channel import CollaborationChannel
+from .container_pool import ContainerPool
+from .sandbox_manager import SandboxManager
+from .subprocess_backend import SubprocessBackend
 from .containerised_code_tester import ContainerisedCodeTester
 from .containerised_tool_runner import ContainerisedToolRunner
 from .utility import Utility
+from .cache import InMemoryCache, SQLiteCache
+from .tool_cache import ToolCache
+from .context_window import ContextWindow
+from .json_parser import TieredJSONParser
+from .prompt_template import PromptTemplate
+from .prefix_tracker import PrefixTracker
+from .run_context import RunContext
 
 __all__ = [
     "TaskStatus",
     "CollaborationChannel",
+    "ContainerPool",
+    "SandboxManager",
+    "SubprocessBackend",
     "ContainerisedCodeTester",
     "ContainerisedToolRunner",
-    "Utility"
+    "Utility",
+    "InMemoryCache",
+    "SQLiteCache",
+    "ToolCache",
+    "ContextWindow",
+    "TieredJSONParser",
+    "PromptTemplate",
+    "PrefixTracker",
+    "RunContext"
 ]
@@ -0,0 +1,188 @@
+"""Cache backends for ReXia.AI."""
+
+import json
+import time
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from ..base.base_cache import BaseCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+class InMemoryCache(BaseCache):
+    """
+    A thread-safe, in-process LRU cache with optional expiry.
+
+    Attributes:
+        max_entries: The maximum number of entries kept before the least recently used are evicted.
+        ttl: The default time to live for entries in seconds.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize an InMemoryCache instance.
+
+        Args:
+            max_entries: The maximum number of entries to keep. Defaults to 1024.
+            ttl: The default time to live for entries in seconds. Defaults to None (no expiry).
+        """
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: Any, ttl: Optional[float]) -> int:
+        expires_at = time.time() + ttl if ttl is not None else None
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteCache(BaseCache):
+    """
+    An on-disk LRU cache backed by SQLite, safe to share between threads and processes.
+
+    Values are stored as JSON, so only JSON-serialisable values are cached.
+
+    Attributes:
+        path: The path to the SQLite database file.
+        max_entries: The maximum number of entries kept before the least recently used are evicted.
+        ttl: The default time to live for entries in seconds.
+    """
+
+    def __init__(
+        self,
+        path: str = "rexia_ai_cache.sqlite",
+        max_entries: int = 100000,
+        ttl: Optional[float] = None,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize a SQLiteCache instance.
+
+        Args:
+            path: The path to the SQLite database file. Defaults to "rexia_ai_cache.sqlite".
+            max_entries: The maximum number of entries to keep. Defaults to 100000.
+            ttl: The default time to live for entries in seconds. Defaults to None (no expiry).
+            timeout: Seconds to wait for a lock held by another process. Defaults to 30.
+        """
+        super().__init__(ttl=ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                    "expires_at REAL, accessed_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)")
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the cache database.
+
+        A connection per operation keeps the cache usable from any thread.
+
+        Returns:
+            sqlite3.Connection: An open connection.
+        """
+        return sqlite3.connect(self.path, timeout=self.timeout)
+
+    def _get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value, expires_at = row
+                if expires_at is not None and expires_at <= now:
+                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    return None
+                conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return json.loads(value)
+        finally:
+            conn.close()
+
+    def _set(self, key: str, value: Any, ttl: Optional[float]) -> int:
+        try:
+            serialised = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Value for cache key {key} is not JSON serialisable, skipping: {e}")
+            return 0
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, serialised, expires_at, now),
+                )
+                (count,) = conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+                excess = count - self.max_entries
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM cache WHERE key IN "
+                        "(SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?)",
+                        (excess,),
+                    )
+                    return excess
+            return 0
+        finally:
+            conn.close()
+
+    def _clear(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache")
+        finally:
+            conn.close()
+
+    def size(self) -> int:
+        conn = self._connect()
+        try:
+            (count,) = conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+            return count
+        finally:
+            conn.close()
@@ -0,0 +1,387 @@
+"""Warm sandbox container pool for ReXia.AI."""
+
+import io
+import time
+import uuid
+import tarfile
+import threading
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Tuple
+from docker.types import Mount
+from ..base.base_execution_backend import BaseExecutionBackend
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+# Exit statuses of `timeout` when the job ran out of time, and of a process killed by SIGKILL.
+TIMEOUT_EXIT_CODES = (124, 137)
+
+# Exit status of an exec killed by SIGKILL, which may have been stopped before its cleanup ran.
+KILLED_EXIT_CODE = 137
+
+# Exit statuses that mean the job ran to completion, with or without errors in the code.
+CLEAN_EXIT_CODES = (0, 1)
+
+# Exit status and stderr of a job that did not run because the container was not clean.
+DIRTY_EXIT_CODE = 125
+DIRTY_MARKER = "rexia_ai: sandbox container is not clean"
+
+# Runs a job in one exec, with the timeout as $0 and the job's directory under /app as $1.
+# Before the command it kills every process but PID 1 and itself, empties /tmp, and refuses
+# to run if /app holds anything but the job's directory or any other process is left, such
+# as a zombie of a daemon an earlier job started. After the command, under `timeout`, it
+# kills every process again and empties /app and /tmp.
+_DIRTY = '{ echo "' + DIRTY_MARKER + '" >&2; exit ' + str(DIRTY_EXIT_CODE) + '; }'
+JOB_SCRIPT = (
+    'kill -9 -1 2>/dev/null; '
+    'find /tmp -mindepth 1 -delete || ' + _DIRTY + '; '
+    '[ "$(ls -A /app)" = "$1" ] || ' + _DIRTY + '; '
+    'for pid in /proc/[0-9]*; do pid=${pid#/proc/}; '
+    'if [ "$pid" != 1 ] && [ "$pid" != $$ ]; then ' + _DIRTY + '; fi; '
+    'done; '
+    'shift; timeout -s KILL "$0" "$@"; status=$?; '
+    'kill -9 -1 2>/dev/null; find /app /tmp -mindepth 1 -delete; exit $status'
+)
+
+
+@dataclass(eq=False)
+class SandboxContainer:
+    """Dataclass to store a pooled container and the number of jobs it has run."""
+
+    container: Any
+    jobs: int = 0
+
+
+@dataclass
+class _PoolStats:
+    """Dataclass to store a pool's counters."""
+
+    jobs: int = 0
+    started: int = 0
+    recycled: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    waits: int = 0
+    dirty: int = 0
+
+
+class ContainerPool(BaseExecutionBackend):
+    """
+    An execution backend with a pool of pre-started sandbox containers that run jobs with exec_run.
+
+    Starting a container takes seconds, while running a command in a running one takes
+    milliseconds. Each container is started once with no network, a memory and CPU limit, a
+    read-only root filesystem and a process limit, and then kept idling. A job streams its
+    files into a new directory in the container's /app volume as an in-memory tar archive
+    with put_archive, so nothing touches the host filesystem and the daemon may be remote,
+    and runs its command there with exec_run. Around the command the same exec kills every
+    other process in the container and empties /app and /tmp, and a job is not run in a
+    container where a process or another job's files survived that; the container is
+    replaced and the job runs in another. A container is also replaced after `max_jobs`
+    jobs, or as soon as a job times out, is killed, crashes or fails to run, so files and
+    processes left behind by one job do not carry over into later ones.
+
+    Attributes:
+        client: The Docker client.
+        image: The Docker image the containers run.
+        size: The number of containers kept warm.
+        max_jobs: Jobs a container runs before it is replaced.
+        mem_limit: The memory limit of each container.
+        cpu_quota: The CPU quota of each container, in microseconds per 100ms.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        image: str = "python:3.12-slim",
+        size: int = 2,
+        max_jobs: int = 50,
+        mem_limit: str = "128m",
+        cpu_quota: int = 50000,
+    ):
+        """
+        Initialize a ContainerPool instance. No containers are started until warm or run is called.
+
+        Args:
+            client: The Docker client.
+            image: The Docker image to run. Defaults to "python:3.12-slim".
+            size: The number of containers to keep warm. Defaults to 2.
+            max_jobs: Jobs a container runs before it is replaced. Defaults to 50.
+            mem_limit: The memory limit of each container. Defaults to "128m".
+            cpu_quota: The CPU quota of each container. Defaults to 50000, half a CPU.
+
+        Raises:
+            ValueError: If size or max_jobs is less than 1.
+        """
+        if size < 1 or max_jobs < 1:
+            raise ValueError("ContainerPool size and max_jobs must be at least 1")
+        self.client = client
+        self.image = image
+        self.size = size
+        self.max_jobs = max_jobs
+        self.mem_limit = mem_limit
+        self.cpu_quota = cpu_quota
+        self._condition = threading.Condition()
+        self._idle: List[SandboxContainer] = []
+        self._count = 0
+        self._closed = False
+        self._stats = _PoolStats()
+
+    def warm(self) -> None:
+        """Start containers until the pool has `size` of them."""
+        while True:
+            with self._condition:
+                if self._closed or self._count >= self.size:
+                    return
+                self._count += 1
+            try:
+                sandbox = self._start()
+            except Exception as e:
+                logger.error(f"Failed to start a warm container: {e}")
+                with self._condition:
+                    self._count -= 1
+                    self._condition.notify()
+                return
+            with self._condition:
+                self._idle.append(sandbox)
+                self._condition.notify()
+
+    def grow(self, size: int) -> bool:
+        """
+        Raise the number of containers the pool keeps to `size`. A pool never shrinks.
+
+        Jobs waiting for a container may start one straight away; call warm to start the rest.
+
+        Args:
+            size: The number of containers to keep.
+
+        Returns:
+            bool: True if the pool grew.
+        """
+        with self._condition:
+            if size <= self.size:
+                return False
+            self.size = size
+            self._condition.notify_all()
+        return True
+
+    def run(
+        self, files: Dict[str, str], command: List[str], timeout: float
+    ) -> Tuple[int, str, str]:
+        """
+        Run a job in a warm container.
+
+        Args:
+            files: The files the job needs, by path relative to the working directory.
+            command: The command to run in the working directory.
+            timeout: Seconds the command may run before it is killed.
+
+        Returns:
+            Tuple[int, str, str]: The exit status code, stdout and stderr. A job that timed out
+                has status 124 or 137.
+
+        Raises:
+            RuntimeError: If no clean container could be found for the job.
+            Exception: Any error from Docker. The container is replaced.
+        """
+        job = uuid.uuid4().hex
+        archive = self._archive(files, job)
+        # Each attempt that finds its container unclean replaces it, so within size + 1
+        # attempts the job reaches a freshly started container.
+        for _ in range(self.size + 1):
+            with self._acquire() as sandbox:
+                if not sandbox.container.put_archive("/app", archive):
+                    raise RuntimeError("Failed to copy the job files into the container")
+                timed_command = ["sh", "-c", JOB_SCRIPT, str(int(max(1, timeout))), job, *command]
+                result = sandbox.container.exec_run(timed_command, workdir=f"/app/{job}", demux=True)
+                stdout, stderr = result.output if result.output else (None, None)
+                stdout = (stdout or b"").decode("utf-8", "replace")
+                stderr = (stderr or b"").decode("utf-8", "replace")
+                status = result.exit_code
+                sandbox.jobs += 1
+                if status == DIRTY_EXIT_CODE and stderr.strip() == DIRTY_MARKER:
+                    sandbox.jobs = self.max_jobs
+                    with self._condition:
+                        self._stats.dirty += 1
+                    continue
+                # An exec killed with SIGKILL may not have emptied /app and /tmp, so its
+                # container is always replaced, as is any container whose job did not exit cleanly.
+                if status == KILLED_EXIT_CODE or status not in CLEAN_EXIT_CODES:
+                    sandbox.jobs = self.max_jobs
+                    with self._condition:
+                        if status in TIMEOUT_EXIT_CODES:
+                            self._stats.timeouts += 1
+                        else:
+                            self._stats.failures += 1
+                return status, stdout, stderr
+        raise RuntimeError("No clean sandbox container was available")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the pool statistics.
+
+        Returns:
+            A dictionary with the number of jobs run, containers started and recycled, jobs that
+            failed or timed out, jobs that waited for a container, containers found unclean, and
+            idle and busy containers.
+        """
+        with self._condition:
+            return {
+                "image": self.image,
+                "jobs": self._stats.jobs,
+                "started": self._stats.started,
+                "recycled": self._stats.recycled,
+                "failures": self._stats.failures,
+                "timeouts": self._stats.timeouts,
+                "waits": self._stats.waits,
+                "dirty": self._stats.dirty,
+                "idle": len(self._idle),
+                "busy": self._count - len(self._idle),
+            }
+
+    def close(self) -> None:
+        """Remove every idle container. Busy containers are removed when their job finishes."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+            self._condition.notify_all()
+        for sandbox in idle:
+            self._remove(sandbox)
+
+    @contextlib.contextmanager
+    def _acquire(self) -> Iterator[SandboxContainer]:
+        """
+        Take a container for one job, starting one if the pool is not yet full.
+
+        A container that raised during the job, or has run `max_jobs` jobs, is replaced.
+
+        Yields:
+            SandboxContainer: The container to run the job in.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+        """
+        sandbox = None
+        with self._condition:
+            waited = False
+            while not self._idle and self._count >= self.size and not self._closed:
+                waited = True
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError("ContainerPool is closed")
+            self._stats.jobs += 1
+            self._stats.waits += waited
+            if self._idle:
+                sandbox = self._idle.pop()
+            else:
+                self._count += 1
+        try:
+            if sandbox is None:
+                sandbox = self._start()
+        except BaseException:
+            with self._condition:
+                self._count -= 1
+                self._condition.notify()
+            raise
+
+        failed = True
+        try:
+            yield sandbox
+            failed = False
+        finally:
+            self._release(sandbox, failed)
+
+    def _release(self, sandbox: SandboxContainer, failed: bool) -> None:
+        """
+        Return a container to the pool, or replace it if it failed or is worn out.
+
+        Args:
+            sandbox: The container.
+            failed: Whether the job raised.
+        """
+        recycle = failed or sandbox.jobs >= self.max_jobs
+        with self._condition:
+            if failed:
+                self._stats.failures += 1
+            if recycle or self._closed:
+                self._count -= 1
+                self._stats.recycled += recycle
+            else:
+                self._idle.append(sandbox)
+            self._condition.notify()
+        if recycle or self._closed:
+            self._remove(sandbox)
+        if recycle and not self._closed:
+            threading.Thread(target=self.warm, daemon=True).start()
+
+    def _start(self) -> SandboxContainer:
+        """
+        Start an idle sandbox container.
+
+        Returns:
+            SandboxContainer: The started container.
+        """
+        container = self.client.containers.run(
+            self.image,
+            command=["sleep", "infinity"],
+            mounts=[Mount(target="/app", source=None, type="volume")],
+            working_dir="/app",
+            detach=True,
+            mem_limit=self.mem_limit,
+            cpu_quota=self.cpu_quota,
+            network_mode="none",
+            pids_limit=64,
+            read_only=True,
+            tmpfs={"/tmp": "size=64m"},
+        )
+        with self._condition:
+            self._stats.started += 1
+        logger.info(f"Started sandbox container with image: {self.image}")
+        return SandboxContainer(container=container)
+
+    @staticmethod
+    def _remove(sandbox: SandboxContainer) -> None:
+        """
+        Remove a container and its /app volume.
+
+        Args:
+            sandbox: The container.
+        """
+        try:
+            sandbox.container.remove(v=True, force=True)
+            logger.info("Sandbox container removed.")
+        except Exception as e:
+            logger.error(f"Failed to remove container: {str(e)}")
+
+    @staticmethod
+    def _archive(files: Dict[str, str], job: str) -> bytes:
+        """
+        Pack a job's files into an in-memory tar archive, under a directory for the job.
+
+        Args:
+            files: The files, by relative path.
+            job: The name of the job's directory.
+
+        Returns:
+            bytes: The tar archive.
+        """
+        buffer = io.BytesIO()
+        mtime = time.time()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            directory = tarfile.TarInfo(job)
+            directory.type = tarfile.DIRTYPE
+            directory.mode = 0o755
+            directory.mtime = mtime
+            tar.addfile(directory)
+            for name, content in files.items():
+                data = content.encode("utf-8")
+                info = tarfile.TarInfo(f"{job}/{name}")
+                info.size = len(data)
+                info.mode = 0o644
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(data))
+        return buffer.getvalue()
@@ -1,14 +1,13 @@
 """Containerised Code Tester class for ReXia.AI"""
 
-import docker
-import tempfile
 import ast
-import os
 import inspect
 import json
 import textwrap
 import logging
-from typing import Any, List, Dict, Tuple, Union
+from typing import Any, List, Dict, Optional, Tuple, Union
+from .sandbox_manager import SandboxManager
+from ..base.base_execution_backend import BaseExecutionBackend
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -19,29 +18,46 @@ class ContainerisedCodeTester:
     A class for executing Python code in isolated Docker containers.
     This class provides functionality to run Python code and associated tests
     in a controlled Docker environment, ensuring security and consistency.
+    Code runs in a warm ContainerPool shared by every tester using the same image,
+    so each execution costs an exec into a running container rather than a new one.
+    Another execution backend, such as a SubprocessBackend, can be passed instead.
     """
 
-    def __init__(self, image: str = "python:3.12-slim", timeout: int = 30):
+    def __init__(
+        self,
+        image: str = "python:3.12-slim",
+        timeout: int = 30,
+        pool_size: int = 2,
+        max_jobs_per_container: int = 50,
+        manager: Optional[SandboxManager] = None,
+        backend: Optional[BaseExecutionBackend] = None,
+    ):
         """
         Initialize the ContainerisedCodeExecutor.
 
         Args:
             image (str): The Docker image to use. Defaults to "python:3.12-slim".
             timeout (int): The execution timeout in seconds. Defaults to 30.
+            pool_size (int): The number of warm containers for the image. Defaults to 2.
+            max_jobs_per_container (int): Executions a container runs before it is replaced. Defaults to 50.
+            manager (SandboxManager, optional): The manager providing the Docker client and pool.
+                Defaults to the process-wide manager.
+            backend (BaseExecutionBackend, optional): The backend that runs the code, such as a
+                SubprocessBackend on hosts without Docker. Defaults to the manager's pool for the image.
 
         Raises:
-            RuntimeError: If the Docker client fails to initialize.
+            RuntimeError: If no backend is given and the Docker client fails to initialize.
         """
-        try:
-            self.client = docker.from_env()
-            logger.info("Docker client initialized successfully.")
-        except Exception as e:
-            error_msg = f"Failed to initialize Docker client: {str(e)}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
+        self.manager = None
+        self.client = None
+        if backend is None:
+            self.manager = manager or SandboxManager.instance()
+            self.client = self.manager.client
+            backend = self.manager.get_pool(image, size=pool_size, max_jobs=max_jobs_per_container)
         self.image = image
         self.timeout = timeout
-        logger.info(f"ContainerisedCodeExecutor initialized with image: {image}, timeout: {timeout}s")
+        self.backend = backend
+        logger.info(f"ContainerisedCodeExecutor initialized with backend: {type(backend).__name__}, timeout: {timeout}s")
 
     def execute_code(self, code: Union[str, List[str]], test_class: type) -> Dict[str, Any]:
         """
@@ -58,31 +74,29 @@ class ContainerisedCodeTester:
             if isinstance(code, list):
                 code = "\n".join(code)
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                logger.info(f"Created temporary directory: {tmpdir}")
-                self._write_files(tmpdir, code, test_class)
-                status_code, stdout, stderr = self._run_container(tmpdir)
-                
-                if not stdout and not stderr:
-                    logger.warning("No output from container")
-                else:
-                    logger.info("Container produced output")
-                    logger.debug(f"Stdout length: {len(stdout)} characters")
-                    logger.debug(f"Stderr length: {len(stderr)} characters")
-                
-                logger.info(f"Container execution completed with status code: {status_code}")
-                
-                results = self._parse_output(status_code, stdout, stderr)
+            files = self._create_files(code, test_class)
+            status_code, stdout, stderr = self._run_container(files)
 
-                if results.get("all_passed"):
-                    logger.info("All tests passed successfully!")
-                else:
-                    logger.warning("Some tests failed or errors occurred.")
-                    logger.debug(f"Passed tests: {len(results['passed'])}")
-                    logger.debug(f"Failed tests: {len(results['failed'])}")
-                    logger.debug(f"Errors: {len(results['errors'])}")
+            if not stdout and not stderr:
+                logger.warning("No output from container")
+            else:
+                logger.info("Container produced output")
+                logger.debug(f"Stdout length: {len(stdout)} characters")
+                logger.debug(f"Stderr length: {len(stderr)} characters")
 
-                return results
+            logger.info(f"Container execution completed with status code: {status_code}")
+
+            results = self._parse_output(status_code, stdout, stderr)
+
+            if results.get("all_passed"):
+                logger.info("All tests passed successfully!")
+            else:
+                logger.warning("Some tests failed or errors occurred.")
+                logger.debug(f"Passed tests: {len(results['passed'])}")
+                logger.debug(f"Failed tests: {len(results['failed'])}")
+                logger.debug(f"Errors: {len(results['errors'])}")
+
+            return results
 
         except Exception as e:
             error_message = f"An error occurred during code execution: {str(e)}"
@@ -96,19 +110,20 @@ class ContainerisedCodeTester:
                 "errors": [{"type": type(e).__name__, "message": str(e)}]
             }
 
-    def _write_files(self, tmpdir: str, code: str, test_class: type) -> None:
+    def _create_files(self, code: str, test_class: type) -> Dict[str, str]:
         """
-        Write the code and test files to a temporary directory.
+        Create the code, test and main files for an execution.
 
         Args:
-            tmpdir (str): Path to the temporary directory.
-            code (str): The Python code to write.
-            test_class (type): The test class to write.
+            code (str): The Python code to test.
+            test_class (type): The test class to run against the code.
+
+        Returns:
+            Dict[str, str]: The contents of code.py, test.py and main.py.
+
+        Raises:
+            ValueError: If the code contains no function definition.
         """
-        code_path = os.path.join(tmpdir, "code.py")
-        test_path = os.path.join(tmpdir, "test.py")
-        main_path = os.path.join(tmpdir, "main.py")
-        
         # Parse the code to find the function name
         tree = ast.parse(code)
         function_def = next((node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)), None)
@@ -116,59 +131,28 @@ class ContainerisedCodeTester:
             raise ValueError("No function definition found in the provided code.")
         function_name = function_def.name
 
-        with open(code_path, "w") as f:
-            f.write(code)
-        logger.info(f"Written code to: {code_path}")
-        
-        with open(test_path, "w") as f:
-            f.write(inspect.getsource(test_class))
-        logger.info(f"Written test class to: {test_path}")
-        
-        main_content = self._generate_main_test_logic(test_class.__name__, function_name)
-        with open(main_path, "w") as f:
-            f.write(main_content)
-        logger.info(f"Written main execution logic to: {main_path}")
-
-    def _run_container(self, tmpdir: str) -> Tuple[int, str, str]:
+        return {
+            "code.py": code,
+            "test.py": inspect.getsource(test_class),
+            "main.py": self._generate_main_test_logic(test_class.__name__, function_name),
+        }
+
+    def _run_container(self, files: Dict[str, str]) -> Tuple[int, str, str]:
         """
-        Run the Docker container with the provided code and tests.
+        Run the code and tests on the execution backend.
 
         Args:
-            tmpdir (str): Path to the temporary directory containing the code and test files.
+            files (Dict[str, str]): The code, test and main files.
 
         Returns:
             Tuple[int, str, str]: A tuple containing the exit status code, stdout, and stderr.
-
-        Raises:
-            RuntimeError: If there's an error running the container.
         """
         try:
-            logger.info(f"Starting container with image: {self.image}")
-            container = self.client.containers.run(
-                self.image,
-                command=["python", "/app/main.py"],
-                volumes={tmpdir: {"bind": "/app", "mode": "ro"}},
-                working_dir="/app",
-                detach=True,
-                mem_limit="128m",
-                cpu_quota=50000,
-                network_mode="none",
-            )
-
-            logger.info("Container started. Waiting for completion...")
-            result = container.wait(timeout=self.timeout)
-            stdout = container.logs(stdout=True, stderr=False)
-            stderr = container.logs(stdout=False, stderr=True)
-            return result["StatusCode"], stdout, stderr
+            logger.info(f"Running tests with backend: {type(self.backend).__name__}")
+            return self.backend.run(files, ["python", "main.py"], self.timeout)
         except Exception as e:
             logger.error(f"Error in _run_container: {str(e)}")
             return 1, "", str(e)
-        finally:
-            try:
-                container.remove(force=True)
-                logger.info("Container removed.")
-            except Exception as e:
-                logger.error(f"Failed to remove container: {str(e)}")
 
     @staticmethod
     def _generate_main_test_logic(class_name: str, func_name: str) -> str:
@@ -1,10 +1,9 @@
 """ContainerisedToolRunner class for ReXia.AI"""
 
 import logging
-from typing import Any, Dict
-import docker
-import tempfile
-import os
+from typing import Any, Dict, Optional
+from .sandbox_manager import SandboxManager
+from ..base.base_execution_backend import BaseExecutionBackend
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -15,31 +14,47 @@ class ContainerisedToolRunner:
     A class for executing LLM-generated Python code as tools in isolated Docker containers.
     
     This class provides a secure environment for running potentially untrusted code
-    generated by language models.
+    generated by language models. Code runs in a warm ContainerPool shared by every
+    runner using the same image, or on another execution backend passed in, such as a
+    SubprocessBackend.
     """
 
-    def __init__(self, image: str = "python:3.12-slim", timeout: int = 30):
+    def __init__(
+        self,
+        image: str = "python:3.12-slim",
+        timeout: int = 30,
+        pool_size: int = 2,
+        max_jobs_per_container: int = 50,
+        manager: Optional[SandboxManager] = None,
+        backend: Optional[BaseExecutionBackend] = None,
+    ):
         """
         Initialize a ContainerisedToolRunner instance.
 
         Args:
             image (str, optional): The Docker image to use for the container. Defaults to "python:3.12-slim".
             timeout (int, optional): The maximum execution time in seconds. Defaults to 30.
+            pool_size (int, optional): The number of warm containers for the image. Defaults to 2.
+            max_jobs_per_container (int, optional): Executions a container runs before it is replaced.
+                Defaults to 50.
+            manager (SandboxManager, optional): The manager providing the Docker client and pool.
+                Defaults to the process-wide manager.
+            backend (BaseExecutionBackend, optional): The backend that runs the code, such as a
+                SubprocessBackend on hosts without Docker. Defaults to the manager's pool for the image.
 
         Raises:
-            RuntimeError: If the Docker client fails to initialize.
+            RuntimeError: If no backend is given and the Docker client fails to initialize.
         """
-        try:
-            self.client = docker.from_env()
-            logger.info("Docker client initialized successfully.")
-        except Exception as e:
-            error_msg = f"Failed to initialize Docker client: {str(e)}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
-        
+        self.manager = None
+        self.client = None
+        if backend is None:
+            self.manager = manager or SandboxManager.instance()
+            self.client = self.manager.client
+            backend = self.manager.get_pool(image, size=pool_size, max_jobs=max_jobs_per_container)
         self.image = image
         self.timeout = timeout
-        logger.info(f"ContainerisedToolRunner initialized with image: {image}, timeout: {timeout}s")
+        self.backend = backend
+        logger.info(f"ContainerisedToolRunner initialized with backend: {type(backend).__name__}, timeout: {timeout}s")
 
     def execute_code(self, code: str) -> Dict[str, Any]:
         """
@@ -56,43 +71,32 @@ class ContainerisedToolRunner:
             Exception: If an error occurs during code execution.
         """
         try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                logger.info(f"Created temporary directory: {tmpdir}")
-                self._write_files(tmpdir, code)
-                status_code, stdout, stderr = self._run_container(tmpdir)
-
-                if status_code == 0:
-                    logger.info("Code execution successful")
-                    return {"success": True, "output": stdout}
-                else:
-                    logger.warning(f"Code execution failed with status code: {status_code}")
-                    return {"success": False, "error": stderr}
+            status_code, stdout, stderr = self._run_container(self._create_files(code))
+
+            if status_code == 0:
+                logger.info("Code execution successful")
+                return {"success": True, "output": stdout}
+            else:
+                logger.warning(f"Code execution failed with status code: {status_code}")
+                return {"success": False, "error": stderr}
         except Exception as e:
             error_message = f"An error occurred during code execution: {str(e)}"
             logger.error(error_message)
             logger.exception("Exception details:")
             return {"success": False, "error": error_message}
 
-    def _write_files(self, tmpdir: str, code: str) -> None:
+    @staticmethod
+    def _create_files(code: str) -> Dict[str, str]:
         """
-        Write the code to files in the temporary directory.
+        Create the tool and main files for an execution.
 
         Args:
-            tmpdir (str): The path to the temporary directory.
-            code (str): The Python code to write.
+            code (str): The Python code to run.
 
-        Raises:
-            IOError: If there's an error writing to the files.
+        Returns:
+            Dict[str, str]: The contents of tool.py and main.py.
         """
-        try:
-            code_path = os.path.join(tmpdir, "tool.py")
-            main_path = os.path.join(tmpdir, "main.py")
-
-            with open(code_path, "w") as f:
-                f.write(code)
-            logger.info(f"Written code to: {code_path}")
-
-            main_content = """
+        main_content = """
 import tool
 import json
 
@@ -100,53 +104,23 @@ if __name__ == '__main__':
     result = tool.main()
     print(json.dumps({"result": result}))
 """
-            with open(main_path, "w") as f:
-                f.write(main_content)
-            logger.info(f"Written main execution logic to: {main_path}")
-        except IOError as e:
-            logger.error(f"Error writing files: {str(e)}")
-            raise IOError(f"Error writing files: {str(e)}")
-
-    def _run_container(self, tmpdir: str) -> tuple:
+        return {"tool.py": code, "main.py": main_content}
+
+    def _run_container(self, files: Dict[str, str]) -> tuple:
         """
-        Run the Docker container with the provided code.
+        Run the code on the execution backend.
 
         Args:
-            tmpdir (str): The path to the temporary directory containing the code files.
+            files (Dict[str, str]): The tool and main files.
 
         Returns:
             tuple: A tuple containing (status_code, stdout, stderr).
-
-        Raises:
-            docker.errors.ContainerError: If the container exits with a non-zero status code.
-            docker.errors.ImageNotFound: If the specified Docker image is not found.
-            docker.errors.APIError: If there's an error in the Docker API.
         """
         try:
-            logger.info(f"Starting container with image: {self.image}")
-            container = self.client.containers.run(
-                self.image,
-                command=["python", "/app/main.py"],
-                volumes={tmpdir: {"bind": "/app", "mode": "ro"}},
-                working_dir="/app",
-                detach=True,
-                mem_limit="128m",
-                cpu_quota=50000,
-                network_mode="none",
-            )
-
-            logger.info("Container started. Waiting for completion...")
-            result = container.wait(timeout=self.timeout)
-            stdout = container.logs(stdout=True, stderr=False).decode("utf-8")
-            stderr = container.logs(stdout=False, stderr=True).decode("utf-8")
-            logger.info(f"Container execution completed with status code: {result['StatusCode']}")
-            return result["StatusCode"], stdout, stderr
+            logger.info(f"Running code with backend: {type(self.backend).__name__}")
+            status_code, stdout, stderr = self.backend.run(files, ["python", "main.py"], self.timeout)
+            logger.info(f"Execution completed with status code: {status_code}")
+            return status_code, stdout, stderr
         except Exception as e:
             logger.error(f"Unexpected error in _run_container: {str(e)}")
             return 1, "", f"Unexpected error in _run_container: {str(e)}"
-        finally:
-            try:
-                container.remove(force=True)
-                logger.info("Container removed.")
-            except Exception as e:
-                logger.error(f"Failed to remove container: {str(e)}")
\ No newline at end of file
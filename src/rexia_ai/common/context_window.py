@@ -0,0 +1,202 @@
+"""Token-aware context window for the ReXia.AI collaboration chat."""
+
+import re
+import hashlib
+import threading
+import logging
+from typing import Any, Callable, Dict, List, Optional
+from ..base.base_cache import BaseCache
+from .cache import InMemoryCache
+from .utility import Utility
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class ContextWindow:
+    """
+    Fits the collaboration chat into a token budget before it is added to a prompt.
+
+    The most recent messages are always kept verbatim. The remaining budget goes to older
+    messages in order of relevance to the task, with recency breaking ties. Older messages
+    that do not fit verbatim are shortened by the summariser, which truncates by default.
+    Messages that still do not fit are dropped and replaced by a note. Summaries are cached
+    per message, so each message is only summarised once however many prompts include it.
+
+    Attributes:
+        max_tokens: The token budget for the task and messages together.
+        keep_recent: The number of most recent messages always kept verbatim.
+        summary_tokens: The target length of a summarised message in tokens.
+        summariser: Shortens a message to about summary_tokens. Defaults to truncation.
+        cache: The cache for summaries.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 4000,
+        keep_recent: int = 2,
+        summary_tokens: int = 200,
+        summariser: Optional[Callable[[str, int], str]] = None,
+        cache: Optional[BaseCache] = None,
+    ):
+        """
+        Initialize a ContextWindow instance.
+
+        Args:
+            max_tokens: The token budget for the task and messages together. Defaults to 4000.
+            keep_recent: The number of most recent messages always kept verbatim. Defaults to 2.
+            summary_tokens: The target length of a summarised message in tokens. Defaults to 200.
+            summariser: A callable taking a message and a token target and returning a shorter
+                message, for example one that asks a small model for a summary. Defaults to None
+                (keep the start and end of the message).
+            cache: A cache for summaries. Defaults to an InMemoryCache.
+        """
+        self.max_tokens = max_tokens
+        self.keep_recent = keep_recent
+        self.summary_tokens = summary_tokens
+        self.summariser = summariser or self.truncate
+        self.cache = cache if cache is not None else InMemoryCache(max_entries=4096)
+        self._lock = threading.Lock()
+        self._stats = {
+            "builds": 0,
+            "messages": 0,
+            "verbatim": 0,
+            "summarised": 0,
+            "dropped": 0,
+            "tokens_in": 0,
+            "tokens_out": 0,
+        }
+
+    def build(self, task: str, messages: List[str]) -> List[str]:
+        """
+        Select and shorten messages so the task and messages fit in the token budget.
+
+        Args:
+            task: The task the prompt is for.
+            messages: The messages from the collaboration chat, oldest first.
+
+        Returns:
+            List[str]: The messages to include, oldest first.
+        """
+        budget = max(0, self.max_tokens - Utility.estimate_tokens(task))
+        tokens = [Utility.estimate_tokens(message) for message in messages]
+        if sum(tokens) <= budget:
+            self._record(messages, tokens, messages, verbatim=len(messages), summarised=0)
+            return list(messages)
+
+        chosen: Dict[int, str] = {}
+        verbatim = 0
+        summarised = 0
+        recent_start = max(0, len(messages) - self.keep_recent)
+        for index in range(len(messages) - 1, recent_start - 1, -1):
+            if tokens[index] <= budget:
+                chosen[index] = messages[index]
+                budget -= tokens[index]
+                verbatim += 1
+            elif budget > 0:
+                # A recent message larger than what is left is truncated rather than lost.
+                chosen[index] = self.truncate(messages[index], budget)
+                budget = 0
+                summarised += 1
+            # Once the budget is spent, older recent messages are dropped like any other.
+
+        task_words = self._words(task)
+        older = sorted(
+            range(recent_start),
+            key=lambda index: (self._relevance(task_words, messages[index]), index),
+            reverse=True,
+        )
+        shortened = []
+        for index in older:
+            if tokens[index] <= budget:
+                chosen[index] = messages[index]
+                budget -= tokens[index]
+                verbatim += 1
+            else:
+                shortened.append(index)
+
+        for index in shortened:
+            summary = self._summarise(messages[index])
+            summary_tokens = Utility.estimate_tokens(summary)
+            if summary_tokens <= budget:
+                chosen[index] = summary
+                budget -= summary_tokens
+                summarised += 1
+
+        dropped = len(messages) - len(chosen)
+        window = [chosen[index] for index in sorted(chosen)]
+        if dropped:
+            window.insert(0, f"[{dropped} earlier messages omitted to fit the context window]")
+        self._record(messages, tokens, window, verbatim=verbatim, summarised=summarised)
+        return window
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the context window statistics.
+
+        Returns:
+            A dictionary with builds, messages, verbatim, summarised, dropped, tokens_in and
+            tokens_out counts, and the summary cache statistics.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["summary_cache"] = self.cache.get_stats()
+        return stats
+
+    @staticmethod
+    def truncate(message: str, max_tokens: int) -> str:
+        """
+        Shorten a message by keeping its start and end.
+
+        Args:
+            message: The message to shorten.
+            max_tokens: The approximate token length to shorten to.
+
+        Returns:
+            str: The shortened message.
+        """
+        max_chars = max(0, max_tokens * 4)
+        if len(message) <= max_chars:
+            return message
+        marker = " [...] "
+        if max_chars <= len(marker):
+            return message[:max_chars]
+        head = (max_chars - len(marker)) * 2 // 3
+        tail = max_chars - len(marker) - head
+        return message[:head] + marker + (message[-tail:] if tail else "")
+
+    def _summarise(self, message: str) -> str:
+        """Summarise a message, using the cached summary if there is one."""
+        key = hashlib.sha256(f"{self.summary_tokens}:{message}".encode("utf-8")).hexdigest()
+        summary = self.cache.get(key)
+        if summary is None:
+            summary = self.summariser(message, self.summary_tokens)
+            self.cache.set(key, summary)
+        return summary
+
+    def _relevance(self, task_words: set, message: str) -> float:
+        """The fraction of the task's words that appear in the message."""
+        if not task_words:
+            return 0.0
+        return len(task_words & self._words(message)) / len(task_words)
+
+    @staticmethod
+    def _words(text: str) -> set:
+        """The lower-cased words in a text."""
+        return set(WORD_PATTERN.findall(text.lower()))
+
+    def _record(
+        self, messages: List[str], tokens: List[int], window: List[str], verbatim: int, summarised: int
+    ) -> None:
+        """Update the statistics for one build."""
+        with self._lock:
+            self._stats["builds"] += 1
+            self._stats["messages"] += len(messages)
+            self._stats["verbatim"] += verbatim
+            self._stats["summarised"] += summarised
+            self._stats["dropped"] += len(messages) - verbatim - summarised
+            self._stats["tokens_in"] += sum(tokens)
+            self._stats["tokens_out"] += sum(Utility.estimate_tokens(message) for message in window)
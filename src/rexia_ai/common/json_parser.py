@@ -0,0 +1,86 @@
+"""Tiered JSON parser for ReXia.AI model responses."""
+
+import json
+import json5
+import json_repair
+import threading
+import logging
+from typing import Any, Dict
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+class TieredJSONParser:
+    """
+    Parses model output with the cheapest parser that succeeds.
+
+    Strict json.loads runs first, since it is implemented in C and most responses are
+    already valid. json_repair only runs when that fails, and returns the repaired object
+    directly rather than a string that would need parsing again. json5 is the last resort.
+    The number of responses handled by each tier is recorded.
+    """
+
+    TIERS = ("json", "json_repair", "json5")
+
+    def __init__(self):
+        """Initialize a TieredJSONParser instance."""
+        self._lock = threading.Lock()
+        self._counts = {tier: 0 for tier in self.TIERS}
+        self._failures = 0
+
+    def parse(self, text: str) -> Any:
+        """
+        Parse a JSON string.
+
+        Args:
+            text: The JSON string, possibly malformed.
+
+        Returns:
+            Any: The parsed value.
+
+        Raises:
+            ValueError: If no tier can parse the string.
+        """
+        try:
+            value = json.loads(text)
+            self._record("json")
+            return value
+        except ValueError:
+            pass
+
+        try:
+            # json.loads has already failed, so json_repair need not try it again.
+            value = json_repair.repair_json(text, return_objects=True, skip_json_loads=True)
+            if value != "" or not text.strip():
+                self._record("json_repair")
+                return value
+        except Exception as e:
+            logger.debug(f"json_repair could not parse the response: {e}")
+
+        try:
+            value = json5.loads(text)
+            self._record("json5")
+            return value
+        except ValueError as e:
+            with self._lock:
+                self._failures += 1
+            raise ValueError(f"Invalid JSON input: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the parser statistics.
+
+        Returns:
+            A dictionary with the number of responses parsed by each tier, and failures.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counts)
+            stats["failures"] = self._failures
+        return stats
+
+    def _record(self, tier: str) -> None:
+        """Count a response parsed by the given tier."""
+        with self._lock:
+            self._counts[tier] += 1
@@ -0,0 +1,95 @@
+"""Shared prompt prefix tracking for ReXia.AI."""
+
+import os
+import threading
+import logging
+from collections import deque
+from typing import Any, Dict
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+class PrefixTracker:
+    """
+    Measures how much of each prompt repeats the start of a recent prompt.
+
+    Servers such as vLLM and llama.cpp reuse their KV cache for a prompt prefix they
+    have already processed. Each prompt is compared with the last `window` prompts sent
+    to the same endpoint. The longest shared prefix is logged and added to the
+    statistics, which gives the share of prompt text the server could have served from
+    its cache.
+
+    Attributes:
+        window: The number of recent prompts each prompt is compared with.
+    """
+
+    def __init__(self, window: int = 8):
+        """
+        Initialize a PrefixTracker instance.
+
+        Args:
+            window: The number of recent prompts each prompt is compared with. Defaults to 8.
+        """
+        self.window = window
+        self._recent = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._prompts = 0
+        self._prompt_chars = 0
+        self._shared_chars = 0
+        self._last_shared_prefix = 0
+
+    def record(self, prompt: str) -> int:
+        """
+        Record a prompt and measure its shared prefix.
+
+        Args:
+            prompt: The prompt about to be sent.
+
+        Returns:
+            int: The length in characters of the longest prefix shared with a recent prompt.
+        """
+        with self._lock:
+            recent = list(self._recent)
+            self._recent.append(prompt)
+
+        shared = max((self.shared_prefix_length(prompt, other) for other in recent), default=0)
+        logger.debug(f"Shared prefix length: {shared} of {len(prompt)} characters")
+
+        with self._lock:
+            self._prompts += 1
+            self._prompt_chars += len(prompt)
+            self._shared_chars += shared
+            self._last_shared_prefix = shared
+        return shared
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the prefix statistics.
+
+        Returns:
+            A dictionary with the number of prompts, the last and mean shared prefix length
+            in characters, and the fraction of all prompt text that was a shared prefix.
+        """
+        with self._lock:
+            return {
+                "prompts": self._prompts,
+                "last_shared_prefix": self._last_shared_prefix,
+                "mean_shared_prefix": self._shared_chars / self._prompts if self._prompts else 0.0,
+                "shared_prefix_ratio": self._shared_chars / self._prompt_chars if self._prompt_chars else 0.0,
+            }
+
+    @staticmethod
+    def shared_prefix_length(first: str, second: str) -> int:
+        """
+        Get the length of the common prefix of two strings.
+
+        Args:
+            first: The first string.
+            second: The second string.
+
+        Returns:
+            int: The number of leading characters the strings share.
+        """
+        return len(os.path.commonprefix([first, second]))
@@ -0,0 +1,32 @@
+"""Prompt templates for ReXia.AI workers."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """
+    Dataclass holding the static parts of a worker prompt, rendered once.
+
+    Only the task and collaboration chat change between calls, so they are the only
+    part formatted per prompt.
+
+    Attributes:
+        prefix: The static text before the task and chat.
+        suffix: The static text after the task and chat.
+    """
+
+    prefix: str
+    suffix: str = ""
+
+    def render(self, context: str) -> str:
+        """
+        Render the prompt for one call.
+
+        Args:
+            context: The formatted task and collaboration chat.
+
+        Returns:
+            str: The complete prompt.
+        """
+        return self.prefix + context + self.suffix
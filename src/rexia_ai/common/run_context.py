@@ -0,0 +1,71 @@
+"""Per-run context for ReXia.AI workflows."""
+
+import contextlib
+import contextvars
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+from .collaboration_channel import CollaborationChannel
+from .task_status import TaskStatus
+
+_current_run: contextvars.ContextVar = contextvars.ContextVar("rexia_ai_run", default=None)
+
+
+@dataclass
+class RunContext:
+    """
+    Dataclass holding the state of a single workflow run.
+
+    Workflows, components and workers are configuration and can be shared. Everything that
+    changes during a run lives here instead, so concurrent runs on one workflow cannot
+    see or overwrite each other's state.
+
+    Attributes:
+        task: The task being worked on.
+        llm: The language model chosen for this run, or None to use each worker's own model.
+        channel: The collaboration channel for this run's messages.
+        task_complexity: The router's complexity score for the task, if the run was routed.
+    """
+
+    task: str
+    llm: Any = None
+    channel: CollaborationChannel = field(default=None)
+    task_complexity: Optional[int] = None
+
+    def __post_init__(self):
+        if self.channel is None:
+            self.channel = CollaborationChannel(self.task)
+
+    @property
+    def status(self) -> TaskStatus:
+        """The status of the run's task."""
+        return self.channel.status
+
+    @status.setter
+    def status(self, status: TaskStatus) -> None:
+        self.channel.status = status
+
+    @contextlib.contextmanager
+    def bind(self) -> Iterator["RunContext"]:
+        """
+        Make this the current run for the calling thread or asyncio task.
+
+        Workers use the current run's language model while it is bound.
+
+        Yields:
+            RunContext: This run context.
+        """
+        token = _current_run.set(self)
+        try:
+            yield self
+        finally:
+            _current_run.reset(token)
+
+    @staticmethod
+    def current() -> Optional["RunContext"]:
+        """
+        Get the run bound to the calling thread or asyncio task.
+
+        Returns:
+            The current run context, or None if no run is bound.
+        """
+        return _current_run.get()
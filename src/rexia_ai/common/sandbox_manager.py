@@ -0,0 +1,177 @@
+"""Process-wide sandbox manager for ReXia.AI."""
+
+import time
+import atexit
+import threading
+import logging
+from typing import Any, Dict, Optional
+import docker
+from .container_pool import ContainerPool
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+class SandboxManager:
+    """
+    Owns the Docker client and container pools shared by every sandbox runner in the process.
+
+    Creating a Docker client reads the environment and negotiates the API version with the
+    daemon, which costs a round trip. The manager creates one client the first time it is
+    needed, with a connection pool large enough for concurrent runners, and hands the same
+    client and the same pool per image to every ContainerisedCodeTester and
+    ContainerisedToolRunner.
+
+    Attributes:
+        max_pool_size: The number of connections to the Docker daemon kept open.
+        timeout: Seconds to wait for the Docker daemon to answer.
+    """
+
+    _instance: Optional["SandboxManager"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_pool_size: int = 16, timeout: int = 60):
+        """
+        Initialize a SandboxManager instance. The Docker client is created when first used.
+
+        Args:
+            max_pool_size: The number of connections to the Docker daemon kept open. Defaults to 16.
+            timeout: Seconds to wait for the Docker daemon to answer. Defaults to 60.
+        """
+        self.max_pool_size = max_pool_size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._client = None
+        self._pools: Dict[str, ContainerPool] = {}
+        self._client_inits = 0
+        self._client_init_failures = 0
+        self._client_init_seconds = 0.0
+        self._last_error: Optional[str] = None
+
+    @classmethod
+    def instance(cls) -> "SandboxManager":
+        """
+        Get the manager shared by the whole process.
+
+        Returns:
+            SandboxManager: The shared manager, created on first use. Its pools are closed when
+                the interpreter exits.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+    @property
+    def client(self) -> Any:
+        """
+        The shared Docker client, created on first use.
+
+        Raises:
+            RuntimeError: If the Docker client fails to initialize.
+        """
+        if self._client is not None:
+            return self._client
+        with self._lock:
+            if self._client is None:
+                started = time.monotonic()
+                try:
+                    self._client = docker.from_env(max_pool_size=self.max_pool_size, timeout=self.timeout)
+                except Exception as e:
+                    self._client_init_failures += 1
+                    self._last_error = str(e)
+                    error_msg = f"Failed to initialize Docker client: {str(e)}"
+                    logger.error(error_msg)
+                    raise RuntimeError(error_msg)
+                self._client_inits += 1
+                self._client_init_seconds += time.monotonic() - started
+                logger.info("Docker client initialized successfully.")
+            return self._client
+
+    def get_pool(self, image: str, size: int = 2, max_jobs: int = 50) -> ContainerPool:
+        """
+        Get the container pool shared by every runner using an image.
+
+        The first call for an image creates the pool and starts warming it in the background;
+        later calls return the same instance, grown and warmed again if they ask for a larger
+        size. The pool keeps the max_jobs it was created with.
+
+        Args:
+            image: The Docker image to run.
+            size: The number of containers to keep warm. Defaults to 2.
+            max_jobs: Jobs a container runs before it is replaced. Defaults to 50.
+
+        Returns:
+            ContainerPool: The shared pool.
+
+        Raises:
+            RuntimeError: If the Docker client fails to initialize.
+        """
+        client = self.client
+        with self._lock:
+            pool = self._pools.get(image)
+            if pool is None:
+                pool = ContainerPool(client, image, size=size, max_jobs=max_jobs)
+                self._pools[image] = pool
+            elif pool.grow(size):
+                logger.info(f"Container pool for {image} grown to {size} containers.")
+            else:
+                if pool.max_jobs != max_jobs:
+                    logger.warning(f"Container pool for {image} already exists with max_jobs={pool.max_jobs}; using it.")
+                return pool
+            threading.Thread(target=pool.warm, daemon=True).start()
+            return pool
+
+    def health(self) -> Dict[str, Any]:
+        """
+        Check that the Docker daemon is reachable.
+
+        Returns:
+            A dictionary with whether the daemon answered a ping, how long it took in seconds,
+            and the error if it did not.
+        """
+        started = time.monotonic()
+        try:
+            healthy = bool(self.client.ping())
+            error = None
+        except Exception as e:
+            healthy = False
+            error = str(e)
+            with self._lock:
+                self._last_error = error
+        return {"healthy": healthy, "ping_seconds": time.monotonic() - started, "error": error}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the manager's usage statistics.
+
+        Returns:
+            A dictionary with the number of Docker clients created, failed attempts, the time
+            spent creating them, the last error, and the statistics of each container pool.
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+            stats = {
+                "client_initialized": self._client is not None,
+                "client_inits": self._client_inits,
+                "client_init_failures": self._client_init_failures,
+                "client_init_seconds": self._client_init_seconds,
+                "last_error": self._last_error,
+            }
+        stats["pools"] = [pool.get_stats() for pool in pools]
+        return stats
+
+    def close(self) -> None:
+        """Close every container pool and the Docker client."""
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+            client, self._client = self._client, None
+        for pool in pools:
+            pool.close()
+        if client is not None:
+            try:
+                client.close()
+            except Exception as e:
+                logger.error(f"Failed to close Docker client: {str(e)}")
@@ -0,0 +1,287 @@
+"""Local process sandbox backend for ReXia.AI."""
+
+import os
+import sys
+import shutil
+import signal
+import tempfile
+import threading
+import subprocess
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from ..base.base_execution_backend import BaseExecutionBackend
+
+try:
+    import resource
+except ImportError:  # Windows has no rlimits
+    resource = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+# Exit status of a job killed for running past its wall-clock timeout, as reported by `timeout`.
+TIMEOUT_EXIT_CODE = 124
+
+# Seconds to wait for a killed job's output pipes to close. A process that left the job's
+# process group can hold them open for as long as it runs.
+KILL_GRACE_SECONDS = 2.0
+
+# Applies the rlimits given as arguments and execs the job, where `prlimit` is not installed.
+# Setting them in the child before exec with preexec_fn is not safe in a threaded process.
+_RLIMIT_SHIM = (
+    "import os, resource, sys\n"
+    "names = ('RLIMIT_CPU', 'RLIMIT_AS', 'RLIMIT_FSIZE', 'RLIMIT_CORE')\n"
+    "for name, value in zip(names, sys.argv[1:5]):\n"
+    "    resource.setrlimit(getattr(resource, name), (int(value), int(value)))\n"
+    "os.execvp(sys.argv[5], sys.argv[5:])\n"
+)
+
+
+@lru_cache(maxsize=None)
+def _unshare_available() -> bool:
+    """
+    Check whether `unshare -rn` can put a process in a new, empty network namespace.
+
+    Returns:
+        bool: True if unprivileged user and network namespaces are available.
+    """
+    if shutil.which("unshare") is None:
+        return False
+    try:
+        probe = subprocess.run(["unshare", "-rn", "true"], capture_output=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return probe.returncode == 0
+
+
+class SubprocessBackend(BaseExecutionBackend):
+    """
+    An execution backend that runs jobs in a separate local interpreter, for hosts without Docker.
+
+    Each job runs in a fresh temporary directory, in its own process group, with an empty
+    environment and the interpreter's -E and -s flags. rlimits, set by `prlimit` or a small
+    exec wrapper rather than in the forked child, cap its CPU time, address space, file size
+    and core dumps. Where unprivileged namespaces are available the job runs under
+    `unshare -rn`, which leaves it with no network interfaces but loopback. The whole process
+    group is killed when the wall-clock timeout expires. Starting a job costs the interpreter
+    start-up, milliseconds rather than the seconds of a container.
+
+    This is weaker isolation than a container: the job can read whatever the current user can.
+
+    Attributes:
+        python: The interpreter that runs `python` commands.
+        cpu_seconds: The CPU time limit of a job.
+        memory_mb: The address space limit of a job, in megabytes.
+        file_size_mb: The largest file a job may write, in megabytes.
+        isolate_network: Whether jobs run without network access.
+    """
+
+    def __init__(
+        self,
+        python: Optional[str] = None,
+        cpu_seconds: int = 30,
+        memory_mb: int = 512,
+        file_size_mb: int = 16,
+        isolate_network: bool = True,
+    ):
+        """
+        Initialize a SubprocessBackend instance.
+
+        Args:
+            python: The interpreter that runs `python` commands. Defaults to the current one.
+            cpu_seconds: The CPU time limit of a job. Defaults to 30.
+            memory_mb: The address space limit of a job, in megabytes. Defaults to 512.
+            file_size_mb: The largest file a job may write, in megabytes. Defaults to 16.
+            isolate_network: Run jobs without network access when `unshare` allows it.
+                Defaults to True.
+        """
+        self.python = python or sys.executable
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.file_size_mb = file_size_mb
+        self.isolate_network = isolate_network and _unshare_available()
+        if isolate_network and not self.isolate_network:
+            logger.warning("unshare is not available; sandboxed jobs will have network access.")
+        self._lock = threading.Lock()
+        self._jobs = 0
+        self._failures = 0
+        self._timeouts = 0
+
+    def run(self, files: Dict[str, str], command: List[str], timeout: float) -> Tuple[int, str, str]:
+        """
+        Run a job in a separate interpreter.
+
+        Args:
+            files: The files the job needs, by path relative to the working directory.
+            command: The command to run in the working directory.
+            timeout: Seconds the job may run before its process group is killed.
+
+        Returns:
+            Tuple[int, str, str]: The exit status code, stdout and stderr. A job that timed out
+                has status 124; one killed by a signal has 128 plus the signal number.
+        """
+        with tempfile.TemporaryDirectory(prefix="rexia_ai_sandbox_") as workdir:
+            self._write_files(workdir, files)
+            process = subprocess.Popen(
+                self._build_command(command),
+                cwd=workdir,
+                env=self._build_env(workdir),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+                status = process.returncode if process.returncode >= 0 else 128 - process.returncode
+            except subprocess.TimeoutExpired:
+                self._kill(process)
+                stdout, stderr = self._collect_output(process)
+                status = TIMEOUT_EXIT_CODE
+
+        with self._lock:
+            self._jobs += 1
+            if status == TIMEOUT_EXIT_CODE:
+                self._timeouts += 1
+            elif status not in (0, 1):
+                self._failures += 1
+        return status, stdout.decode("utf-8", "replace"), stderr.decode("utf-8", "replace")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the backend's usage statistics.
+
+        Returns:
+            A dictionary with the number of jobs run, jobs that crashed or timed out, and
+            whether jobs run without network access.
+        """
+        with self._lock:
+            return {
+                "jobs": self._jobs,
+                "failures": self._failures,
+                "timeouts": self._timeouts,
+                "isolate_network": self.isolate_network,
+            }
+
+    def _build_command(self, command: List[str]) -> List[str]:
+        """
+        Resolve `python` to the isolated interpreter and wrap the command in `unshare` and the rlimits.
+
+        Args:
+            command: The job's command.
+
+        Returns:
+            List[str]: The command to start.
+        """
+        if command and command[0] == "python":
+            command = [self.python, "-E", "-s", *command[1:]]
+        if self.isolate_network:
+            command = ["unshare", "-rn", *command]
+        return self._limit_resources(command)
+
+    @staticmethod
+    def _build_env(workdir: str) -> Dict[str, str]:
+        """
+        Build the job's environment, which shares nothing with the host's.
+
+        Args:
+            workdir: The job's working directory, also used as its home and temp directory.
+
+        Returns:
+            Dict[str, str]: The environment variables.
+        """
+        env = {
+            "PATH": os.defpath,
+            "HOME": workdir,
+            "TMPDIR": workdir,
+            "PYTHONDONTWRITEBYTECODE": "1",
+            "PYTHONIOENCODING": "utf-8",
+        }
+        if "SYSTEMROOT" in os.environ:
+            env["SYSTEMROOT"] = os.environ["SYSTEMROOT"]
+        return env
+
+    def _limit_resources(self, command: List[str]) -> List[str]:
+        """
+        Wrap a command so that it starts under the job's rlimits.
+
+        `prlimit` sets them when it is installed, and otherwise a short script run by the
+        current interpreter sets them and execs the command. Hosts without rlimits run the
+        command as it is.
+
+        Args:
+            command: The command to wrap.
+
+        Returns:
+            List[str]: The wrapped command.
+        """
+        if resource is None:
+            return command
+        megabyte = 1024 * 1024
+        limits = [self.cpu_seconds, self.memory_mb * megabyte, self.file_size_mb * megabyte, 0]
+        if shutil.which("prlimit") is not None:
+            cpu, address_space, file_size, core = limits
+            return [
+                "prlimit",
+                f"--cpu={cpu}",
+                f"--as={address_space}",
+                f"--fsize={file_size}",
+                f"--core={core}",
+                "--",
+                *command,
+            ]
+        return [sys.executable, "-E", "-s", "-c", _RLIMIT_SHIM, *map(str, limits), *command]
+
+    @staticmethod
+    def _kill(process: subprocess.Popen) -> None:
+        """
+        Kill a job's whole process group.
+
+        Args:
+            process: The job's process, the leader of its group.
+        """
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def _collect_output(process: subprocess.Popen) -> Tuple[bytes, bytes]:
+        """
+        Read what a killed job wrote, waiting no longer than KILL_GRACE_SECONDS for its pipes to close.
+
+        Args:
+            process: The job's process, already killed.
+
+        Returns:
+            Tuple[bytes, bytes]: The job's stdout and stderr, or nothing if a process that
+                left its group kept the pipes open.
+        """
+        try:
+            return process.communicate(timeout=KILL_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            logger.warning("A process started by a timed out job is still running outside its process group.")
+            process.stdout.close()
+            process.stderr.close()
+            process.wait()
+            return b"", b""
+
+    @staticmethod
+    def _write_files(workdir: str, files: Dict[str, str]) -> None:
+        """
+        Write a job's files into its working directory.
+
+        Args:
+            workdir: The job's working directory.
+            files: The files, by relative path.
+        """
+        for name, content in files.items():
+            path = os.path.join(workdir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
@@ -0,0 +1,271 @@
+"""Tool result caching for ReXia.AI."""
+
+import json
+import asyncio
+import hashlib
+import threading
+import logging
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from ..base.base_cache import BaseCache
+from .cache import InMemoryCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+# Set on a call's shared future when the call fetching the result was cancelled or interrupted.
+_ABANDONED = object()
+
+
+class ToolCache:
+    """
+    Caches tool results by tool name and normalised arguments.
+
+    Each tool declares how long its results stay fresh in its `cache_ttl` attribute, and
+    tools without one are never cached. Results are stored in a BaseCache backend, such
+    as an InMemoryCache or a SQLiteCache to share results between processes and runs.
+    Concurrent calls with the same arguments are coalesced: the first call fetches the
+    result and the others wait for it, so a burst of identical calls costs one fetch. If the
+    fetching call is cancelled, for example because it timed out, one of the waiting calls
+    fetches the result in its place.
+
+    Attributes:
+        backend: The cache the results are stored in.
+    """
+
+    def __init__(self, backend: Optional[BaseCache] = None):
+        """
+        Initialize a ToolCache instance.
+
+        Args:
+            backend: The cache to store results in. Defaults to an InMemoryCache with 1024 entries.
+        """
+        self.backend = backend if backend is not None else InMemoryCache()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._coalesced = 0
+        self._fetches = 0
+
+    def call(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        ttl: Optional[float],
+        func: Callable[..., Any],
+    ) -> Any:
+        """
+        Get a tool's result from the cache, or call the tool and cache its result.
+
+        Args:
+            tool_name: The name of the tool.
+            args: The arguments for the call.
+            ttl: Seconds the result stays fresh. None or 0 calls the tool without caching.
+            func: The tool function, called with the arguments on a miss.
+
+        Returns:
+            Any: The cached or fetched result.
+
+        Raises:
+            Exception: Any error raised by the tool function. Errors are not cached.
+        """
+        if not ttl:
+            return func(**args)
+        key = self.key(tool_name, args)
+        while True:
+            cached, future, leader = self._lookup(key)
+            if cached is not None:
+                return cached
+            if leader:
+                break
+            result = future.result()
+            if result is not _ABANDONED:
+                return result
+        try:
+            result = func(**args)
+        except Exception as e:
+            self._finish(key, future, ttl, error=e)
+            raise
+        except BaseException:
+            self._abandon(key, future)
+            raise
+        self._finish(key, future, ttl, result=result)
+        return result
+
+    async def acall(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        ttl: Optional[float],
+        func: Callable[..., Awaitable[Any]],
+    ) -> Any:
+        """
+        Asynchronously get a tool's result from the cache, or await the tool and cache its result.
+
+        Args:
+            tool_name: The name of the tool.
+            args: The arguments for the call.
+            ttl: Seconds the result stays fresh. None or 0 calls the tool without caching.
+            func: The coroutine tool function, awaited with the arguments on a miss.
+
+        Returns:
+            Any: The cached or fetched result.
+
+        Raises:
+            Exception: Any error raised by the tool function. Errors are not cached.
+        """
+        if not ttl:
+            return await func(**args)
+        key = self.key(tool_name, args)
+        while True:
+            cached, future, leader = self._lookup(key)
+            if cached is not None:
+                return cached
+            if leader:
+                break
+            # Shielded, so a waiting call that times out does not cancel the shared fetch.
+            result = await asyncio.shield(asyncio.wrap_future(future))
+            if result is not _ABANDONED:
+                return result
+        try:
+            result = await func(**args)
+        except Exception as e:
+            self._finish(key, future, ttl, error=e)
+            raise
+        except BaseException:
+            # Cancellation belongs to this call alone; a waiting call fetches the result instead.
+            self._abandon(key, future)
+            raise
+        self._finish(key, future, ttl, result=result)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the tool cache statistics.
+
+        Returns:
+            A dictionary with the backend's hits, misses, sets, evictions and size, the number of
+            calls that fetched a result and that waited for an identical call instead, and the hit
+            ratio counting both cache hits and coalesced calls as served without a fetch.
+        """
+        stats = self.backend.get_stats()
+        with self._lock:
+            coalesced = self._coalesced
+            fetches = self._fetches
+        calls = stats["hits"] + coalesced + fetches
+        stats.update(
+            {
+                "fetches": fetches,
+                "coalesced": coalesced,
+                "hit_ratio": (stats["hits"] + coalesced) / calls if calls else 0.0,
+            }
+        )
+        return stats
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        self.backend.clear()
+
+    @staticmethod
+    def key(tool_name: str, args: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a tool call.
+
+        Arguments are normalised first: keys are sorted and leading and trailing whitespace
+        is stripped from strings, so trivially different calls share a result.
+
+        Args:
+            tool_name: The name of the tool.
+            args: The arguments for the call.
+
+        Returns:
+            str: A key identifying the call.
+        """
+        normalised = json.dumps(
+            [tool_name, ToolCache._normalise(args)], sort_keys=True, default=str
+        )
+        return "tool:" + hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _normalise(value: Any) -> Any:
+        """
+        Normalise an argument value for the cache key.
+
+        Args:
+            value: The value.
+
+        Returns:
+            Any: The value with whitespace stripped from every string it contains.
+        """
+        if isinstance(value, str):
+            return value.strip()
+        if isinstance(value, dict):
+            return {str(k): ToolCache._normalise(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [ToolCache._normalise(v) for v in value]
+        return value
+
+    def _lookup(self, key: str) -> Tuple[Any, Optional[Future], bool]:
+        """
+        Look a call up in the cache and among the calls in flight.
+
+        Args:
+            key: The call's cache key.
+
+        Returns:
+            Tuple[Any, Optional[Future], bool]: The cached result or None, the future the call's
+                result will be set on, and whether this call must fetch the result itself.
+        """
+        cached = self.backend.get(key)
+        if cached is not None:
+            return cached, None, False
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._coalesced += 1
+                logger.debug(f"Waiting for an identical tool call in flight: {key}")
+                return None, future, False
+            future = Future()
+            self._in_flight[key] = future
+            self._fetches += 1
+            return None, future, True
+
+    def _finish(
+        self,
+        key: str,
+        future: Future,
+        ttl: float,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Store a fetched result and pass it to the calls waiting for it.
+
+        Args:
+            key: The call's cache key.
+            future: The future the waiting calls are blocked on.
+            ttl: Seconds the result stays fresh.
+            result: The fetched result.
+            error: The error the fetch raised, if it failed.
+        """
+        if error is None:
+            self.backend.set(key, result, ttl=ttl)
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def _abandon(self, key: str, future: Future) -> None:
+        """
+        Give up a fetch that was cancelled or interrupted, so that a waiting call fetches instead.
+
+        Args:
+            key: The call's cache key.
+            future: The future the waiting calls are blocked on.
+        """
+        with self._lock:
+            self._in_flight.pop(key, None)
+        future.set_result(_ABANDONED)
@@ -1,21 +1,34 @@
 """Utility class for ReXia.AI."""
 
 import re
+import asyncio
+import functools
+import contextvars
 import json_repair
 import logging
+from typing import Any, Callable
+from .json_parser import TieredJSONParser
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+JSON_STRUCTURE_PATTERN = re.compile(r'[{}"]')
+JSON_STRING_BODY_PATTERN = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
 class Utility:
     """
     A utility class providing helper methods for ReXia.AI operations.
 
     This class contains various utility methods that can be used across
     the ReXia.AI application for common tasks such as string manipulation.
+
+    Attributes:
+        json_parser: The shared parser used by parse_json. Its get_stats() reports per-tier counts.
     """
 
+    json_parser = TieredJSONParser()
+
     @staticmethod
     def strip_tags(response: str) -> str:
         """
@@ -45,6 +58,46 @@ class Utility:
         stripped_response = response.strip()
         return stripped_response
     
+    @staticmethod
+    async def run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking callable in the default executor and await its result.
+
+        The current context is copied into the worker thread, so context variables set
+        by the caller remain visible to the callable.
+
+        Args:
+            func (Callable[..., Any]): The blocking callable to run.
+            *args (Any): Positional arguments for the callable.
+            **kwargs (Any): Keyword arguments for the callable.
+
+        Returns:
+            Any: The value returned by the callable.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            None, functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """
+        Estimate the number of tokens in a string.
+
+        Uses the common approximation of four characters per token. It is cheap and
+        independent of the model's tokenizer, which is good enough for budgeting.
+
+        Args:
+            text (str): The text to estimate.
+
+        Returns:
+            int: The estimated number of tokens.
+        """
+        if not text:
+            return 0
+        return (len(text) + 3) // 4
+
     @staticmethod
     def remove_system_tokens(s: str) -> str:
         """
@@ -64,6 +117,10 @@ class Utility:
         """
         Extracts the first JSON object from a given text string.
 
+        Scans the text once, tracking brace depth and skipping strings, including escaped
+        quotes inside them, so objects of any depth are found in linear time. If no object
+        closes at the top level, the outermost complete object nested inside it is returned.
+
         Args:
             text (str): Input text potentially containing a JSON object.
 
@@ -71,17 +128,59 @@ class Utility:
             str: Extracted JSON object if found, otherwise the entire input text.
 
         Note:
-            Uses regex to find JSON objects. Does not validate JSON structure.
-        """
-        pattern = r'\{(?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*\}'
-        match = re.search(pattern, text, re.DOTALL)
-        if match:
-            extracted_json = match.group(0)
-            return extracted_json
-        else:
-            logger.warning("No JSON object found in the text")
-            return text
-    
+            Does not validate JSON structure.
+        """
+        starts = []
+        best = None
+        position = 0
+        search = JSON_STRUCTURE_PATTERN.search
+        # Searching for the next brace or quote, and matching whole strings, both run in the
+        # regex engine, so only structural characters are visited in Python.
+        while True:
+            match = search(text, position)
+            if match is None:
+                break
+            position = match.start()
+            char = match.group()
+            if char == "{":
+                starts.append(position)
+            elif char == '"':
+                if starts:
+                    string_end = JSON_STRING_BODY_PATTERN.match(text, position + 1)
+                    if string_end is None:
+                        break
+                    position = string_end.end()
+                    continue
+            elif starts:
+                start = starts.pop()
+                if not starts:
+                    return text[start : position + 1]
+                if best is None or start < best[0]:
+                    best = (start, position + 1)
+            position += 1
+
+        if best is not None:
+            logger.warning("No complete top-level JSON object found, using the outermost complete one")
+            return text[best[0] : best[1]]
+        logger.warning("No JSON object found in the text")
+        return text
+
+    @staticmethod
+    def parse_json(json_string: str) -> Any:
+        """
+        Parse a JSON string from a model response, repairing it only if necessary.
+
+        Args:
+            json_string (str): The potentially malformed JSON string.
+
+        Returns:
+            Any: The parsed value.
+
+        Raises:
+            ValueError: If the string cannot be parsed or repaired.
+        """
+        return Utility.json_parser.parse(json_string)
+
     @staticmethod
     def fix_json_errors(json_string: str) -> str:
         """
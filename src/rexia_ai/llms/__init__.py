@@ -1,5 +1,8 @@
 """Llms module for ReXia.AI."""
 
 from .rexia_ai_openai import RexiaAIOpenAI
+from .rexia_ai_openai_pool import RexiaAIOpenAIPool
+from .rate_limiter import RateLimiter
+from .hedging import HedgePolicy
 
-__all__ = ["RexiaAIOpenAI"]
\ No newline at end of file
+__all__ = ["RexiaAIOpenAI", "RexiaAIOpenAIPool", "RateLimiter", "HedgePolicy"]
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""Hedged requests for ReXia.AI language models."""
+
+import time
+import asyncio
+import threading
+import contextvars
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HedgePolicy:
+    """
+    Opt-in request hedging to cut tail latency.
+
+    If a request has not completed within the configured percentile of recent
+    latencies, a duplicate is sent and whichever finishes first wins; the other is
+    cancelled. A budget caps the fraction of requests that may be hedged, so a
+    generally slow endpoint cannot double its own load.
+
+    Attributes:
+        percentile: The latency percentile after which a hedge is sent, between 0 and 1.
+        max_hedge_rate: The maximum fraction of requests that may be hedged.
+        min_samples: Latency samples needed before hedging starts.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_hedge_rate: float = 0.1,
+        min_samples: int = 20,
+        window: int = 200,
+        max_workers: int = 64,
+    ):
+        """
+        Initialize a HedgePolicy instance.
+
+        Args:
+            percentile: The latency percentile after which a hedge is sent. Defaults to 0.95.
+            max_hedge_rate: The maximum fraction of requests that may be hedged. Defaults to 0.1.
+            min_samples: Latency samples needed before hedging starts. Defaults to 20.
+            window: The number of recent latencies kept. Defaults to 200.
+            max_workers: Threads available to the synchronous path. Defaults to 64.
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.percentile = percentile
+        self.max_hedge_rate = max_hedge_rate
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+
+    def call(self, primary: Callable[[], Any], hedge: Callable[[], Any]) -> Any:
+        """
+        Run a request, sending a hedge if it is slower than the latency threshold.
+
+        Args:
+            primary: Makes the original request.
+            hedge: Makes the duplicate request.
+
+        Returns:
+            The result of whichever request finished first.
+        """
+        delay = self._start_request()
+        if delay is None:
+            return self._timed(primary)
+
+        executor = self._get_executor()
+        first = executor.submit(contextvars.copy_context().run, self._timed, primary)
+        done, _ = wait([first], timeout=delay)
+        if done or not self._spend_hedge():
+            return first.result()
+
+        second = executor.submit(contextvars.copy_context().run, self._timed, hedge)
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        # A running thread cannot be interrupted; its result is discarded.
+                        loser.cancel()
+                    self._record_winner(hedged=future is second)
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def acall(
+        self, primary: Callable[[], Awaitable[Any]], hedge: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Asynchronously run a request, sending a hedge if it is slower than the latency threshold.
+
+        Args:
+            primary: Returns a coroutine making the original request.
+            hedge: Returns a coroutine making the duplicate request.
+
+        Returns:
+            The result of whichever request finished first.
+        """
+        delay = self._start_request()
+        if delay is None:
+            return await self._atimed(primary)
+
+        first = asyncio.ensure_future(self._atimed(primary))
+        try:
+            return await asyncio.wait_for(asyncio.shield(first), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        except BaseException:
+            first.cancel()
+            raise
+        if not self._spend_hedge():
+            return await first
+
+        second = asyncio.ensure_future(self._atimed(hedge))
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self._record_winner(hedged=task is second)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the hedging statistics.
+
+        Returns:
+            A dictionary with requests, hedges, hedge_wins, hedge_rate, win_rate and
+            the current hedge delay in seconds.
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins,
+                "hedge_rate": self._hedges / self._requests if self._requests else 0.0,
+                "win_rate": self._hedge_wins / self._hedges if self._hedges else 0.0,
+                "hedge_delay": self._hedge_delay(),
+            }
+
+    def _start_request(self) -> Optional[float]:
+        """
+        Count a new request and get the delay after which it should be hedged.
+
+        Returns:
+            The delay in seconds, or None if there are not enough samples to hedge yet.
+        """
+        with self._lock:
+            self._requests += 1
+            return self._hedge_delay()
+
+    def _hedge_delay(self) -> Optional[float]:
+        """The configured percentile of recent latencies, or None without enough samples. Must hold the lock."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return ordered[index]
+
+    def _spend_hedge(self) -> bool:
+        """Take one hedge from the budget if it allows it."""
+        with self._lock:
+            if self._hedges + 1 > self.max_hedge_rate * self._requests:
+                return False
+            self._hedges += 1
+            return True
+
+    def _record_winner(self, hedged: bool) -> None:
+        """Count the outcome of a hedged request."""
+        if hedged:
+            with self._lock:
+                self._hedge_wins += 1
+            logger.debug("Hedged request won.")
+
+    def _record_latency(self, seconds: float) -> None:
+        """Add a latency sample."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def _timed(self, func: Callable[[], Any]) -> Any:
+        """Run a request and record its latency if it succeeds."""
+        started = time.monotonic()
+        result = func()
+        self._record_latency(time.monotonic() - started)
+        return result
+
+    async def _atimed(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await a request and record its latency if it succeeds."""
+        started = time.monotonic()
+        result = await func()
+        self._record_latency(time.monotonic() - started)
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the executor for the synchronous path on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="rexia-hedge"
+                )
+            return self._executor
@@ -0,0 +1,270 @@
+"""Client-side rate limiting for ReXia.AI language models."""
+
+import time
+import asyncio
+import threading
+import logging
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long to sleep between checks when waiting for an in-flight slot to free up.
+_IN_FLIGHT_POLL_SECONDS = 0.05
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter with a concurrency cap, shared per endpoint.
+
+    Requests wait before they are sent until the requests-per-minute and
+    tokens-per-minute buckets have capacity and an in-flight slot is free. When the
+    provider returns a Retry-After header, `defer` pauses every caller sharing the
+    limiter, not just the one that was rejected.
+
+    Attributes:
+        requests_per_minute: Maximum requests per minute, or None for no limit.
+        tokens_per_minute: Maximum tokens per minute, or None for no limit.
+        max_in_flight: Maximum concurrent requests, or None for no limit.
+    """
+
+    _registry: Dict[Tuple[str, str], "RateLimiter"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        """
+        Initialize a RateLimiter instance.
+
+        Args:
+            requests_per_minute: Maximum requests per minute. Defaults to None (no limit).
+            tokens_per_minute: Maximum tokens per minute. Defaults to None (no limit).
+            max_in_flight: Maximum concurrent requests. Defaults to None (no limit).
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_in_flight = max_in_flight
+        self._condition = threading.Condition()
+        self._request_tokens = float(requests_per_minute or 0)
+        self._token_tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._in_flight = 0
+        self._requests = 0
+        self._throttled = 0
+        self._deferrals = 0
+        self._wait_seconds = 0.0
+
+    @classmethod
+    def for_endpoint(
+        cls,
+        base_url: str,
+        model: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> "RateLimiter":
+        """
+        Get the limiter shared by every client of an endpoint and model.
+
+        The first call for a base_url and model creates the limiter; later calls return
+        the same instance so that every agent draws from one quota.
+
+        Args:
+            base_url: The base URL of the endpoint.
+            model: The model name.
+            requests_per_minute: Maximum requests per minute. Defaults to None (no limit).
+            tokens_per_minute: Maximum tokens per minute. Defaults to None (no limit).
+            max_in_flight: Maximum concurrent requests. Defaults to None (no limit).
+
+        Returns:
+            RateLimiter: The shared limiter.
+        """
+        key = (base_url, model)
+        with cls._registry_lock:
+            limiter = cls._registry.get(key)
+            if limiter is None:
+                limiter = cls(requests_per_minute, tokens_per_minute, max_in_flight)
+                cls._registry[key] = limiter
+            elif (limiter.requests_per_minute, limiter.tokens_per_minute, limiter.max_in_flight) != (
+                requests_per_minute,
+                tokens_per_minute,
+                max_in_flight,
+            ):
+                logger.warning(
+                    f"Rate limiter for {model} at {base_url} already exists with different limits; "
+                    "using the existing limits."
+                )
+            return limiter
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until a request of the given size may be sent.
+
+        Every successful acquire must be paired with a call to release.
+
+        Args:
+            tokens: The estimated number of tokens the request will consume.
+        """
+        started = time.monotonic()
+        with self._condition:
+            while True:
+                wait = self._try_acquire(tokens)
+                if wait <= 0:
+                    self._record_wait(started)
+                    return
+                self._condition.wait(timeout=wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """
+        Wait without blocking the event loop until a request of the given size may be sent.
+
+        Every successful aacquire must be paired with a call to release.
+
+        Args:
+            tokens: The estimated number of tokens the request will consume.
+        """
+        started = time.monotonic()
+        while True:
+            with self._condition:
+                wait = self._try_acquire(tokens)
+                if wait <= 0:
+                    self._record_wait(started)
+                    return
+            await asyncio.sleep(wait)
+
+    def release(self) -> None:
+        """Release the in-flight slot taken by acquire or aacquire."""
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._condition.notify_all()
+
+    def defer(self, seconds: float) -> None:
+        """
+        Pause all requests through this limiter, e.g. after a Retry-After response.
+
+        Args:
+            seconds: How long to pause for.
+        """
+        with self._condition:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._deferrals += 1
+        logger.info(f"Rate limited by provider, pausing requests for {seconds:.1f}s")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the limiter statistics.
+
+        Returns:
+            A dictionary with the number of requests, how many had to wait, the total
+            time spent waiting, provider deferrals and current in-flight requests.
+        """
+        with self._condition:
+            return {
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "wait_seconds": self._wait_seconds,
+                "deferrals": self._deferrals,
+                "in_flight": self._in_flight,
+            }
+
+    def _try_acquire(self, tokens: int) -> float:
+        """
+        Take capacity for one request if it is available. Must hold the lock.
+
+        Args:
+            tokens: The estimated number of tokens the request will consume.
+
+        Returns:
+            0 if capacity was taken, otherwise the number of seconds to wait before trying again.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        waits = []
+
+        if self._blocked_until > now:
+            waits.append(self._blocked_until - now)
+        if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+            waits.append(_IN_FLIGHT_POLL_SECONDS)
+        if self.requests_per_minute and self._request_tokens < 1:
+            waits.append((1 - self._request_tokens) * 60.0 / self.requests_per_minute)
+        if self.tokens_per_minute:
+            # A single request larger than the whole budget would otherwise never be sent.
+            needed = min(tokens, self.tokens_per_minute)
+            if self._token_tokens < needed:
+                waits.append((needed - self._token_tokens) * 60.0 / self.tokens_per_minute)
+
+        if waits:
+            return max(waits)
+
+        if self.requests_per_minute:
+            self._request_tokens -= 1
+        if self.tokens_per_minute:
+            self._token_tokens -= min(tokens, self.tokens_per_minute)
+        self._in_flight += 1
+        self._requests += 1
+        return 0.0
+
+    def _record_wait(self, started: float) -> None:
+        """Record how long an acquire had to wait, if at all. Must hold the lock."""
+        waited = time.monotonic() - started
+        if waited > 0.001:
+            self._throttled += 1
+            self._wait_seconds += waited
+
+    def _refill(self, now: float) -> None:
+        """Refill both buckets for the time elapsed since the last refill. Must hold the lock."""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_minute:
+            self._request_tokens = min(
+                float(self.requests_per_minute),
+                self._request_tokens + elapsed * self.requests_per_minute / 60.0,
+            )
+        if self.tokens_per_minute:
+            self._token_tokens = min(
+                float(self.tokens_per_minute),
+                self._token_tokens + elapsed * self.tokens_per_minute / 60.0,
+            )
+
+    @staticmethod
+    def get_retry_after(error: Exception) -> Optional[float]:
+        """
+        Read the Retry-After delay from a provider error, if it has one.
+
+        Supports the `retry-after-ms` header and `retry-after` in seconds or as an HTTP date.
+
+        Args:
+            error: The exception raised by the API client.
+
+        Returns:
+            The delay in seconds, or None if the error carries no Retry-After header.
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            try:
+                return max(0.0, float(retry_after_ms) / 1000.0)
+            except ValueError:
+                pass
+
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -1,15 +1,112 @@
-from typing import Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+import hashlib
+import json
 from pydantic import Field
 from langchain_openai import ChatOpenAI
-from ..base import BaseTool
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from ..base import BaseTool, BaseCache
+from ..common import Utility, ContextWindow, PrefixTracker, ToolCache
+from .rate_limiter import RateLimiter
+from .hedging import HedgePolicy
+from tenacity import retry, Retrying, AsyncRetrying, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity.wait import wait_base
 import logging
 
 logger = logging.getLogger(__name__)
 
 class APICallError(Exception):
-    """Custom exception for API call errors."""
-    pass
+    """
+    Custom exception for API call errors.
+
+    Attributes:
+        retry_after: Seconds the provider asked us to wait before retrying, if it sent a Retry-After header.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+# The longest wait before a retry, whether backing off or honouring a provider's Retry-After.
+MAX_RETRY_WAIT = 60.0
+
+class wait_retry_after(wait_base):
+    """
+    Tenacity wait strategy that honours an APICallError's retry_after and otherwise defers to a fallback.
+
+    A Retry-After longer than max_wait is cut to max_wait, so a provider cannot park a caller for an hour.
+    """
+
+    def __init__(self, fallback: wait_base, max_wait: float = MAX_RETRY_WAIT):
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state) -> float:
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, self.max_wait)
+        return self.fallback(retry_state)
+
+# Shared by the sync and async paths so both retry in exactly the same way.
+# Tenacity runs the async variant with asyncio.sleep, so waiting never blocks the event loop.
+API_RETRY_POLICY = dict(
+    stop=stop_after_attempt(3),
+    wait=wait_retry_after(wait_exponential(multiplier=1, min=1, max=MAX_RETRY_WAIT)),
+    retry=retry_if_exception_type(APICallError),
+    before_sleep=lambda retry_state: logger.info(f"Retrying API call (attempt {retry_state.attempt_number})"),
+    reraise=True
+)
+
+JSON_SCHEMA = "json_schema"
+JSON_OBJECT = "json_object"
+GUIDED_JSON = "guided_json"
+STRUCTURED_OUTPUT_MODES = (JSON_SCHEMA, JSON_OBJECT, GUIDED_JSON)
+
+# Words that appear when a server rejects response_format or guided decoding parameters,
+# as opposed to other 400s such as an over-long prompt.
+STRUCTURED_OUTPUT_ERROR_HINTS = (
+    "response_format",
+    "json_schema",
+    "json_object",
+    "guided",
+    "grammar",
+    "unrecognized request argument",
+    "extra_body",
+    "not supported",
+    "unsupported",
+)
+
+# (base_url, model, mode) combinations whose server has rejected structured output.
+STRUCTURED_OUTPUT_UNSUPPORTED = set()
+
+def request_cache_key(
+    base_url: Any, model: Any, temperature: Any, max_tokens: Any, query: str
+) -> str:
+    """
+    Build the response cache key for a request.
+
+    The key covers everything that changes the completion: endpoint, model,
+    temperature, token limit and the prompt itself.
+
+    Args:
+        base_url: The endpoint (or endpoints) serving the request.
+        model: The model (or models) serving the request.
+        temperature: The sampling temperature.
+        max_tokens: The maximum number of tokens to generate.
+        query: The prompt.
+
+    Returns:
+        A hex digest identifying the request.
+    """
+    request = json.dumps(
+        [
+            base_url,
+            model,
+            temperature,
+            max_tokens,
+            hashlib.sha256(query.encode("utf-8")).hexdigest(),
+        ]
+    )
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
 
 class RexiaAIOpenAI(ChatOpenAI):
     """
@@ -17,9 +114,28 @@ class RexiaAIOpenAI(ChatOpenAI):
 
     Attributes:
         tools: A dictionary of tools available for the LLM.
+        cache: An optional response cache. Identical requests are served from it instead of the API.
+        rate_limiter: An optional client-side limiter applied before each request is sent.
+        hedging: An optional hedging policy that duplicates unusually slow requests.
+        streaming: Whether workers should stream responses and act on fields as they complete.
+        context_window: An optional token budget for the collaboration chat in worker prompts.
+        structured_output: How workers ask the server to constrain responses to the output schema:
+            "json_schema", "json_object" or "guided_json". None to rely on the prompt alone.
+        prefix_caching: Whether workers order prompts from most static to most volatile, so
+            consecutive prompts share a long prefix the server can serve from its KV cache.
+        prefix_tracker: Measures the prefix each prompt shares with recent prompts, if prefix caching is on.
+        tool_cache: An optional cache for the results of tools that declare a cache_ttl.
     """
 
     tools: Optional[Dict[str, BaseTool]] = Field(default_factory=dict)
+    cache: Optional[BaseCache] = None
+    rate_limiter: Optional[RateLimiter] = None
+    hedging: Optional[HedgePolicy] = None
+    context_window: Optional[ContextWindow] = None
+    structured_output: Optional[str] = None
+    prefix_caching: bool = False
+    prefix_tracker: Optional[PrefixTracker] = None
+    tool_cache: Optional[ToolCache] = None
 
     def __init__(
         self,
@@ -29,6 +145,17 @@ class RexiaAIOpenAI(ChatOpenAI):
         tools: Optional[Dict[str, BaseTool]] = None,
         api_key: Optional[str] = None,
         max_tokens: int = 4096,
+        cache: Optional[BaseCache] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hedging: Optional[HedgePolicy] = None,
+        streaming: bool = False,
+        context_window: Optional[ContextWindow] = None,
+        structured_output: Optional[str] = None,
+        prefix_caching: bool = False,
+        tool_cache: Optional[ToolCache] = None,
     ):
         """
         Initialize a LLM instance.
@@ -40,29 +167,95 @@ class RexiaAIOpenAI(ChatOpenAI):
             tools: A dictionary of tools available for the LLM. Defaults to None.
             api_key: The API key for the OpenAI API. Defaults to None.
             max_tokens: The maximum number of tokens to generate. Defaults to 4096.
+            cache: A cache for responses, e.g. InMemoryCache or SQLiteCache. Defaults to None (no caching).
+            requests_per_minute: Requests per minute allowed for this base_url and model. Defaults to None.
+            tokens_per_minute: Tokens per minute allowed for this base_url and model. Defaults to None.
+            max_in_flight: Concurrent requests allowed for this base_url and model. Defaults to None.
+            rate_limiter: An explicit limiter to use instead of the shared per-endpoint one. Defaults to None.
+            hedging: A HedgePolicy to duplicate unusually slow requests. Defaults to None (no hedging).
+            streaming: Whether workers should stream responses. Defaults to False.
+            context_window: A ContextWindow fitting the collaboration chat into a token budget
+                sized for this model. Defaults to None (include every message).
+            structured_output: "json_schema" for OpenAI style response_format, "json_object" for
+                llama.cpp servers, or "guided_json" for vLLM. If the server rejects it, requests
+                fall back to prompt-only JSON. Defaults to None.
+            prefix_caching: Whether workers put the static instructions, output structure and
+                tools before the task and chat, and shared prefix lengths are measured. Use with
+                servers that cache prompt prefixes, such as vLLM or llama.cpp. Defaults to False.
+            tool_cache: A ToolCache reusing the results of tools that declare a cache_ttl.
+                Defaults to None (tools are always called).
+
+        Raises:
+            ValueError: If the structured output mode is unknown.
         """
+        if structured_output is not None and structured_output not in STRUCTURED_OUTPUT_MODES:
+            raise ValueError(f"Unknown structured output mode: {structured_output}")
         super().__init__(
             base_url=base_url,
             model=model,
             temperature=temperature,
             api_key=api_key,
             max_tokens=max_tokens,
+            streaming=streaming,
         )
         self.tools = tools or {}
+        self.cache = cache
+        if rate_limiter is None and (requests_per_minute or tokens_per_minute or max_in_flight):
+            rate_limiter = RateLimiter.for_endpoint(
+                base_url,
+                model,
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+                max_in_flight=max_in_flight,
+            )
+        self.rate_limiter = rate_limiter
+        self.hedging = hedging
+        self.context_window = context_window
+        self.structured_output = structured_output
+        self.prefix_caching = prefix_caching
+        self.prefix_tracker = PrefixTracker() if prefix_caching else None
+        self.tool_cache = tool_cache
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=60),
-        retry=retry_if_exception_type(APICallError),
-        before_sleep=lambda retry_state: logger.info(f"Retrying API call (attempt {retry_state.attempt_number})"),
-        reraise=True
-    )
-    def invoke(self, query: str) -> Optional[str]:
+    def invoke(self, query: str, response_schema: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Perform inference using the language model.
 
+        If a cache is configured, a cached response for an identical request is returned
+        without calling the API.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        cache_key = self._cache_key(query) if self.cache is not None else None
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                logger.debug("Serving response from cache.")
+                return cached_response
+
+        response = self._invoke_with_retry(query, response_schema)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response)
+        return response
+
+    async def ainvoke(self, query: str, response_schema: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Perform inference using the language model without blocking the event loop.
+
+        If a cache is configured, a cached response for an identical request is returned
+        without calling the API.
+
         Args:
             query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
 
         Returns:
             The response from the language model.
@@ -70,9 +263,434 @@ class RexiaAIOpenAI(ChatOpenAI):
         Raises:
             APICallError: If there's an error in the API call.
         """
+        cache_key = self._cache_key(query) if self.cache is not None else None
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                logger.debug("Serving response from cache.")
+                return cached_response
+
+        response = await self._ainvoke_with_retry(query, response_schema)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response)
+        return response
+
+    def stream_text(self, query: str, response_schema: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Perform inference using the language model, yielding the response as it is generated.
+
+        Failures before the first chunk arrives are retried like invoke. Once text has been
+        yielded a failure is raised, since the caller has already consumed part of the response.
+        A cached response is yielded as a single chunk, and a completed stream is cached.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Yields:
+            str: Chunks of the response text.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        cache_key = self._cache_key(query) if self.cache is not None else None
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                logger.debug("Serving response from cache.")
+                yield cached_response
+                return
+
+        for attempt in Retrying(**API_RETRY_POLICY):
+            with attempt:
+                chunks = self._stream_once(query, response_schema)
+                first = next(chunks, None)
+
+        response = []
+        if first is not None:
+            response.append(first)
+            yield first
+            for chunk in chunks:
+                response.append(chunk)
+                yield chunk
+
+        if cache_key is not None:
+            self.cache.set(cache_key, "".join(response))
+
+    async def astream_text(
+        self, query: str, response_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously perform inference using the language model, yielding the response as it is generated.
+
+        Failures before the first chunk arrives are retried like ainvoke. A cached response
+        is yielded as a single chunk, and a completed stream is cached.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Yields:
+            str: Chunks of the response text.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        cache_key = self._cache_key(query) if self.cache is not None else None
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                logger.debug("Serving response from cache.")
+                yield cached_response
+                return
+
+        async for attempt in AsyncRetrying(**API_RETRY_POLICY):
+            with attempt:
+                chunks = self._astream_once(query, response_schema)
+                try:
+                    first = await chunks.__anext__()
+                except StopAsyncIteration:
+                    first = None
+
+        response = []
+        if first is not None:
+            response.append(first)
+            yield first
+            async for chunk in chunks:
+                response.append(chunk)
+                yield chunk
+
+        if cache_key is not None:
+            self.cache.set(cache_key, "".join(response))
+
+    def with_sampling(self, temperature: float, seed: Optional[int] = None) -> "RexiaAIOpenAI":
+        """
+        Get a copy of the model that samples with the given settings and has no response cache.
+
+        Used to draw several different responses to one prompt, which the cache or a low
+        temperature would otherwise make identical. The copy shares this model's API clients,
+        tools, rate limiter, hedging policy and prefix tracker.
+
+        Args:
+            temperature: The sampling temperature of the copy.
+            seed: The sampling seed of the copy, for servers that support one. Defaults to None.
+
+        Returns:
+            The copy of the model.
+        """
+        return self.copy(
+            update={
+                "temperature": temperature,
+                "seed": seed,
+                "cache": None,
+                "tools": self.tools,
+                "client": self.client,
+                "async_client": self.async_client,
+            }
+        )
+
+    @retry(**API_RETRY_POLICY)
+    def _invoke_with_retry(
+        self, query: str, response_schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Call the API, retrying with exponential backoff on failure.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        if self.hedging is not None:
+            return self.hedging.call(
+                lambda: self._invoke_once(query, response_schema),
+                lambda: self._invoke_once(query, response_schema),
+            )
+        return self._invoke_once(query, response_schema)
+
+    @retry(**API_RETRY_POLICY)
+    async def _ainvoke_with_retry(
+        self, query: str, response_schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Asynchronously call the API, retrying with exponential backoff on failure.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        if self.hedging is not None:
+            return await self.hedging.acall(
+                lambda: self._ainvoke_once(query, response_schema),
+                lambda: self._ainvoke_once(query, response_schema),
+            )
+        return await self._ainvoke_once(query, response_schema)
+
+    def _invoke_once(self, query: str, response_schema: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Make a single API call, without retrying.
+
+        If the server rejects the structured output parameters, the call is repeated
+        without them and they are not sent to this endpoint again.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._estimate_request_tokens(query))
+        self._record_prompt(query)
         try:
-            response = super().invoke(query)
+            kwargs = self._structured_output_kwargs(response_schema)
+            try:
+                response = super().invoke(query, **kwargs)
+            except Exception as e:
+                if not self._structured_output_rejected(e, kwargs):
+                    raise
+                response = super().invoke(query)
             return response.content
         except Exception as e:
-            logger.error(f"API call failed: {str(e)}")
-            raise APICallError(f"Failed to invoke API: {str(e)}")
\ No newline at end of file
+            raise self._api_call_error(e)
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+
+    async def _ainvoke_once(
+        self, query: str, response_schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Asynchronously make a single API call, without retrying.
+
+        If the server rejects the structured output parameters, the call is repeated
+        without them and they are not sent to this endpoint again.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(self._estimate_request_tokens(query))
+        self._record_prompt(query)
+        try:
+            kwargs = self._structured_output_kwargs(response_schema)
+            try:
+                response = await super().ainvoke(query, **kwargs)
+            except Exception as e:
+                if not self._structured_output_rejected(e, kwargs):
+                    raise
+                response = await super().ainvoke(query)
+            return response.content
+        except Exception as e:
+            raise self._api_call_error(e)
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+
+    def _stream_once(self, query: str, response_schema: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Make a single streaming API call, without retrying.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Yields:
+            str: Chunks of the response text.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._estimate_request_tokens(query))
+        self._record_prompt(query)
+        try:
+            kwargs = self._structured_output_kwargs(response_schema)
+            streamed = False
+            try:
+                for chunk in super().stream(query, **kwargs):
+                    if chunk.content:
+                        streamed = True
+                        yield chunk.content
+            except Exception as e:
+                if streamed or not self._structured_output_rejected(e, kwargs):
+                    raise
+                for chunk in super().stream(query):
+                    if chunk.content:
+                        yield chunk.content
+        except Exception as e:
+            raise self._api_call_error(e)
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+
+    async def _astream_once(
+        self, query: str, response_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously make a single streaming API call, without retrying.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, if structured output is enabled.
+
+        Yields:
+            str: Chunks of the response text.
+
+        Raises:
+            APICallError: If there's an error in the API call.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(self._estimate_request_tokens(query))
+        self._record_prompt(query)
+        try:
+            kwargs = self._structured_output_kwargs(response_schema)
+            streamed = False
+            try:
+                async for chunk in super().astream(query, **kwargs):
+                    if chunk.content:
+                        streamed = True
+                        yield chunk.content
+            except Exception as e:
+                if streamed or not self._structured_output_rejected(e, kwargs):
+                    raise
+                async for chunk in super().astream(query):
+                    if chunk.content:
+                        yield chunk.content
+        except Exception as e:
+            raise self._api_call_error(e)
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+
+    def _record_prompt(self, query: str) -> None:
+        """
+        Record the prompt of a request about to be sent, if prefixes are being measured.
+
+        Args:
+            query: The prompt.
+        """
+        if self.prefix_tracker is not None:
+            self.prefix_tracker.record(query)
+
+    def _structured_output_kwargs(self, response_schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the request parameters that constrain the response to a JSON schema.
+
+        Args:
+            response_schema: The JSON schema, or None for an unconstrained response.
+
+        Returns:
+            The extra parameters for the completion request. Empty if structured output is
+            disabled, no schema was given, or this endpoint has rejected it before.
+        """
+        if self.structured_output is None or response_schema is None:
+            return {}
+        if (self.openai_api_base, self.model_name, self.structured_output) in STRUCTURED_OUTPUT_UNSUPPORTED:
+            return {}
+        if self.structured_output == JSON_SCHEMA:
+            return {
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {"name": "rexia_ai_response", "schema": response_schema},
+                }
+            }
+        if self.structured_output == JSON_OBJECT:
+            return {"response_format": {"type": "json_object", "schema": response_schema}}
+        return {"extra_body": {"guided_json": response_schema}}
+
+    def _structured_output_rejected(self, error: Exception, kwargs: Dict[str, Any]) -> bool:
+        """
+        Check whether a failed call was rejected because the server does not support structured output.
+
+        If so, structured output is switched off for this endpoint so later calls skip straight
+        to the unconstrained request.
+
+        Args:
+            error: The exception raised by the API client.
+            kwargs: The structured output parameters sent with the request.
+
+        Returns:
+            bool: True if the call should be repeated without structured output.
+        """
+        if not kwargs or getattr(error, "status_code", None) not in (400, 404, 422):
+            return False
+        message = str(error).lower()
+        if not any(hint in message for hint in STRUCTURED_OUTPUT_ERROR_HINTS):
+            return False
+        logger.warning(
+            f"{self.openai_api_base} does not support {self.structured_output} structured output, "
+            "falling back to prompt-only JSON."
+        )
+        STRUCTURED_OUTPUT_UNSUPPORTED.add((self.openai_api_base, self.model_name, self.structured_output))
+        return True
+
+    def _api_call_error(self, error: Exception) -> APICallError:
+        """
+        Wrap a failed API call in an APICallError.
+
+        If the provider sent a Retry-After header, every request sharing the rate
+        limiter is paused for that long and the retry waits for it too.
+
+        Args:
+            error: The exception raised by the API client.
+
+        Returns:
+            APICallError: The error to raise.
+        """
+        logger.error(f"API call failed: {str(error)}")
+        retry_after = RateLimiter.get_retry_after(error)
+        if retry_after is not None and self.rate_limiter is not None:
+            self.rate_limiter.defer(min(retry_after, MAX_RETRY_WAIT))
+        return APICallError(f"Failed to invoke API: {str(error)}", retry_after=retry_after)
+
+    def _estimate_request_tokens(self, query: str) -> int:
+        """
+        Estimate the tokens a request counts against a tokens-per-minute quota.
+
+        Providers reserve the prompt plus max_tokens when the request arrives, so both are counted.
+
+        Args:
+            query: The query to perform inference on.
+
+        Returns:
+            int: The estimated token count.
+        """
+        return Utility.estimate_tokens(query) + (self.max_tokens or 0)
+
+    def _cache_key(self, query: str) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            query: The query to perform inference on.
+
+        Returns:
+            A hex digest identifying the request.
+        """
+        return request_cache_key(
+            self.openai_api_base, self.model_name, self.temperature, self.max_tokens, query
+        )
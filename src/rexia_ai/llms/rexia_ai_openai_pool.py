@@ -0,0 +1,584 @@
+"""RexiaAIOpenAIPool class for ReXia.AI - load balancing and failover across OpenAI compatible endpoints."""
+
+import copy
+import time
+import asyncio
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from ..base import BaseTool, BaseCache
+from ..common import ContextWindow, PrefixTracker, ToolCache
+from .rexia_ai_openai import RexiaAIOpenAI, APICallError, request_cache_key
+from .hedging import HedgePolicy
+
+logger = logging.getLogger(__name__)
+
+LEAST_OUTSTANDING = "least_outstanding"
+EWMA_LATENCY = "ewma_latency"
+
+
+@dataclass(eq=False)
+class EndpointState:
+    """Dataclass to store the load and health of one endpoint in a pool."""
+
+    llm: RexiaAIOpenAI
+    outstanding: int = 0
+    ewma_latency: Optional[float] = None
+    consecutive_failures: int = 0
+    opened_at: Optional[float] = None
+    trial_in_flight: bool = False
+    requests: int = 0
+    failures: int = 0
+
+
+class RexiaAIOpenAIPool:
+    """
+    A pool of OpenAI compatible endpoints that can be used anywhere a RexiaAIOpenAI is accepted.
+
+    Each request goes to the endpoint with the fewest outstanding requests, or the lowest
+    exponentially weighted moving average (EWMA) latency. An endpoint that fails
+    `failure_threshold` times in a row is ejected by a circuit breaker. After
+    `recovery_timeout` seconds it is given a single trial request before it rejoins the
+    pool. A failed request is retried on a different endpoint rather than the same one.
+
+    Attributes:
+        endpoints: The RexiaAIOpenAI instances in the pool.
+        strategy: "least_outstanding" or "ewma_latency".
+        cache: An optional response cache shared by the whole pool.
+        failure_threshold: Consecutive failures before an endpoint is ejected.
+        recovery_timeout: Seconds an ejected endpoint waits before its trial request.
+        max_attempts: Attempts per request, each on a different endpoint where possible.
+        hedging: An optional hedging policy. Hedges go to a different endpoint than the original request.
+        streaming: Whether workers should stream responses and act on fields as they complete.
+        context_window: An optional token budget for the collaboration chat in worker prompts.
+        prefix_caching: Whether workers order prompts for server-side prefix caching.
+        tool_cache: An optional cache for the results of tools that declare a cache_ttl.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[RexiaAIOpenAI],
+        strategy: str = LEAST_OUTSTANDING,
+        tools: Optional[Dict[str, BaseTool]] = None,
+        cache: Optional[BaseCache] = None,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+        max_attempts: Optional[int] = None,
+        ewma_alpha: float = 0.3,
+        hedging: Optional[HedgePolicy] = None,
+        streaming: bool = False,
+        context_window: Optional[ContextWindow] = None,
+        prefix_caching: bool = False,
+        tool_cache: Optional[ToolCache] = None,
+    ):
+        """
+        Initialize a RexiaAIOpenAIPool instance.
+
+        Args:
+            endpoints: The RexiaAIOpenAI instances to balance across.
+            strategy: "least_outstanding" or "ewma_latency". Defaults to "least_outstanding".
+            tools: A dictionary of tools available to the LLM. Shared with every endpoint. Defaults to None.
+            cache: A cache for responses shared by the whole pool. Defaults to None (no caching).
+            failure_threshold: Consecutive failures before an endpoint is ejected. Defaults to 3.
+            recovery_timeout: Seconds before an ejected endpoint is tried again. Defaults to 30.
+            max_attempts: Attempts per request. Defaults to the number of endpoints, and at least 2.
+            ewma_alpha: Weight of the newest latency sample in the moving average. Defaults to 0.3.
+            hedging: A HedgePolicy to duplicate unusually slow requests. Defaults to None (no hedging).
+            streaming: Whether workers should stream responses. Defaults to False.
+            context_window: A ContextWindow sized for the smallest model in the pool. Defaults to None.
+            prefix_caching: Whether workers put the static parts of prompts first. Shared prefix
+                lengths are then measured per endpoint, since each server has its own cache.
+                Defaults to False.
+            tool_cache: A ToolCache reusing the results of tools that declare a cache_ttl.
+                Defaults to None (tools are always called).
+
+        Raises:
+            ValueError: If no endpoints are given or the strategy is unknown.
+        """
+        if not endpoints:
+            raise ValueError("RexiaAIOpenAIPool needs at least one endpoint")
+        if strategy not in (LEAST_OUTSTANDING, EWMA_LATENCY):
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+        self.endpoints = list(endpoints)
+        self.strategy = strategy
+        self.cache = cache
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.max_attempts = max_attempts or max(2, len(self.endpoints))
+        self.ewma_alpha = ewma_alpha
+        self.hedging = hedging
+        self.streaming = streaming
+        self.context_window = context_window
+        self.prefix_caching = prefix_caching
+        if prefix_caching:
+            for llm in self.endpoints:
+                if llm.prefix_tracker is None:
+                    llm.prefix_tracker = PrefixTracker()
+        self.tool_cache = tool_cache
+        self._states = [EndpointState(llm=llm) for llm in self.endpoints]
+        self._lock = threading.Lock()
+        self._sampling: Optional[Tuple[float, Optional[int]]] = None
+        self._tools: Dict[str, BaseTool] = {}
+        self.tools = tools if tools is not None else dict(self.endpoints[0].tools or {})
+
+    @property
+    def tools(self) -> Dict[str, BaseTool]:
+        """The tools available to the LLM, shared by every endpoint in the pool."""
+        return self._tools
+
+    @tools.setter
+    def tools(self, tools: Optional[Dict[str, BaseTool]]) -> None:
+        self._tools = tools or {}
+        for llm in self.endpoints:
+            llm.tools = self._tools
+
+    @property
+    def structured_output(self) -> Optional[str]:
+        """The structured output mode of the first endpoint that has one. Each endpoint uses its own mode."""
+        return next((llm.structured_output for llm in self.endpoints if llm.structured_output), None)
+
+    def invoke(self, query: str, response_schema: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Perform inference on the best available endpoint, failing over to others on error.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, on endpoints with structured output enabled.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If every attempt fails.
+        """
+        cache_key = self._cache_key(query) if self.cache is not None else None
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+
+        tried: List[EndpointState] = []
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_attempts):
+            try:
+                if self.hedging is not None:
+                    response = self.hedging.call(
+                        lambda: self._attempt(query, tried, attempt, response_schema),
+                        lambda: self._attempt(query, tried, attempt, response_schema),
+                    )
+                else:
+                    response = self._attempt(query, tried, attempt, response_schema)
+            except APICallError as e:
+                last_error = e
+                continue
+            if cache_key is not None:
+                self.cache.set(cache_key, response)
+            return response
+
+        raise APICallError(f"All endpoints failed: {last_error}")
+
+    async def ainvoke(self, query: str, response_schema: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Asynchronously perform inference on the best available endpoint, failing over to others on error.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, on endpoints with structured output enabled.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If every attempt fails.
+        """
+        cache_key = self._cache_key(query) if self.cache is not None else None
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+
+        tried: List[EndpointState] = []
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_attempts):
+            try:
+                if self.hedging is not None:
+                    response = await self.hedging.acall(
+                        lambda: self._aattempt(query, tried, attempt, response_schema),
+                        lambda: self._aattempt(query, tried, attempt, response_schema),
+                    )
+                else:
+                    response = await self._aattempt(query, tried, attempt, response_schema)
+            except APICallError as e:
+                last_error = e
+                continue
+            if cache_key is not None:
+                self.cache.set(cache_key, response)
+            return response
+
+        raise APICallError(f"All endpoints failed: {last_error}")
+
+    def stream_text(self, query: str, response_schema: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Perform inference on the best available endpoint, yielding the response as it is generated.
+
+        Failures before the first chunk arrives fail over to another endpoint like invoke. Once
+        text has been yielded a failure is raised, since the caller has already consumed part
+        of the response.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, on endpoints with structured output enabled.
+
+        Yields:
+            str: Chunks of the response text.
+
+        Raises:
+            APICallError: If every attempt fails.
+        """
+        cache_key = self._cache_key(query) if self.cache is not None else None
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                yield cached_response
+                return
+
+        tried: List[EndpointState] = []
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_attempts):
+            state, reused = self._acquire(tried)
+            if reused:
+                time.sleep(self._backoff(attempt))
+            started = time.monotonic()
+            chunks = self._sampled(state.llm)._stream_once(query, response_schema)
+            try:
+                first = next(chunks, None)
+            except APICallError as e:
+                self._release(state, started, success=False)
+                logger.warning(f"Endpoint {state.llm.openai_api_base} failed: {e}")
+                last_error = e
+                continue
+            except BaseException:
+                self._release(state, started, success=None)
+                raise
+            break
+        else:
+            raise APICallError(f"All endpoints failed: {last_error}")
+
+        response = []
+        success = None
+        try:
+            if first is not None:
+                response.append(first)
+                yield first
+                for chunk in chunks:
+                    response.append(chunk)
+                    yield chunk
+            success = True
+        except APICallError:
+            success = False
+            raise
+        finally:
+            self._release(state, started, success=success)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, "".join(response))
+
+    async def astream_text(
+        self, query: str, response_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously perform inference on the best available endpoint, yielding the response as it is generated.
+
+        Failures before the first chunk arrives fail over to another endpoint like ainvoke.
+
+        Args:
+            query: The query to perform inference on.
+            response_schema: A JSON schema to constrain the response to, on endpoints with structured output enabled.
+
+        Yields:
+            str: Chunks of the response text.
+
+        Raises:
+            APICallError: If every attempt fails.
+        """
+        cache_key = self._cache_key(query) if self.cache is not None else None
+        if cache_key is not None:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                yield cached_response
+                return
+
+        tried: List[EndpointState] = []
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_attempts):
+            state, reused = self._acquire(tried)
+            started = time.monotonic()
+            chunks = self._sampled(state.llm)._astream_once(query, response_schema)
+            try:
+                if reused:
+                    await asyncio.sleep(self._backoff(attempt))
+                    started = time.monotonic()
+                first = await chunks.__anext__()
+            except StopAsyncIteration:
+                first = None
+            except APICallError as e:
+                self._release(state, started, success=False)
+                logger.warning(f"Endpoint {state.llm.openai_api_base} failed: {e}")
+                last_error = e
+                continue
+            except BaseException:
+                self._release(state, started, success=None)
+                raise
+            break
+        else:
+            raise APICallError(f"All endpoints failed: {last_error}")
+
+        response = []
+        success = None
+        try:
+            if first is not None:
+                response.append(first)
+                yield first
+                async for chunk in chunks:
+                    response.append(chunk)
+                    yield chunk
+            success = True
+        except APICallError:
+            success = False
+            raise
+        finally:
+            self._release(state, started, success=success)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, "".join(response))
+
+    def _attempt(
+        self,
+        query: str,
+        tried: List[EndpointState],
+        attempt: int,
+        response_schema: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Make one attempt on the best endpoint not yet tried for this request.
+
+        Args:
+            query: The query to perform inference on.
+            tried: Endpoints already attempted for this request. The chosen endpoint is added to it.
+            attempt: The attempt number, used for backoff when an endpoint has to be reused.
+            response_schema: A JSON schema to constrain the response to, if the endpoint supports it.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If the call fails.
+        """
+        state, reused = self._acquire(tried)
+        if reused:
+            time.sleep(self._backoff(attempt))
+        started = time.monotonic()
+        try:
+            response = self._sampled(state.llm)._invoke_once(query, response_schema)
+        except APICallError as e:
+            self._release(state, started, success=False)
+            logger.warning(f"Endpoint {state.llm.openai_api_base} failed: {e}")
+            raise
+        except BaseException:
+            self._release(state, started, success=None)
+            raise
+        self._release(state, started, success=True)
+        return response
+
+    async def _aattempt(
+        self,
+        query: str,
+        tried: List[EndpointState],
+        attempt: int,
+        response_schema: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Asynchronously make one attempt on the best endpoint not yet tried for this request.
+
+        Args:
+            query: The query to perform inference on.
+            tried: Endpoints already attempted for this request. The chosen endpoint is added to it.
+            attempt: The attempt number, used for backoff when an endpoint has to be reused.
+            response_schema: A JSON schema to constrain the response to, if the endpoint supports it.
+
+        Returns:
+            The response from the language model.
+
+        Raises:
+            APICallError: If the call fails.
+        """
+        state, reused = self._acquire(tried)
+        started = time.monotonic()
+        try:
+            if reused:
+                await asyncio.sleep(self._backoff(attempt))
+                started = time.monotonic()
+            response = await self._sampled(state.llm)._ainvoke_once(query, response_schema)
+        except APICallError as e:
+            self._release(state, started, success=False)
+            logger.warning(f"Endpoint {state.llm.openai_api_base} failed: {e}")
+            raise
+        except BaseException:
+            # Cancellation, e.g. of a losing hedge, is not the endpoint's fault.
+            self._release(state, started, success=None)
+            raise
+        self._release(state, started, success=True)
+        return response
+
+    def with_sampling(self, temperature: float, seed: Optional[int] = None) -> "RexiaAIOpenAIPool":
+        """
+        Get a view of the pool that samples with the given settings and has no response cache.
+
+        The view shares this pool's endpoints, their load and health, and its tools. Each
+        request it makes goes to a copy of the chosen endpoint from RexiaAIOpenAI.with_sampling.
+
+        Args:
+            temperature: The sampling temperature of the view.
+            seed: The sampling seed of the view, for servers that support one. Defaults to None.
+
+        Returns:
+            The view of the pool.
+        """
+        pool = copy.copy(self)
+        pool.cache = None
+        pool._sampling = (temperature, seed)
+        return pool
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get the load and health of every endpoint.
+
+        Returns:
+            A list with one dictionary per endpoint.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "base_url": state.llm.openai_api_base,
+                    "model": state.llm.model_name,
+                    "healthy": self._is_closed(state),
+                    "available": self._is_available(state, now),
+                    "outstanding": state.outstanding,
+                    "ewma_latency": state.ewma_latency,
+                    "requests": state.requests,
+                    "failures": state.failures,
+                    "shared_prefix": state.llm.prefix_tracker.get_stats() if state.llm.prefix_tracker else None,
+                }
+                for state in self._states
+            ]
+
+    def _acquire(self, tried: List[EndpointState]) -> Tuple[EndpointState, bool]:
+        """
+        Choose an endpoint for the next attempt and mark a request as outstanding on it.
+
+        Healthy endpoints not yet tried for this request come first, then any healthy
+        endpoint. If every circuit is open, the least recently ejected endpoint is used
+        rather than failing outright.
+
+        Args:
+            tried: Endpoints already attempted for this request. The chosen endpoint is added to it.
+
+        Returns:
+            Tuple[EndpointState, bool]: The chosen endpoint, and whether it was already tried.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [s for s in self._states if self._is_available(s, now)]
+            candidates = [s for s in available if s not in tried] or available
+            if candidates:
+                state = min(candidates, key=self._load)
+            else:
+                state = min(self._states, key=lambda s: s.opened_at or 0.0)
+            if not self._is_closed(state):
+                state.trial_in_flight = True
+            state.outstanding += 1
+            state.requests += 1
+            reused = state in tried
+            tried.append(state)
+            return state, reused
+
+    def _release(self, state: EndpointState, started: float, success: Optional[bool]) -> None:
+        """
+        Record the outcome of a request and update the endpoint's circuit breaker.
+
+        Args:
+            state: The endpoint that served the request.
+            started: The monotonic time the request started.
+            success: True on success, False on failure, None if the request was abandoned.
+        """
+        latency = time.monotonic() - started
+        with self._lock:
+            state.outstanding = max(0, state.outstanding - 1)
+            state.trial_in_flight = False
+            if success is None:
+                return
+            if success:
+                state.ewma_latency = (
+                    latency
+                    if state.ewma_latency is None
+                    else self.ewma_alpha * latency + (1 - self.ewma_alpha) * state.ewma_latency
+                )
+                state.consecutive_failures = 0
+                state.opened_at = None
+                return
+            state.failures += 1
+            state.consecutive_failures += 1
+            if state.consecutive_failures >= self.failure_threshold:
+                if state.opened_at is None:
+                    logger.warning(f"Ejecting unhealthy endpoint {state.llm.openai_api_base}")
+                state.opened_at = time.monotonic()
+
+    def _sampled(self, llm: RexiaAIOpenAI) -> RexiaAIOpenAI:
+        """The endpoint's model, with this view's sampling settings if it came from with_sampling."""
+        if self._sampling is None:
+            return llm
+        return llm.with_sampling(*self._sampling)
+
+    def _is_closed(self, state: EndpointState) -> bool:
+        """Whether the endpoint's circuit is closed, i.e. it is considered healthy."""
+        return state.opened_at is None
+
+    def _is_available(self, state: EndpointState, now: float) -> bool:
+        """Whether the endpoint may take a request: healthy, or due a single trial request."""
+        if self._is_closed(state):
+            return True
+        return not state.trial_in_flight and now - state.opened_at >= self.recovery_timeout
+
+    def _load(self, state: EndpointState) -> tuple:
+        """Sort key for choosing an endpoint under the configured strategy. Lower is better."""
+        if self.strategy == EWMA_LATENCY:
+            # Endpoints without samples sort first so that every replica gets measured.
+            return ((state.ewma_latency or 0.0) * (state.outstanding + 1), state.outstanding)
+        return (state.outstanding, state.ewma_latency or 0.0)
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Seconds to wait before reusing an endpoint that already failed this request."""
+        return min(60.0, 2.0 ** attempt)
+
+    def _cache_key(self, query: str) -> str:
+        """
+        Build the cache key for a request. Every endpoint in the pool shares one entry.
+
+        Args:
+            query: The query to perform inference on.
+
+        Returns:
+            A hex digest identifying the request.
+        """
+        first = self.endpoints[0]
+        return request_cache_key(
+            sorted(llm.openai_api_base or "" for llm in self.endpoints),
+            sorted(llm.model_name for llm in self.endpoints),
+            first.temperature,
+            first.max_tokens,
+            query,
+        )
@@ -2,5 +2,6 @@
 
 from .output_structure import LLMOutput
 from .rexia_ai_response import RexiaAIResponse
+from .streaming_parser import StreamingResponseParser
 
-__all__ = ["LLMOutput", "RexiaAIResponse"]
\ No newline at end of file
+__all__ = ["LLMOutput", "RexiaAIResponse", "StreamingResponseParser"]
\ No newline at end of file
@@ -24,6 +24,10 @@ class LLMOutput:
             '        "Step 2 of the plan",\n'
             '        "Add more steps as needed"\n'
             "    ],\n"
+            '    "tool_calls": [\n'
+            '        {"name": "First tool to call, if any", "parameters": {"argument": "value"}},\n'
+            '        {"name": "Leave this array empty if no tools were used", "parameters": {}}\n'
+            "    ],\n"
             '    "answer": [\n'
             '        "First line",\n'
             '        "Second line",\n'
@@ -35,11 +39,6 @@ class LLMOutput:
             '        "First step in the reasoning process",\n'
             '        "Second step in the reasoning process",\n'
             '        "Add more steps as needed"\n'
-            "    ],\n"
-            '    "tool_calls": [\n'
-            '        "First tool call if any",\n'
-            '        "Second tool call if any",\n'
-            '        "Leave this array empty if no tools were used"\n'
             "    ]\n"
             "}"
         )
@@ -58,13 +57,23 @@ class LLMOutput:
             "properties": {
                 "question": {"type": "string"},
                 "plan": {"type": "array", "items": {"type": "string"}},
+                "tool_calls": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "parameters": {"type": "object"},
+                        },
+                        "required": ["name", "parameters"],
+                    },
+                },
                 "answer": {
                     "type": "array",
                     "items": {"oneOf": [{"type": "string"}, {"type": "object"}]},
                 },
                 "confidence_score": {"type": "number"},
                 "chain_of_reasoning": {"type": "array", "items": {"type": "string"}},
-                "tool_calls": {"type": "array", "items": {"type": "string"}},
             },
             "required": [
                 "question",
@@ -74,6 +83,7 @@ class LLMOutput:
                 "plan",
                 "tool_calls",
             ],
+            "additionalProperties": False,
         }
 
         return schema
@@ -1,5 +1,6 @@
 """RexiaAIResponse class for ReXia.AI."""
 
+import json
 import json5
 from typing import Any, Dict, List, Optional, Union
 
@@ -36,7 +37,8 @@ class RexiaAIResponse:
     def from_json(cls, json_data: Union[str, dict]) -> "RexiaAIResponse":
         """
         Create a RexiaAIResponse instance from a JSON string or dictionary.
-        Preserves the original formatting of the JSON string.
+        Preserves the original formatting of the JSON string. Strict JSON is parsed with
+        the C-accelerated json module, and json5 is only used if that fails.
 
         Args:
             json_data (Union[str, dict]): The JSON string or dictionary representing the response.
@@ -50,9 +52,12 @@ class RexiaAIResponse:
 
         if isinstance(json_data, str):
             try:
-                parsed_data = json5.loads(json_data)
-            except:
-                raise ValueError("Invalid JSON input")
+                parsed_data = json.loads(json_data)
+            except ValueError:
+                try:
+                    parsed_data = json5.loads(json_data)
+                except:
+                    raise ValueError("Invalid JSON input")
         elif isinstance(json_data, dict):
             parsed_data = json_data
         
@@ -99,8 +104,8 @@ class RexiaAIResponse:
         """
         dict_repr = self.to_dict()
         
-        # Use json.dumps for consistent formatting of other fields
-        return json5.dumps(dict_repr, indent=4, ensure_ascii=False)
+        # Strict JSON, so whatever parses this message later takes the fast path
+        return json.dumps(dict_repr, indent=4, ensure_ascii=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """
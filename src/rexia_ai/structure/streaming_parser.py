@@ -0,0 +1,159 @@
+"""Incremental parser for streamed ReXia.AI responses."""
+
+import json
+import json5
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from .rexia_ai_response import RexiaAIResponse
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingResponseParser:
+    """
+    Parses the LLMOutput structure from a stream of text chunks.
+
+    Each top-level field of the JSON object is returned as soon as its value closes,
+    so callers can act on, say, the plan or tool calls while the model is still writing
+    the rest of the response. Text before the opening brace, such as a markdown fence,
+    is ignored.
+
+    Attributes:
+        fields: The top-level fields parsed so far.
+    """
+
+    def __init__(self):
+        """Initialize a StreamingResponseParser instance."""
+        self.fields: Dict[str, Any] = {}
+        self._chunks: List[str] = []
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._expect_key = False
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._done = False
+
+    @property
+    def text(self) -> str:
+        """The full text received so far."""
+        return "".join(self._chunks)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the top-level object has closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add a chunk of streamed text.
+
+        Args:
+            chunk: The next piece of the model's response.
+
+        Returns:
+            List[Tuple[str, Any]]: The fields that closed in this chunk, as (name, value) pairs, in order.
+        """
+        self._chunks.append(chunk)
+        if self._done:
+            return []
+        self._buffer += chunk
+        completed = []
+
+        buffer = self._buffer
+        for i in range(self._pos, len(buffer)):
+            char = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._close_string(i, completed)
+                continue
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._expect_key = True
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    self._close_value(i + 1, completed)
+                elif self._depth == 0:
+                    self._close_value(i, completed)
+                    self._done = True
+                    break
+            elif self._depth == 1:
+                if char == ":" and self._key is not None:
+                    self._value_start = i + 1
+                elif char == ",":
+                    self._close_value(i, completed)
+                    self._expect_key = True
+
+        # Only the unscanned tail and the current value need keeping.
+        keep_from = min(
+            i for i in (self._value_start, self._string_start if self._in_string else None, len(buffer))
+            if i is not None
+        )
+        self._buffer = buffer[keep_from:]
+        self._pos = len(buffer) - keep_from
+        if self._value_start is not None:
+            self._value_start -= keep_from
+        if self._in_string:
+            self._string_start -= keep_from
+        return completed
+
+    def to_response(self) -> RexiaAIResponse:
+        """
+        Build a RexiaAIResponse from the fields parsed so far.
+
+        Returns:
+            RexiaAIResponse: The response, with missing fields left at their defaults.
+        """
+        return RexiaAIResponse.from_json(self.fields)
+
+    def _close_string(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        """Handle a string closing at the top level, which is either a key or a value."""
+        if self._expect_key:
+            try:
+                self._key = json.loads(self._buffer[self._string_start : end + 1])
+            except ValueError:
+                self._key = None
+            self._expect_key = False
+            self._value_start = None
+        else:
+            self._close_value(end + 1, completed)
+
+    def _close_value(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        """Parse the current top-level value if it has not been emitted yet."""
+        if self._key is None or self._value_start is None:
+            return
+        raw = self._buffer[self._value_start : end].strip()
+        key = self._key
+        self._key = None
+        self._value_start = None
+        if not raw:
+            return
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            try:
+                value = json5.loads(raw)
+            except ValueError:
+                logger.debug(f"Could not parse streamed field {key}")
+                return
+        self.fields[key] = value
+        completed.append((key, value))
@@ -3,6 +3,7 @@
 from .google_search import RexiaAIGoogleSearch
 from .image_analysis import RexiaAIImageAnalysis
 from .youtube_video_analysis import RexiaAIYoutubeVideoAnalysis
+from .alpha_vantage_client import AlphaVantageClient
 from .alpha_vantage import (
     RexiaAIAlphaVantageExchangeRate,
     RexiaAIAlphaVantageMarketNewsSentiment,
@@ -17,6 +18,7 @@ from .query_knowledge_base import RexiaAIQueryKnowledgeBase
 __all__ = [
     "RexiaAIGoogleSearch",
     "RexiaAIImageAnalysis",
+    "AlphaVantageClient",
     "RexiaAIAlphaVantageExchangeRate",
     "RexiaAIAlphaVantageMarketNewsSentiment",
     "RexiaAIAlphaVantageQuoteEndpoint",
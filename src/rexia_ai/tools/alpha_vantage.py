@@ -3,9 +3,9 @@ Credit to the original authors who did most of the work. Should not be used with
 can handle very large datasets being returned."""
 
 import logging
-from typing import Dict, List
-from langchain_community.utilities.alpha_vantage import AlphaVantageAPIWrapper
+from typing import Dict, List, Optional
 from ..base import BaseTool
+from .alpha_vantage_client import AlphaVantageClient
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -20,6 +20,10 @@ class RexiaAIAlphaVantageSearchSymbols(BaseTool):
     ----------
     api_key : str
         The API key for AlphaVantage.
+    client : AlphaVantageClient
+        The client shared by every tool using the API key.
+    cache_ttl : float
+        Seconds a ToolCache may reuse a result.
 
     Methods
     -------
@@ -31,7 +35,9 @@ class RexiaAIAlphaVantageSearchSymbols(BaseTool):
         Return the tool as a dictionary object for ReXia.AI.
     """
 
-    def __init__(self, api_key: str):
+    cache_ttl = 86400.0
+
+    def __init__(self, api_key: str, client: Optional[AlphaVantageClient] = None):
         """
         Constructs all the necessary attributes for the RexiaAIAlphaVantageSearchSymbols object.
 
@@ -39,6 +45,8 @@ class RexiaAIAlphaVantageSearchSymbols(BaseTool):
         ----------
             api_key : str
                 The API key for AlphaVantage.
+            client : AlphaVantageClient, optional
+                The client to send requests through. Defaults to the client shared by the API key.
         """
         super().__init__(
             name="search_symbols",
@@ -46,7 +54,7 @@ class RexiaAIAlphaVantageSearchSymbols(BaseTool):
             description="Make a request to the AlphaVantage API to search for symbols.",
         )
         self.api_key = api_key
-        self.alpha_vantage_api = AlphaVantageAPIWrapper(alphavantage_api_key=api_key)
+        self.client = client or AlphaVantageClient.for_api_key(api_key)
 
     def search_symbols(self, keywords: str) -> str:
         """
@@ -63,7 +71,7 @@ class RexiaAIAlphaVantageSearchSymbols(BaseTool):
                 The search result.
         """
         try:
-            result = self.alpha_vantage_api.search_symbols(keywords)
+            result = self.client.query("SYMBOL_SEARCH", keywords=keywords)
         except Exception as e:
             logger.error(f"An error occurred while searching symbols: {e}")
             return None
@@ -118,15 +126,20 @@ class RexiaAIAlphaVantageMarketNewsSentiment(BaseTool):
 
     Attributes:
         api_key (str): The API key for AlphaVantage.
-        alpha_vantage_api (AlphaVantageAPIWrapper): The AlphaVantage API wrapper instance.
+        client (AlphaVantageClient): The client shared by every tool using the API key.
+        cache_ttl (float): Seconds a ToolCache may reuse a result.
     """
 
-    def __init__(self, api_key: str):
+    cache_ttl = 900.0
+
+    def __init__(self, api_key: str, client: Optional[AlphaVantageClient] = None):
         """
         Initialize the RexiaAIAlphaVantageMarketNewsSentiment instance.
 
         Args:
             api_key (str): The API key for AlphaVantage.
+            client (AlphaVantageClient, optional): The client to send requests through. Defaults to
+                the client shared by the API key.
         """
         super().__init__(
             name="get_market_news_sentiment",
@@ -134,7 +147,7 @@ class RexiaAIAlphaVantageMarketNewsSentiment(BaseTool):
             description="Make a request to the AlphaVantage API to get market news sentiment for a given symbol.",
         )
         self.api_key = api_key
-        self.alpha_vantage_api = AlphaVantageAPIWrapper(alphavantage_api_key=api_key)
+        self.client = client or AlphaVantageClient.for_api_key(api_key)
 
     def get_market_news_sentiment(self, symbol: str) -> str:
         """
@@ -147,7 +160,7 @@ class RexiaAIAlphaVantageMarketNewsSentiment(BaseTool):
             str: The market news sentiment data.
         """
         try:
-            result = self.alpha_vantage_api._get_market_news_sentiment(symbol)
+            result = self.client.query("NEWS_SENTIMENT", symbol=symbol)
         except Exception as e:
             logger.error(f"An error occurred while searching symbols: {e}")
             return None
@@ -195,15 +208,20 @@ class RexiaAIAlphaVantageTimeSeriesDaily(BaseTool):
 
     Attributes:
         api_key (str): The API key for AlphaVantage.
-        alpha_vantage_api (AlphaVantageAPIWrapper): The AlphaVantage API wrapper instance.
+        client (AlphaVantageClient): The client shared by every tool using the API key.
+        cache_ttl (float): Seconds a ToolCache may reuse a result.
     """
 
-    def __init__(self, api_key: str):
+    cache_ttl = 3600.0
+
+    def __init__(self, api_key: str, client: Optional[AlphaVantageClient] = None):
         """
         Initialize the RexiaAIAlphaVantageTimeSeriesDaily instance.
 
         Args:
             api_key (str): The API key for AlphaVantage.
+            client (AlphaVantageClient, optional): The client to send requests through. Defaults to
+                the client shared by the API key.
         """
         super().__init__(
             name="get_time_series_daily",
@@ -211,7 +229,7 @@ class RexiaAIAlphaVantageTimeSeriesDaily(BaseTool):
             description="Make a request to the AlphaVantage API to get time series daily data for a given symbol.",
         )
         self.api_key = api_key
-        self.alpha_vantage_api = AlphaVantageAPIWrapper(alphavantage_api_key=api_key)
+        self.client = client or AlphaVantageClient.for_api_key(api_key)
 
     def get_time_series_daily(self, symbol: str) -> str:
         """
@@ -224,7 +242,7 @@ class RexiaAIAlphaVantageTimeSeriesDaily(BaseTool):
             str: The time series daily data.
         """
         try:
-            result = self.alpha_vantage_api._get_time_series_daily(symbol)
+            result = self.client.query("TIME_SERIES_DAILY", symbol=symbol)
         except Exception as e:
             logger.error(f"An error occurred while searching symbols: {e}")
             return None
@@ -272,15 +290,20 @@ class RexiaAIAlphaVantageQuoteEndpoint(BaseTool):
 
     Attributes:
         api_key (str): The API key for AlphaVantage.
-        alpha_vantage_api (AlphaVantageAPIWrapper): The AlphaVantage API wrapper instance.
+        client (AlphaVantageClient): The client shared by every tool using the API key.
+        cache_ttl (float): Seconds a ToolCache may reuse a result.
     """
 
-    def __init__(self, api_key: str):
+    cache_ttl = 60.0
+
+    def __init__(self, api_key: str, client: Optional[AlphaVantageClient] = None):
         """
         Initialize the RexiaAIAlphaVantageQuoteEndpoint instance.
 
         Args:
             api_key (str): The API key for AlphaVantage.
+            client (AlphaVantageClient, optional): The client to send requests through. Defaults to
+                the client shared by the API key.
         """
         super().__init__(
             name="get_quote_endpoint",
@@ -288,7 +311,7 @@ class RexiaAIAlphaVantageQuoteEndpoint(BaseTool):
             description="Make a request to the AlphaVantage API to get quote data for a given symbol.",
         )
         self.api_key = api_key
-        self.alpha_vantage_api = AlphaVantageAPIWrapper(alphavantage_api_key=api_key)
+        self.client = client or AlphaVantageClient.for_api_key(api_key)
 
     def get_quote_endpoint(self, symbol: str) -> str:
         """
@@ -301,7 +324,7 @@ class RexiaAIAlphaVantageQuoteEndpoint(BaseTool):
             str: The quote data.
         """
         try:
-            result = self.alpha_vantage_api._get_quote_endpoint(symbol)
+            result = self.client.query("GLOBAL_QUOTE", symbol=symbol)
         except Exception as e:
             logger.error(f"An error occurred while searching symbols: {e}")
             return None
@@ -349,15 +372,20 @@ class RexiaAIAlphaVantageTimeSeriesWeekly(BaseTool):
 
     Attributes:
         api_key (str): The API key for AlphaVantage.
-        alpha_vantage_api (AlphaVantageAPIWrapper): The AlphaVantage API wrapper instance.
+        client (AlphaVantageClient): The client shared by every tool using the API key.
+        cache_ttl (float): Seconds a ToolCache may reuse a result.
     """
 
-    def __init__(self, api_key: str):
+    cache_ttl = 86400.0
+
+    def __init__(self, api_key: str, client: Optional[AlphaVantageClient] = None):
         """
         Initialize the RexiaAIAlphaVantageTimeSeriesWeekly instance.
 
         Args:
             api_key (str): The API key for AlphaVantage.
+            client (AlphaVantageClient, optional): The client to send requests through. Defaults to
+                the client shared by the API key.
         """
         super().__init__(
             name="get_time_series_weekly",
@@ -365,7 +393,7 @@ class RexiaAIAlphaVantageTimeSeriesWeekly(BaseTool):
             description="Make a request to the AlphaVantage API to get time series weekly data for a given symbol.",
         )
         self.api_key = api_key
-        self.alpha_vantage_api = AlphaVantageAPIWrapper(alphavantage_api_key=api_key)
+        self.client = client or AlphaVantageClient.for_api_key(api_key)
 
     def get_time_series_weekly(self, symbol: str) -> str:
         """
@@ -378,7 +406,7 @@ class RexiaAIAlphaVantageTimeSeriesWeekly(BaseTool):
             str: The time series weekly data.
         """
         try:
-            result = self.alpha_vantage_api._get_time_series_weekly(symbol)
+            result = self.client.query("TIME_SERIES_WEEKLY", symbol=symbol)
         except Exception as e:
             logger.error(f"An error occurred while searching symbols: {e}")
             return None
@@ -426,15 +454,20 @@ class RexiaAIAlphaVantageTopGainersLosers(BaseTool):
 
     Attributes:
         api_key (str): The API key for AlphaVantage.
-        alpha_vantage_api (AlphaVantageAPIWrapper): The AlphaVantage API wrapper instance.
+        client (AlphaVantageClient): The client shared by every tool using the API key.
+        cache_ttl (float): Seconds a ToolCache may reuse a result.
     """
 
-    def __init__(self, api_key: str):
+    cache_ttl = 300.0
+
+    def __init__(self, api_key: str, client: Optional[AlphaVantageClient] = None):
         """
         Initialize the RexiaAIAlphaVantageTopGainersLosers instance.
 
         Args:
             api_key (str): The API key for AlphaVantage.
+            client (AlphaVantageClient, optional): The client to send requests through. Defaults to
+                the client shared by the API key.
         """
         super().__init__(
             name="get_top_gainers_losers",
@@ -442,7 +475,7 @@ class RexiaAIAlphaVantageTopGainersLosers(BaseTool):
             description="Make a request to the AlphaVantage API to get top gainers and losers.",
         )
         self.api_key = api_key
-        self.alpha_vantage_api = AlphaVantageAPIWrapper(alphavantage_api_key=api_key)
+        self.client = client or AlphaVantageClient.for_api_key(api_key)
 
     def get_top_gainers_losers(self) -> str:
         """
@@ -452,7 +485,7 @@ class RexiaAIAlphaVantageTopGainersLosers(BaseTool):
             str: The top gainers and losers data.
         """
         try:
-            result = self.alpha_vantage_api._get_top_gainers_losers()
+            result = self.client.query("TOP_GAINERS_LOSERS")
         except Exception as e:
             logger.error(f"An error occurred while searching symbols: {e}")
             return None
@@ -490,15 +523,20 @@ class RexiaAIAlphaVantageExchangeRate(BaseTool):
 
     Attributes:
         api_key (str): The API key for AlphaVantage.
-        alpha_vantage_api (AlphaVantageAPIWrapper): The AlphaVantage API wrapper instance.
+        client (AlphaVantageClient): The client shared by every tool using the API key.
+        cache_ttl (float): Seconds a ToolCache may reuse a result.
     """
 
-    def __init__(self, api_key: str):
+    cache_ttl = 60.0
+
+    def __init__(self, api_key: str, client: Optional[AlphaVantageClient] = None):
         """
         Initialize the RexiaAIAlphaVantageExchangeRate instance.
 
         Args:
             api_key (str): The API key for AlphaVantage.
+            client (AlphaVantageClient, optional): The client to send requests through. Defaults to
+                the client shared by the API key.
         """
         super().__init__(
             name="get_exchange_rate",
@@ -506,7 +544,7 @@ class RexiaAIAlphaVantageExchangeRate(BaseTool):
             description="Make a request to the AlphaVantage API to get exchange rate data.",
         )
         self.api_key = api_key
-        self.alpha_vantage_api = AlphaVantageAPIWrapper(alphavantage_api_key=api_key)
+        self.client = client or AlphaVantageClient.for_api_key(api_key)
 
     def get_exchange_rate(self, from_currency: str, to_currency: str) -> str:
         """
@@ -520,8 +558,8 @@ class RexiaAIAlphaVantageExchangeRate(BaseTool):
             str: The exchange rate data.
         """
         try:
-            result = self.alpha_vantage_api._get_exchange_rate(
-                from_currency, to_currency
+            result = self.client.query(
+                "CURRENCY_EXCHANGE_RATE", from_currency=from_currency, to_currency=to_currency
             )
         except Exception as e:
             logger.error(f"An error occurred while searching symbols: {e}")
@@ -0,0 +1,161 @@
+"""ReXia.AI AlphaVantage client - a shared HTTP session and rate limiter per API key."""
+
+import threading
+import logging
+from typing import Any, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from ..llms.rate_limiter import RateLimiter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+
+# AlphaVantage's free tier allows 5 requests a minute per API key.
+DEFAULT_REQUESTS_PER_MINUTE = 5
+
+
+class AlphaVantageClient:
+    """
+    Sends requests to the AlphaVantage API, shared by every tool using the same API key.
+
+    Connections are kept alive in a pooled session, so consecutive requests skip the TCP and
+    TLS handshakes. Requests queue in a RateLimiter until the key's per-minute quota allows
+    them. When AlphaVantage reports the quota has been exceeded, every request on the key is
+    paused rather than only the one that was rejected.
+
+    Attributes:
+        api_key: The API key for AlphaVantage.
+        timeout: Seconds to wait for a response.
+        limit_pause: Seconds to pause requests after AlphaVantage reports the quota has been exceeded.
+        base_url: The AlphaVantage query URL.
+        rate_limiter: The limiter requests queue in.
+        session: The pooled HTTP session.
+    """
+
+    _registry: Dict[str, "AlphaVantageClient"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        requests_per_minute: Optional[int] = DEFAULT_REQUESTS_PER_MINUTE,
+        max_in_flight: int = 4,
+        timeout: float = 30.0,
+        limit_pause: float = 60.0,
+        base_url: str = ALPHA_VANTAGE_URL,
+    ):
+        """
+        Initialize an AlphaVantageClient instance.
+
+        Args:
+            api_key: The API key for AlphaVantage.
+            requests_per_minute: Requests per minute allowed for the key. Defaults to 5, the free
+                tier's limit. None for no limit.
+            max_in_flight: Concurrent requests, and connections kept alive. Defaults to 4.
+            timeout: Seconds to wait for a response. Defaults to 30.
+            limit_pause: Seconds to pause requests after the quota is exceeded. Defaults to 60.
+            base_url: The AlphaVantage query URL. Defaults to the public API.
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.limit_pause = limit_pause
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=requests_per_minute, max_in_flight=max_in_flight
+        )
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_in_flight)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def for_api_key(
+        cls,
+        api_key: str,
+        requests_per_minute: Optional[int] = DEFAULT_REQUESTS_PER_MINUTE,
+        max_in_flight: int = 4,
+    ) -> "AlphaVantageClient":
+        """
+        Get the client shared by every tool using an API key.
+
+        The first call for a key creates the client; later calls return the same instance so
+        that every tool shares one connection pool and draws from one quota.
+
+        Args:
+            api_key: The API key for AlphaVantage.
+            requests_per_minute: Requests per minute allowed for the key. Defaults to 5.
+            max_in_flight: Concurrent requests, and connections kept alive. Defaults to 4.
+
+        Returns:
+            AlphaVantageClient: The shared client.
+        """
+        with cls._registry_lock:
+            client = cls._registry.get(api_key)
+            if client is None:
+                client = cls(api_key, requests_per_minute=requests_per_minute, max_in_flight=max_in_flight)
+                cls._registry[api_key] = client
+            elif (client.rate_limiter.requests_per_minute, client.rate_limiter.max_in_flight) != (
+                requests_per_minute,
+                max_in_flight,
+            ):
+                logger.warning(
+                    "AlphaVantage client for this API key already exists with different limits; "
+                    "using the existing limits."
+                )
+            return client
+
+    def query(self, function: str, **params: Any) -> Dict[str, Any]:
+        """
+        Call an AlphaVantage API function, waiting for the rate limiter first.
+
+        Args:
+            function: The AlphaVantage function, e.g. "GLOBAL_QUOTE".
+            **params: The function's parameters.
+
+        Returns:
+            Dict[str, Any]: The decoded response.
+
+        Raises:
+            requests.HTTPError: If the request fails.
+            ValueError: If AlphaVantage returns an error or reports the quota has been exceeded.
+        """
+        self.rate_limiter.acquire()
+        try:
+            response = self.session.get(
+                self.base_url,
+                params={"function": function, **params, "apikey": self.api_key},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 429:
+                self.rate_limiter.defer(RateLimiter.get_retry_after(e) or self.limit_pause)
+            raise
+        finally:
+            self.rate_limiter.release()
+
+        data = response.json()
+        if "Error Message" in data:
+            raise ValueError(f"API Error: {data['Error Message']}")
+        limit_message = data.get("Note") or (data.get("Information") if len(data) == 1 else None)
+        if limit_message:
+            self.rate_limiter.defer(self.limit_pause)
+            raise ValueError(f"API limit: {limit_message}")
+        return data
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the client's rate limiter statistics.
+
+        Returns:
+            A dictionary with the number of requests, how many had to wait, the total time spent
+            waiting, quota pauses and current in-flight requests.
+        """
+        return self.rate_limiter.get_stats()
+
+    def close(self) -> None:
+        """Close the session's pooled connections."""
+        self.session.close()
@@ -15,6 +15,8 @@ class RexiaAIGoogleSearch(BaseTool):
         The API key for Google Search.
     engine_id : str
         The engine ID for Google Search.
+    cache_ttl : float
+        Seconds a ToolCache may reuse a result.
 
     Methods
     -------
@@ -26,6 +28,8 @@ class RexiaAIGoogleSearch(BaseTool):
         Return the tool as a dictionary object for ReXia.AI.
     """
 
+    cache_ttl = 3600.0
+
     def __init__(self, api_key: str, engine_id: str):
         """
         Constructs all the necessary attributes for the RexiaAIGoogleSearch object.
@@ -21,6 +21,8 @@ class RexiaAIImageAnalysis(BaseTool):
         The base URL for the vision model.
     vision_model : str
         The name of the vision model.
+    cache_ttl : float
+        Seconds a ToolCache may reuse a result.
 
     Methods
     -------
@@ -32,6 +34,8 @@ class RexiaAIImageAnalysis(BaseTool):
         Return the tool as a dictionary object for ReXia.AI.
     """
 
+    cache_ttl = 3600.0
+
     def __init__(self, vision_model_base_url: str, vision_model: str, api_key: str):
         """
         Constructs all the necessary attributes for the RexiaAIImageAnalysis object.
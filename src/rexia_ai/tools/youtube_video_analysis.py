@@ -25,12 +25,14 @@ class RexiaAIYoutubeVideoAnalysis(BaseTool):
         vision_model_base_url (str): Base URL for the vision model.
         vision_model (str): Name of the vision model to use.
         whisper_model (str): Name of the Whisper model to use for transcription (default: "base").
+        cache_ttl (float): Seconds a ToolCache may reuse a result.
     """
 
     openai_api_key: str
     vision_model_base_url: str
     vision_model: str
     whisper_model: str
+    cache_ttl = 86400.0
 
     def __init__(
         self,
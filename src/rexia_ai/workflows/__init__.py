@@ -6,6 +6,7 @@ from .collaboration_workflow import CollaborationWorkflow
 from .tdd_workflow import TDDWorkflow
 from .code_tool_workflow import CodeToolWorkflow
 from .code_workflow import CodeWorkflow
+from .early_exit_policy import EarlyExitPolicy
 
 __all__ = [
     "ReflectWorkflow",
@@ -13,5 +14,6 @@ __all__ = [
     "CollaborationWorkflow",
     "TDDWorkflow",
     "CodeToolWorkflow",
-    "CodeWorkflow"
+    "CodeWorkflow",
+    "EarlyExitPolicy"
 ]
@@ -1,9 +1,9 @@
 """CodeToolWorkflow module for ReXia.AI's Code Tool Generation and Execution system."""
 
 import logging
-from typing import Any
-from ..base import BaseWorkflow
-from ..common import CollaborationChannel, TaskStatus
+from typing import Any, Optional
+from ..base import BaseWorkflow, BaseExecutionBackend
+from ..common import CollaborationChannel, RunContext, TaskStatus
 from ..agents import Component
 from ..agents.workers import CodeTool, Worker
 
@@ -31,6 +31,7 @@ class CodeToolWorkflow(BaseWorkflow):
         llm: Any,
         task: str,
         verbose: bool = False,
+        execution_backend: Optional[BaseExecutionBackend] = None,
     ):
         """
         Initialize a CodeToolWorkflow instance.
@@ -41,13 +42,15 @@ class CodeToolWorkflow(BaseWorkflow):
             llm (Any): The language model to be used throughout the workflow.
             task (str): A description of the task to be performed using the code tool.
             verbose (bool, optional): Enable verbose mode for detailed logging. Defaults to False.
+            execution_backend (BaseExecutionBackend, optional): The backend that runs the generated
+                code. Defaults to the shared Docker container pool.
         """
         super().__init__(llm, task, verbose)
         self.channel = CollaborationChannel(task)
         self.code_tool = Component(
             "Code",
             self.channel,
-            CodeTool(model=llm, verbose=verbose),
+            CodeTool(model=llm, verbose=verbose, execution_backend=execution_backend),
         )
         self.worker = Component(
             "Work",
@@ -55,7 +58,7 @@ class CodeToolWorkflow(BaseWorkflow):
             Worker(model=llm, verbose=verbose),
         )
 
-    def _run_task(self) -> None:
+    def _run_task(self, context: RunContext) -> None:
         """
         Execute the main Code Tool workflow logic.
 
@@ -63,46 +66,110 @@ class CodeToolWorkflow(BaseWorkflow):
         including setting up the LLMTool worker, generating the code, and executing it.
         It manages the task status, handles exceptions, and updates the memory with the final result.
 
+        Args:
+            context (RunContext): The run to execute.
+
         Returns:
             str: A success message or an error message if an exception occurs.
         """
         try:
-            logger.info(f"ReXia.AI is working on the Code Tool task: {self.task}")
+            logger.info(f"ReXia.AI is working on the Code Tool task: {context.task}")
 
-            self.channel.status = TaskStatus.WORKING
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
             
             # Generate and execute the code tool
-            self.code_tool.run()
-            self.worker.run()
+            self.code_tool.run(context)
+            self.worker.run(context)
 
-            self.channel.status = TaskStatus.COMPLETED
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
 
             # Add the final message to the memory
-            final_message = self.channel.messages[-1]
+            final_message = context.channel.messages[-1]
             if self.verbose:
                 logger.debug(f"Result: {final_message}")
 
-            logger.info(f"ReXia.AI has completed the Code Tool task: {self.channel.task}")
+            logger.info(f"ReXia.AI has completed the Code Tool task: {context.channel.task}")
 
         except Exception as e:
             logger.error(f"An error occurred while running the task: {e}", exc_info=True)
             raise
 
-    def run(self) -> str:
+    def run(self, context: Optional[RunContext] = None) -> str:
         """
         Execute the Code Tool workflow.
 
         This method serves as the main entry point for running the Code Tool workflow.
         It invokes the _run_task method to process the task through all stages.
 
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
+        Returns:
+            str: A success message or an error message if an exception occurs.
+        """
+        try:
+            result = self._run_task(self._resolve_context(context))
+            return result
+        except Exception as e:
+            logger.error(f"Code Tool workflow execution failed: {e}", exc_info=True)
+            return f"An error occurred: {str(e)}"
+
+    async def _arun_task(self, context: RunContext) -> None:
+        """
+        Asynchronously execute the main task processing logic of the workflow.
+
+        Runs the same stages as _run_task, awaiting each component so that model
+        calls do not block the event loop.
+
+        Args:
+            context (RunContext): The run to execute.
+
+        Returns:
+            None
+        """
+        try:
+            logger.info(f"ReXia.AI is working on the Code Tool task: {context.task}")
+
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
+            
+            # Generate and execute the code tool
+            await self.code_tool.arun(context)
+            await self.worker.arun(context)
+
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
+
+            # Add the final message to the memory
+            final_message = context.channel.messages[-1]
+            if self.verbose:
+                logger.debug(f"Result: {final_message}")
+
+            logger.info(f"ReXia.AI has completed the Code Tool task: {context.channel.task}")
+
+        except Exception as e:
+            logger.error(f"An error occurred while running the task: {e}", exc_info=True)
+            raise
+
+    async def arun(self, context: Optional[RunContext] = None) -> str:
+        """
+        Asynchronously execute the Code Tool workflow.
+
+        This is the asynchronous entry point, mirroring run.
+
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
         Returns:
             str: A success message or an error message if an exception occurs.
         """
         try:
-            result = self._run_task()
+            result = await self._arun_task(self._resolve_context(context))
             return result
         except Exception as e:
             logger.error(f"Code Tool workflow execution failed: {e}", exc_info=True)
-            return f"An error occurred: {str(e)}"
\ No newline at end of file
+            return f"An error occurred: {str(e)}"
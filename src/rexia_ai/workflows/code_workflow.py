@@ -1,9 +1,9 @@
 """CodeWorkflow module for ReXia.AI's Code Generation."""
 
 import logging
-from typing import Any
+from typing import Any, Optional
 from ..base import BaseWorkflow
-from ..common import CollaborationChannel, TaskStatus
+from ..common import CollaborationChannel, RunContext, TaskStatus
 from ..agents import Component
 from ..agents.workers import CodeWorker, ToolWorker
 
@@ -55,7 +55,7 @@ class CodeWorkflow(BaseWorkflow):
             CodeWorker(model=llm, verbose=verbose),
         )
 
-    def _run_task(self) -> None:
+    def _run_task(self, context: RunContext) -> None:
         """
         Execute the main Code workflow logic.
 
@@ -63,47 +63,112 @@ class CodeWorkflow(BaseWorkflow):
         including setting up the Code worker and generating the code.
         It manages the task status, handles exceptions, and updates the memory with the final result.
 
+        Args:
+            context (RunContext): The run to execute.
+
         Returns:
             str: A success message or an error message if an exception occurs.
         """
         try:
-            logger.info(f"ReXia.AI is working on the Code task: {self.task}")
+            logger.info(f"ReXia.AI is working on the Code task: {context.task}")
 
-            self.channel.status = TaskStatus.WORKING
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
             
-            if self.llm.tools:
-                self.tool.run()
+            if context.llm.tools:
+                self.tool.run(context)
             
-            self.code.run()
+            self.code.run(context)
 
-            self.channel.status = TaskStatus.COMPLETED
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
 
             # Add the final message to the memory
-            final_message = self.channel.messages[-1]
+            final_message = context.channel.messages[-1]
             if self.verbose:
                 logger.debug(f"Result: {final_message}")
 
-            logger.info(f"ReXia.AI has completed the Code Tool task: {self.channel.task}")
+            logger.info(f"ReXia.AI has completed the Code Tool task: {context.channel.task}")
 
         except Exception as e:
             logger.error(f"An error occurred while running the task: {e}", exc_info=True)
             raise
 
-    def run(self) -> str:
+    def run(self, context: Optional[RunContext] = None) -> str:
         """
         Execute the Code workflow.
 
         This method serves as the main entry point for running the Code workflow.
         It invokes the _run_task method to process the task through all stages.
 
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
+        Returns:
+            str: A success message or an error message if an exception occurs.
+        """
+        try:
+            result = self._run_task(self._resolve_context(context))
+            return result
+        except Exception as e:
+            logger.error(f"Code workflow execution failed: {e}", exc_info=True)
+            return f"An error occurred: {str(e)}"
+
+    async def _arun_task(self, context: RunContext) -> None:
+        """
+        Asynchronously execute the main task processing logic of the workflow.
+
+        Runs the same stages as _run_task, awaiting each component so that model
+        calls do not block the event loop.
+
+        Args:
+            context (RunContext): The run to execute.
+
+        Returns:
+            None
+        """
+        try:
+            logger.info(f"ReXia.AI is working on the Code task: {context.task}")
+
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
+            
+            if context.llm.tools:
+                await self.tool.arun(context)
+            
+            await self.code.arun(context)
+
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
+
+            # Add the final message to the memory
+            final_message = context.channel.messages[-1]
+            if self.verbose:
+                logger.debug(f"Result: {final_message}")
+
+            logger.info(f"ReXia.AI has completed the Code Tool task: {context.channel.task}")
+
+        except Exception as e:
+            logger.error(f"An error occurred while running the task: {e}", exc_info=True)
+            raise
+
+    async def arun(self, context: Optional[RunContext] = None) -> str:
+        """
+        Asynchronously execute the Code workflow.
+
+        This is the asynchronous entry point, mirroring run.
+
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
         Returns:
             str: A success message or an error message if an exception occurs.
         """
         try:
-            result = self._run_task()
+            result = await self._arun_task(self._resolve_context(context))
             return result
         except Exception as e:
             logger.error(f"Code workflow execution failed: {e}", exc_info=True)
-            return f"An error occurred: {str(e)}"
\ No newline at end of file
+            return f"An error occurred: {str(e)}"
@@ -1,9 +1,9 @@
 """CollaborationWorkflow module for ReXia.AI's multi-agent task execution system."""
 
 import logging
-from typing import Any
+from typing import Any, Optional
 from ..base import BaseWorkflow
-from ..common import CollaborationChannel, TaskStatus
+from ..common import CollaborationChannel, RunContext, TaskStatus
 from ..agents import Component
 from ..agents.workers import TeamWorker, ToolWorker
 
@@ -64,7 +64,7 @@ class CollaborationWorkflow(BaseWorkflow):
             ToolWorker(model=llm, verbose=verbose),
         )
 
-    def _run_task(self) -> None:
+    def _run_task(self, context: RunContext) -> None:
         """
         Execute the main task processing logic of the workflow.
 
@@ -72,6 +72,9 @@ class CollaborationWorkflow(BaseWorkflow):
         and team work. It manages the task status, handles exceptions, and updates the memory
         with the final result.
 
+        Args:
+            context (RunContext): The run to execute.
+
         Returns:
             None
 
@@ -79,41 +82,101 @@ class CollaborationWorkflow(BaseWorkflow):
             Exception: If an error occurs during task execution. The error is caught and printed.
         """
         try:
-            logger.info(f"ReXia.AI is working on the task: {self.channel.task}")
+            logger.info(f"ReXia.AI is working on the task: {context.channel.task}")
 
-            self.channel.status = TaskStatus.WORKING
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
             
             # Generate and execute the code too
-            if self.llm.tools:
-                self.tool.run()
+            if context.llm.tools:
+                self.tool.run(context)
             
-            self.team_work.run()
+            self.team_work.run(context)
 
-            self.channel.status = TaskStatus.COMPLETED
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
 
             # Add the final message to the memory
-            final_message = self.channel.messages[-1]
+            final_message = context.channel.messages[-1]
             if self.verbose:
                 logger.debug(f"Result: {final_message}")
 
-            logger.info(f"ReXia.AI has completed the task: {self.channel.task}")
+            logger.info(f"ReXia.AI has completed the task: {context.channel.task}")
         except Exception as e:
             logger.error(f"An error occurred while running the task: {e}", exc_info=True)
             raise
 
-    def run(self) -> None:
+    def run(self, context: Optional[RunContext] = None) -> None:
         """
         Execute the collaboration workflow.
 
         This method serves as the main entry point for running the collaboration workflow.
         It invokes the _run_task method to process the task.
 
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
+        Returns:
+            None
+        """
+        try:
+            self._run_task(self._resolve_context(context))
+        except Exception as e:
+            logger.error(f"Collaboration workflow execution failed: {e}", exc_info=True)
+
+    async def _arun_task(self, context: RunContext) -> None:
+        """
+        Asynchronously execute the main task processing logic of the workflow.
+
+        Runs the same stages as _run_task, awaiting each component so that model
+        calls do not block the event loop.
+
+        Args:
+            context (RunContext): The run to execute.
+
+        Returns:
+            None
+        """
+        try:
+            logger.info(f"ReXia.AI is working on the task: {context.channel.task}")
+
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
+            
+            # Generate and execute the code too
+            if context.llm.tools:
+                await self.tool.arun(context)
+            
+            await self.team_work.arun(context)
+
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
+
+            # Add the final message to the memory
+            final_message = context.channel.messages[-1]
+            if self.verbose:
+                logger.debug(f"Result: {final_message}")
+
+            logger.info(f"ReXia.AI has completed the task: {context.channel.task}")
+        except Exception as e:
+            logger.error(f"An error occurred while running the task: {e}", exc_info=True)
+            raise
+
+    async def arun(self, context: Optional[RunContext] = None) -> None:
+        """
+        Asynchronously execute the collaboration workflow.
+
+        This is the asynchronous entry point, mirroring run.
+
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
         Returns:
             None
         """
         try:
-            self._run_task()
+            await self._arun_task(self._resolve_context(context))
         except Exception as e:
-            logger.error(f"Collaboration workflow execution failed: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Collaboration workflow execution failed: {e}", exc_info=True)
@@ -0,0 +1,132 @@
+"""EarlyExitPolicy module for ReXia.AI's workflows."""
+
+import threading
+import logging
+from typing import Any, Callable, Dict, Optional
+from ..common import Utility
+from ..structure import RexiaAIResponse
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+class EarlyExitPolicy:
+    """
+    Decides when a workflow can return the work stage's answer without the finalise stage.
+
+    The finalise stage costs a full completion to review an answer. When the work stage is
+    already very confident in an answer that passes validation, that completion is skipped.
+    The policy counts how often it exits early and estimates the time saved from the
+    finalise stages it has seen run.
+
+    Attributes:
+        threshold: The confidence score the work stage's answer must exceed, from 0 to 100.
+        validator: Returns True if a response is fit to be returned as it is.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 90.0,
+        validator: Optional[Callable[[RexiaAIResponse], bool]] = None,
+    ):
+        """
+        Initialize an EarlyExitPolicy instance.
+
+        Args:
+            threshold: The confidence score the answer must exceed. Defaults to 90.
+            validator: Returns True if a response can be returned without review. Defaults to
+                is_valid, which requires an answer and no outstanding tool calls.
+        """
+        self.threshold = threshold
+        self.validator = validator or self.is_valid
+        self._lock = threading.Lock()
+        self._evaluated = 0
+        self._exits = 0
+        self._finalise_runs = 0
+        self._finalise_seconds = 0.0
+
+    def should_exit(self, message: Any) -> bool:
+        """
+        Decide whether to skip the finalise stage after the work stage.
+
+        Args:
+            message: The work stage's message, a worker name followed by its JSON response.
+
+        Returns:
+            bool: True if the answer's confidence is over the threshold and it passes validation.
+        """
+        response = self._parse(message)
+        exit_early = (
+            response is not None
+            and response.confidence_score > self.threshold
+            and self.validator(response)
+        )
+        with self._lock:
+            self._evaluated += 1
+            if exit_early:
+                self._exits += 1
+        if exit_early:
+            logger.info(f"Skipping finalise, confidence {response.confidence_score} is over {self.threshold}.")
+        return exit_early
+
+    def record_finalise(self, seconds: float) -> None:
+        """
+        Record how long a finalise stage took, to estimate the time saved by skipping it.
+
+        Args:
+            seconds: The duration of the finalise stage.
+        """
+        with self._lock:
+            self._finalise_runs += 1
+            self._finalise_seconds += seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the early exit statistics.
+
+        Returns:
+            A dictionary with the number of answers evaluated, early exits, the skip rate, the
+            mean finalise latency and the estimated seconds saved.
+        """
+        with self._lock:
+            mean_finalise = self._finalise_seconds / self._finalise_runs if self._finalise_runs else 0.0
+            return {
+                "evaluated": self._evaluated,
+                "exits": self._exits,
+                "skip_rate": self._exits / self._evaluated if self._evaluated else 0.0,
+                "mean_finalise_latency": mean_finalise,
+                "latency_saved": self._exits * mean_finalise,
+            }
+
+    @staticmethod
+    def is_valid(response: RexiaAIResponse) -> bool:
+        """
+        Check that a response has an answer and is not waiting on tool calls.
+
+        Args:
+            response: The work stage's response.
+
+        Returns:
+            bool: True if the response can be returned without review.
+        """
+        return bool(response.answer) and not response.tool_calls
+
+    @staticmethod
+    def _parse(message: Any) -> Optional[RexiaAIResponse]:
+        """
+        Parse the response out of a stage's message.
+
+        Args:
+            message: The stage's message.
+
+        Returns:
+            The parsed response, or None if the message does not contain one.
+        """
+        if not isinstance(message, str):
+            return None
+        try:
+            return RexiaAIResponse.from_json(Utility.parse_json(Utility.extract_json_string(message)))
+        except Exception as e:
+            logger.debug(f"Could not parse the work stage's response: {e}")
+            return None
@@ -1,11 +1,13 @@
 """ReflectWorkflow module for ReXia.AI's multi-stage reflective task execution system."""
 
+import time
 import logging
-from typing import Any
+from typing import Any, Callable, Dict, List, Optional
 from ..base import BaseWorkflow
-from ..common import CollaborationChannel, TaskStatus
-from ..agents import Component
+from ..common import CollaborationChannel, RunContext, TaskStatus
+from ..agents import Component, ComponentGraph
 from ..agents.workers import PlanWorker, FinaliseWorker, Worker, ToolWorker
+from .early_exit_policy import EarlyExitPolicy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -18,7 +20,8 @@ class ReflectWorkflow(BaseWorkflow):
     This class extends BaseWorkflow to provide a specific implementation for tasks that require
     a reflective approach, including planning, tool usage, execution, and finalization stages.
     It orchestrates the interaction between various specialized components to complete complex
-    tasks efficiently and thoughtfully.
+    tasks efficiently and thoughtfully. The tool stage only needs the task, so it runs
+    alongside planning.
 
     Attributes:
         llm (Any): The language model used by the workflow for task processing and decision making.
@@ -29,6 +32,8 @@ class ReflectWorkflow(BaseWorkflow):
         tool (Component): The component responsible for tool-related operations and interactions.
         work (Component): The component responsible for the main task execution.
         finalise (Component): The component responsible for refining and finalizing the task output.
+        graph (ComponentGraph): The dependencies between the components.
+        early_exit (Optional[EarlyExitPolicy]): Decides when the work stage's answer is returned without finalise.
     """
 
     llm: Any
@@ -39,12 +44,15 @@ class ReflectWorkflow(BaseWorkflow):
     tool: Component
     work: Component
     finalise: Component
+    graph: ComponentGraph
+    early_exit: Optional[EarlyExitPolicy]
 
     def __init__(
         self,
         llm: Any,
         task: str,
         verbose: bool = False,
+        early_exit: Optional[EarlyExitPolicy] = None,
     ) -> None:
         """
         Initialize a ReflectWorkflow instance.
@@ -56,8 +64,11 @@ class ReflectWorkflow(BaseWorkflow):
             llm (Any): The language model to be used throughout the workflow.
             task (str): A description of the task to be performed by the workflow.
             verbose (bool, optional): Enable verbose mode for detailed logging. Defaults to False.
+            early_exit (Optional[EarlyExitPolicy]): A policy for skipping finalise when the work
+                stage is confident enough. Defaults to None (always finalise).
         """
         super().__init__(llm, task, verbose)
+        self.early_exit = early_exit
         self.channel = CollaborationChannel(task)
         self.plan = Component(
             "plan",
@@ -73,25 +84,30 @@ class ReflectWorkflow(BaseWorkflow):
             "work",
             self.channel,
             Worker(model=llm, verbose=verbose),
+            depends_on=["plan", "tool"],
         )
         self.finalise = Component(
             "finalise",
             self.channel,
             FinaliseWorker(model=llm, verbose=verbose),
+            depends_on=["work"],
         )
+        self.graph = ComponentGraph([self.plan, self.tool, self.work, self.finalise])
 
-    def _run_task(self) -> None:
+    def _run_task(self, context: RunContext) -> None:
         """
         Execute the main task processing logic of the reflective workflow.
 
         This method orchestrates the execution of the task through multiple stages:
-        1. Planning
-        2. Tool usage (if available)
-        3. Main work execution
-        4. Finalization and refinement
+        1. Planning, and tool usage (if available) at the same time
+        2. Main work execution
+        3. Finalization and refinement, unless the early exit policy skips it
 
         It manages the task status, handles exceptions, and updates the memory with the final result.
 
+        Args:
+            context (RunContext): The run to execute.
+
         Returns:
             None
 
@@ -99,40 +115,143 @@ class ReflectWorkflow(BaseWorkflow):
             Exception: If an error occurs during task execution. The error is caught and logged.
         """
         try:
-            logger.info(f"ReXia.AI is working on the task: {self.channel.task}")
+            logger.info(f"ReXia.AI is working on the task: {context.channel.task}")
 
-            self.channel.status = TaskStatus.WORKING
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
 
-            self.plan.run()
-            if self.llm.tools:
-                self.tool.run()
-            self.work.run()
-            self.finalise.run()
+            finished_at: Dict[str, float] = {}
+            self.graph.run(
+                context,
+                skip=self._skipped_components(context),
+                on_complete=self._on_stage_complete(finished_at),
+            )
+            self._record_finalise_latency(finished_at)
 
-            self.channel.status = TaskStatus.COMPLETED
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
 
             # Add the final message to the memory
-            final_message = self.channel.messages[-1]
+            final_message = context.channel.messages[-1]
             if self.verbose:
                 logger.debug(f"Result: {final_message}")
 
-            logger.info(f"ReXia.AI has completed the task: {self.channel.task}")
+            logger.info(f"ReXia.AI has completed the task: {context.channel.task}")
         except Exception as e:
             logger.error(f"An error occurred while running the task: {e}", exc_info=True)
 
-    def run(self) -> None:
+    def _skipped_components(self, context: RunContext) -> List[str]:
+        """
+        Get the components that do not need to run for this run.
+
+        Args:
+            context (RunContext): The run to execute.
+
+        Returns:
+            List[str]: The tool component's name if the run's model has no tools, otherwise nothing.
+        """
+        return [] if context.llm.tools else [self.tool.name]
+
+    def _on_stage_complete(self, finished_at: Dict[str, float]) -> Callable[[str, Any], List[str]]:
+        """
+        Build the callback that notes when each stage finishes and applies the early exit policy.
+
+        Args:
+            finished_at (Dict[str, float]): Filled with the time each stage finished.
+
+        Returns:
+            Callable[[str, Any], List[str]]: The callback for ComponentGraph.run.
+        """
+        def on_complete(name: str, response: Any) -> List[str]:
+            finished_at[name] = time.monotonic()
+            if name == self.work.name and self.early_exit is not None and self.early_exit.should_exit(response):
+                return [self.finalise.name]
+            return []
+
+        return on_complete
+
+    def _record_finalise_latency(self, finished_at: Dict[str, float]) -> None:
+        """
+        Tell the early exit policy how long the finalise stage took, if it ran.
+
+        Args:
+            finished_at (Dict[str, float]): The time each stage finished.
+        """
+        if self.early_exit is not None and self.finalise.name in finished_at:
+            self.early_exit.record_finalise(finished_at[self.finalise.name] - finished_at[self.work.name])
+
+    def run(self, context: Optional[RunContext] = None) -> None:
         """
         Execute the reflective workflow.
 
         This method serves as the main entry point for running the reflective workflow.
         It invokes the _run_task method to process the task through all stages.
 
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
+        Returns:
+            None
+        """
+        try:
+            self._run_task(self._resolve_context(context))
+        except Exception as e:
+            logger.error(f"Reflective workflow execution failed: {e}", exc_info=True)
+
+    async def _arun_task(self, context: RunContext) -> None:
+        """
+        Asynchronously execute the main task processing logic of the workflow.
+
+        Runs the same stages as _run_task, awaiting each component so that model
+        calls do not block the event loop.
+
+        Args:
+            context (RunContext): The run to execute.
+
+        Returns:
+            None
+        """
+        try:
+            logger.info(f"ReXia.AI is working on the task: {context.channel.task}")
+
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
+
+            finished_at: Dict[str, float] = {}
+            await self.graph.arun(
+                context,
+                skip=self._skipped_components(context),
+                on_complete=self._on_stage_complete(finished_at),
+            )
+            self._record_finalise_latency(finished_at)
+
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
+
+            # Add the final message to the memory
+            final_message = context.channel.messages[-1]
+            if self.verbose:
+                logger.debug(f"Result: {final_message}")
+
+            logger.info(f"ReXia.AI has completed the task: {context.channel.task}")
+        except Exception as e:
+            logger.error(f"An error occurred while running the task: {e}", exc_info=True)
+
+    async def arun(self, context: Optional[RunContext] = None) -> None:
+        """
+        Asynchronously execute the reflective workflow.
+
+        This is the asynchronous entry point, mirroring run.
+
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
         Returns:
             None
         """
         try:
-            self._run_task()
+            await self._arun_task(self._resolve_context(context))
         except Exception as e:
-            logger.error(f"Reflective workflow execution failed: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Reflective workflow execution failed: {e}", exc_info=True)
@@ -1,10 +1,10 @@
 """SimpleToolWorkflow module for ReXia.AI's streamlined task execution system with tool integration."""
 
 import logging
-from typing import Any
+from typing import Any, List, Optional
 from ..base import BaseWorkflow
-from ..common import CollaborationChannel, TaskStatus
-from ..agents import Component
+from ..common import CollaborationChannel, RunContext, TaskStatus
+from ..agents import Component, ComponentGraph
 from ..agents.workers import Worker, ToolWorker
 
 # Configure logging
@@ -26,6 +26,7 @@ class SimpleToolWorkflow(BaseWorkflow):
         channel (CollaborationChannel): Communication channel for task-related interactions and data sharing.
         tool (Component): The component responsible for tool-related operations and interactions.
         work (Component): The component responsible for the main task execution.
+        graph (ComponentGraph): The dependencies between the components.
     """
 
     llm: Any
@@ -34,6 +35,7 @@ class SimpleToolWorkflow(BaseWorkflow):
     channel: CollaborationChannel
     tool: Component
     work: Component
+    graph: ComponentGraph
 
     def __init__(
         self,
@@ -62,9 +64,11 @@ class SimpleToolWorkflow(BaseWorkflow):
             "work",
             self.channel,
             Worker(model=llm, verbose=verbose),
+            depends_on=["tool"],
         )
+        self.graph = ComponentGraph([self.tool, self.work])
 
-    def _run_task(self) -> None:
+    def _run_task(self, context: RunContext) -> None:
         """
         Execute the main task processing logic of the simple tool workflow.
 
@@ -74,6 +78,9 @@ class SimpleToolWorkflow(BaseWorkflow):
 
         It manages the task status, handles exceptions, and updates the memory with the final result.
 
+        Args:
+            context (RunContext): The run to execute.
+
         Returns:
             None
 
@@ -81,39 +88,105 @@ class SimpleToolWorkflow(BaseWorkflow):
             Exception: If an error occurs during task execution. The error is caught and logged.
         """
         try:
-            logger.info(f"ReXia.AI is working on the task: {self.channel.task}")
+            logger.info(f"ReXia.AI is working on the task: {context.channel.task}")
 
-            self.channel.status = TaskStatus.WORKING
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
 
-            if self.llm.tools:
-                self.tool.run()     
-            self.work.run()
+            self.graph.run(context, skip=self._skipped_components(context))
 
-            self.channel.status = TaskStatus.COMPLETED
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
 
             # Add the final message to the memory
-            final_message = self.channel.messages[-1]
+            final_message = context.channel.messages[-1]
             if self.verbose:
                 logger.debug(f"Result: {final_message}")
 
-            logger.info(f"ReXia.AI has completed the task: {self.channel.task}")
+            logger.info(f"ReXia.AI has completed the task: {context.channel.task}")
         except Exception as e:
             logger.error(f"An error occurred while running the task: {e}", exc_info=True)
             raise
 
-    def run(self) -> None:
+    def _skipped_components(self, context: RunContext) -> List[str]:
+        """
+        Get the components that do not need to run for this run.
+
+        Args:
+            context (RunContext): The run to execute.
+
+        Returns:
+            List[str]: The tool component's name if the run's model has no tools, otherwise nothing.
+        """
+        return [] if context.llm.tools else [self.tool.name]
+
+    def run(self, context: Optional[RunContext] = None) -> None:
         """
         Execute the simple tool workflow.
 
         This method serves as the main entry point for running the simple tool workflow.
         It invokes the _run_task method to process the task through all stages.
 
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
+        Returns:
+            None
+        """
+        try:
+            self._run_task(self._resolve_context(context))
+        except Exception as e:
+            logger.error(f"Simple tool workflow execution failed: {e}", exc_info=True)
+
+    async def _arun_task(self, context: RunContext) -> None:
+        """
+        Asynchronously execute the main task processing logic of the workflow.
+
+        Runs the same stages as _run_task, awaiting each component so that model
+        calls do not block the event loop.
+
+        Args:
+            context (RunContext): The run to execute.
+
+        Returns:
+            None
+        """
+        try:
+            logger.info(f"ReXia.AI is working on the task: {context.channel.task}")
+
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
+
+            await self.graph.arun(context, skip=self._skipped_components(context))
+
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
+
+            # Add the final message to the memory
+            final_message = context.channel.messages[-1]
+            if self.verbose:
+                logger.debug(f"Result: {final_message}")
+
+            logger.info(f"ReXia.AI has completed the task: {context.channel.task}")
+        except Exception as e:
+            logger.error(f"An error occurred while running the task: {e}", exc_info=True)
+            raise
+
+    async def arun(self, context: Optional[RunContext] = None) -> None:
+        """
+        Asynchronously execute the simple tool workflow.
+
+        This is the asynchronous entry point, mirroring run.
+
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
         Returns:
             None
         """
         try:
-            self._run_task()
+            await self._arun_task(self._resolve_context(context))
         except Exception as e:
-            logger.error(f"Simple tool workflow execution failed: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Simple tool workflow execution failed: {e}", exc_info=True)
@@ -1,9 +1,9 @@
 """TDDWorkflow module for ReXia.AI's Test-Driven Development task execution system."""
 
 import logging
-from typing import Any
-from ..base import BaseWorkflow
-from ..common import CollaborationChannel, TaskStatus
+from typing import Any, Optional
+from ..base import BaseWorkflow, BaseExecutionBackend
+from ..common import CollaborationChannel, RunContext, TaskStatus
 from ..agents import Component
 from ..agents.workers import TDDWorker
 
@@ -34,6 +34,8 @@ class TDDWorkflow(BaseWorkflow):
         llm: Any,
         task: str,
         verbose: bool = False,
+        execution_backend: Optional[BaseExecutionBackend] = None,
+        best_of_n: int = 1,
     ):
         """
         Initialize a TDDWorkflow instance.
@@ -44,6 +46,10 @@ class TDDWorkflow(BaseWorkflow):
             llm (Any): The language model to be used throughout the workflow.
             task (str): A description of the task to be performed using TDD.
             verbose (bool, optional): Enable verbose mode for detailed logging. Defaults to False.
+            execution_backend (BaseExecutionBackend, optional): The backend that runs the generated
+                code. Defaults to the shared Docker container pool.
+            best_of_n (int, optional): The number of candidate implementations to generate and
+                test at once. Defaults to 1.
         """
         super().__init__(llm, task, verbose)
         self.channel = CollaborationChannel(task)
@@ -51,10 +57,15 @@ class TDDWorkflow(BaseWorkflow):
         self.tdd = Component(
             "tdd",
             self.channel,
-            TDDWorker(model=llm, verbose=verbose),
+            TDDWorker(
+                model=llm,
+                verbose=verbose,
+                execution_backend=execution_backend,
+                best_of_n=best_of_n,
+            ),
         )
 
-    def _run_task(self) -> None:
+    def _run_task(self, context: RunContext) -> None:
         """
         Execute the main TDD workflow logic.
 
@@ -62,6 +73,9 @@ class TDDWorkflow(BaseWorkflow):
         running the tests, and generating code. It manages the task status, handles exceptions,
         and updates the memory with the final result.
 
+        Args:
+            context (RunContext): The run to execute.
+
         Returns:
             str: A success message or an error message if an exception occurs.
 
@@ -69,10 +83,10 @@ class TDDWorkflow(BaseWorkflow):
             ValueError: If the test class has not been set before running the workflow.
         """
         try:
-            logger.info(f"ReXia.AI is working on the TDD task: {self.task}")
+            logger.info(f"ReXia.AI is working on the TDD task: {context.task}")
 
-            self.channel.status = TaskStatus.WORKING
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
             
             if self.test_class is None:
                 logger.error("Test class has not been set.")
@@ -80,17 +94,17 @@ class TDDWorkflow(BaseWorkflow):
             
             # Set up the TDD worker
             self.tdd.worker.set_test_class(self.test_class)
-            self.tdd.run()
+            self.tdd.run(context)
 
-            self.channel.status = TaskStatus.COMPLETED
-            logger.debug(f"Task status set to: {self.channel.status}")
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
 
             # Add the final message to the memory
-            final_message = self.channel.messages[-1]
+            final_message = context.channel.messages[-1]
             if self.verbose:
                 logger.debug(f"Result: {final_message}")
 
-            logger.info(f"ReXia.AI has completed the TDD task: {self.channel.task}")
+            logger.info(f"ReXia.AI has completed the TDD task: {context.channel.task}")
 
         except Exception as e:
             logger.error(f"An error occurred while running the task: {e}", exc_info=True)
@@ -113,19 +127,84 @@ class TDDWorkflow(BaseWorkflow):
         self.tdd.worker.set_test_class(test_class)
         logger.info(f"Test class set: {test_class.__name__}")
         
-    def run(self) -> str:
+    def run(self, context: Optional[RunContext] = None) -> str:
         """
         Execute the TDD workflow.
 
         This method serves as the main entry point for running the TDD workflow.
         It invokes the _run_task method to process the task through all stages.
 
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
+        Returns:
+            str: A success message or an error message if an exception occurs.
+        """
+        try:
+            result = self._run_task(self._resolve_context(context))
+            return result
+        except Exception as e:
+            logger.error(f"TDD workflow execution failed: {e}", exc_info=True)
+            return f"An error occurred: {str(e)}"
+
+    async def _arun_task(self, context: RunContext) -> None:
+        """
+        Asynchronously execute the main task processing logic of the workflow.
+
+        Runs the same stages as _run_task, awaiting each component so that model
+        calls do not block the event loop.
+
+        Args:
+            context (RunContext): The run to execute.
+
+        Returns:
+            None
+        """
+        try:
+            logger.info(f"ReXia.AI is working on the TDD task: {context.task}")
+
+            context.channel.status = TaskStatus.WORKING
+            logger.debug(f"Task status set to: {context.channel.status}")
+            
+            if self.test_class is None:
+                logger.error("Test class has not been set.")
+                raise ValueError("Test class has not been set. Use set_test_class() before running the workflow.")
+            
+            # Set up the TDD worker
+            self.tdd.worker.set_test_class(self.test_class)
+            await self.tdd.arun(context)
+
+            context.channel.status = TaskStatus.COMPLETED
+            logger.debug(f"Task status set to: {context.channel.status}")
+
+            # Add the final message to the memory
+            final_message = context.channel.messages[-1]
+            if self.verbose:
+                logger.debug(f"Result: {final_message}")
+
+            logger.info(f"ReXia.AI has completed the TDD task: {context.channel.task}")
+
+        except Exception as e:
+            logger.error(f"An error occurred while running the task: {e}", exc_info=True)
+            raise
+
+    async def arun(self, context: Optional[RunContext] = None) -> str:
+        """
+        Asynchronously execute the TDD workflow.
+
+        This is the asynchronous entry point, mirroring run.
+
+        Args:
+            context (Optional[RunContext]): The run to execute. Defaults to a run on the
+                workflow's own task, model and channel.
+
         Returns:
             str: A success message or an error message if an exception occurs.
         """
         try:
-            result = self._run_task()
+            result = await self._arun_task(self._resolve_context(context))
             return result
         except Exception as e:
             logger.error(f"TDD workflow execution failed: {e}", exc_info=True)
-            return f"An error occurred: {str(e)}"
\ No newline at end of file
+            return f"An error occurred: {str(e)}"
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import re
+import threading
+import time
+import unittest
+from rexia_ai.agents import Agent
+
+
+class EchoLLM:
+    """Answers each prompt with its task, recording how many calls run at once."""
+
+    def __init__(self, delay=0.01):
+        self.tools = {}
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _respond(self, query):
+        task = re.search(r"Task:\n\n(.*?)\n\nCollaboration Chat", query, re.S).group(1)
+        return json.dumps({
+            "question": task, "plan": [], "tool_calls": [], "answer": [task],
+            "confidence_score": 90, "chain_of_reasoning": [],
+        })
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def invoke(self, query):
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            return self._respond(query)
+        finally:
+            self._exit()
+
+    async def ainvoke(self, query):
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+            return self._respond(query)
+        finally:
+            self._exit()
+
+
+class TestAgentBatch(unittest.TestCase):
+    def setUp(self):
+        self.llm = EchoLLM()
+        self.agent = Agent(llm=self.llm, task="original task")
+        self.tasks = [f"task {i}" for i in range(12)]
+
+    def test_invoke_many_isolates_tasks(self):
+        results = dict(self.agent.invoke_many(self.tasks, max_concurrency=4))
+        self.assertEqual(sorted(results), list(range(12)))
+        for index, response in results.items():
+            self.assertEqual(response.answer, [self.tasks[index]])
+        self.assertLessEqual(self.llm.max_in_flight, 4)
+        self.assertGreater(self.llm.max_in_flight, 1)
+        self.assertEqual(self.agent.task, "original task")
+        self.assertEqual(self.agent.workflow.channel.messages, [])
+
+    def test_ainvoke_many_isolates_tasks(self):
+        async def collect():
+            return {index: response async for index, response in self.agent.ainvoke_many(self.tasks, max_concurrency=3)}
+
+        results = asyncio.run(collect())
+        self.assertEqual(sorted(results), list(range(12)))
+        for index, response in results.items():
+            self.assertEqual(response.answer, [self.tasks[index]])
+        self.assertLessEqual(self.llm.max_in_flight, 3)
+        self.assertGreater(self.llm.max_in_flight, 1)
+
+    def test_results_arrive_as_tasks_complete(self):
+        first_index, _ = next(self.agent.invoke_many(["a", "b"], max_concurrency=2))
+        self.assertIn(first_index, (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from rexia_ai.tools import (
+    AlphaVantageClient,
+    RexiaAIAlphaVantageExchangeRate,
+    RexiaAIAlphaVantageQuoteEndpoint,
+)
+
+
+class FakeAlphaVantage(BaseHTTPRequestHandler):
+    """Answers every query with its parameters and counts the connections opened."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+    responses = []
+
+    def setup(self):
+        super().setup()
+        with FakeAlphaVantage.lock:
+            FakeAlphaVantage.connections += 1
+
+    def do_GET(self):
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        body = json.dumps(FakeAlphaVantage.responses.pop(0) if FakeAlphaVantage.responses else params)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAlphaVantageClient(unittest.TestCase):
+    def setUp(self):
+        FakeAlphaVantage.connections = 0
+        FakeAlphaVantage.responses = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAlphaVantage)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/query"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self, **kwargs):
+        return AlphaVantageClient("key", base_url=self.url, **kwargs)
+
+    def test_tools_share_one_kept_alive_connection(self):
+        client = self.client(requests_per_minute=None)
+        quote = RexiaAIAlphaVantageQuoteEndpoint("key", client=client)
+        exchange = RexiaAIAlphaVantageExchangeRate("key", client=client)
+
+        self.assertEqual(quote.get_quote_endpoint("IBM")["symbol"], "IBM")
+        self.assertEqual(exchange.get_exchange_rate("USD", "EUR")["to_currency"], "EUR")
+        self.assertEqual(quote.get_quote_endpoint("MSFT")["function"], "GLOBAL_QUOTE")
+        self.assertEqual(FakeAlphaVantage.connections, 1)
+        client.close()
+
+    def test_requests_queue_for_the_rate_limit(self):
+        client = self.client(requests_per_minute=120)
+        client.rate_limiter._request_tokens = 1.0
+        started = time.monotonic()
+        client.query("GLOBAL_QUOTE", symbol="IBM")
+        client.query("GLOBAL_QUOTE", symbol="IBM")
+        self.assertGreaterEqual(time.monotonic() - started, 0.4)
+        self.assertEqual(client.get_stats()["throttled"], 1)
+        client.close()
+
+    def test_limit_message_pauses_the_key(self):
+        client = self.client(requests_per_minute=None, limit_pause=30)
+        FakeAlphaVantage.responses = [{"Note": "Thank you for using Alpha Vantage! Our standard API rate limit is..."}]
+        with self.assertRaises(ValueError):
+            client.query("GLOBAL_QUOTE", symbol="IBM")
+        self.assertEqual(client.get_stats()["deferrals"], 1)
+        client.close()
+
+    def test_errors_are_raised(self):
+        client = self.client(requests_per_minute=None)
+        FakeAlphaVantage.responses = [{"Error Message": "Invalid API call."}]
+        with self.assertRaises(ValueError):
+            client.query("GLOBAL_QUOTE", symbol="")
+        client.close()
+
+    def test_client_is_shared_per_api_key(self):
+        self.assertIs(AlphaVantageClient.for_api_key("shared"), AlphaVantageClient.for_api_key("shared"))
+        self.assertIsNot(AlphaVantageClient.for_api_key("shared"), AlphaVantageClient.for_api_key("other"))
+        self.assertIs(RexiaAIAlphaVantageQuoteEndpoint("shared").client, AlphaVantageClient.for_api_key("shared"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Benchmark Utility.extract_json_string against the nested regex it replaced.
+
+"same result: False" marks inputs the regex got wrong: it matches braces inside strings
+and cannot see past three levels of nesting.
+
+Run from the tests directory: python benchmarks/extract_json_benchmark.py
+"""
+
+import json
+import re
+import time
+from rexia_ai.common import Utility
+
+LEGACY_PATTERN = re.compile(r"\{(?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*\}", re.DOTALL)
+
+
+def legacy_extract(text):
+    match = LEGACY_PATTERN.search(text)
+    return match.group(0) if match else text
+
+
+def make_inputs(size):
+    """Model-like outputs of roughly `size` characters."""
+    line = "    result = {key: value for key, value in items.items() if value}  # {comment}"
+    answer = [line] * (size // len(line))
+    valid = json.dumps(
+        {
+            "question": "Refactor the module",
+            "plan": ["Read", "Refactor"],
+            "tool_calls": [{"name": "Search", "parameters": {"query": {"filter": {"and": [{"eq": 1}]}}}}],
+            "answer": answer,
+            "confidence_score": 90.0,
+            "chain_of_reasoning": ["Because"],
+        }
+    )
+    deep = json.dumps({"tool_calls": [{"name": "Query", "parameters": {"where": {"and": [{"or": answer}]}}}]})
+    return {
+        "valid": "Here is the response:\n```json\n" + valid + "\n```",
+        "deep nesting": deep,
+        "unclosed prose": "Thinking... " + "{ word word word " * (size // 17),
+        "unmatched braces": "Thinking... " + "{ " * (size // 2),
+        "truncated": valid[: len(valid) // 2],
+    }
+
+
+def timed(func, text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    for size in (100_000, 500_000):
+        for name, text in make_inputs(size).items():
+            legacy = timed(legacy_extract, text)
+            scanner = timed(Utility.extract_json_string, text)
+            same = legacy_extract(text) == Utility.extract_json_string(text)
+            print(
+                f"{len(text) // 1000:>4} KB {name:<17} regex {legacy * 1000:9.1f} ms"
+                f"   scanner {scanner * 1000:7.1f} ms   same result: {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
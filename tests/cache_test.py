@@ -0,0 +1,122 @@
+import os
+import time
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from rexia_ai.common import InMemoryCache, SQLiteCache
+from rexia_ai.llms import RexiaAIOpenAI
+
+
+class TestInMemoryCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = InMemoryCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_entries_expire(self):
+        cache = InMemoryCache(ttl=0.05)
+        cache.set("a", "1")
+        self.assertEqual(cache.get("a"), "1")
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("a"))
+
+    def test_counts_hits_and_misses(self):
+        cache = InMemoryCache()
+        cache.set("a", "1")
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_entries_are_shared_between_instances(self):
+        SQLiteCache(self.path).set("a", {"answer": 42})
+        self.assertEqual(SQLiteCache(self.path).get("a"), {"answer": 42})
+
+    def test_evicts_least_recently_used(self):
+        cache = SQLiteCache(self.path, max_entries=2)
+        cache.set("a", "1")
+        time.sleep(0.01)
+        cache.set("b", "2")
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", "3")
+
+        self.assertEqual(cache.size(), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+
+    def test_connections_are_closed(self):
+        opened = []
+        real_connect = sqlite3.connect
+
+        class TrackedConnection(sqlite3.Connection):
+            def close(self):
+                opened.remove(self)
+                super().close()
+
+        def connect(*args, **kwargs):
+            conn = real_connect(*args, factory=TrackedConnection, **kwargs)
+            opened.append(conn)
+            return conn
+
+        with mock.patch("rexia_ai.common.cache.sqlite3.connect", connect):
+            cache = SQLiteCache(self.path)
+            cache.set("a", "1")
+            cache.get("a")
+        self.assertEqual(opened, [])
+
+    def test_entries_expire(self):
+        cache = SQLiteCache(self.path)
+        cache.set("a", "1", ttl=0.05)
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("a"))
+
+
+class TestRexiaAIOpenAICache(unittest.TestCase):
+    def setUp(self):
+        self.llm = RexiaAIOpenAI(
+            base_url="http://localhost:1234/v1",
+            model="lm-studio",
+            temperature=0.0,
+            api_key="not-needed",
+            cache=InMemoryCache(),
+        )
+
+    def test_identical_prompts_call_the_api_once(self):
+        with mock.patch.object(
+            RexiaAIOpenAI, "_invoke_with_retry", return_value="Paris"
+        ) as api_call:
+            self.assertEqual(self.llm.invoke("What is the capital of France?"), "Paris")
+            self.assertEqual(self.llm.invoke("What is the capital of France?"), "Paris")
+            self.llm.invoke("What is the capital of Spain?")
+
+        self.assertEqual(api_call.call_count, 2)
+        self.assertEqual(self.llm.cache.get_stats()["hits"], 1)
+
+    def test_key_depends_on_sampling_settings(self):
+        key = self.llm._cache_key("prompt")
+        self.llm.temperature = 0.7
+        self.assertNotEqual(key, self.llm._cache_key("prompt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,8 +29,9 @@ class TestCollaborationWorkflow(unittest.TestCase):
         )
 
     def test_collaboration_workflow(self):
-        response = self.agent.invoke()
-        messages = self.agent.workflow.channel.messages
+        context = self.agent.create_context()
+        response = self.agent.invoke(context=context)
+        messages = context.channel.messages
 
         verified_response = self.llm_verification.verify(
             LLMVerification.get_verification_prompt()
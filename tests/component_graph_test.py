@@ -0,0 +1,96 @@
+import asyncio
+import time
+import unittest
+from rexia_ai.agents import Component, ComponentGraph
+from rexia_ai.common import CollaborationChannel, RunContext
+from rexia_ai.workflows import ReflectWorkflow
+from agent_batch_test import EchoLLM
+
+
+class FakeTool:
+    def to_rexiaai_tool(self):
+        return {"name": "search"}
+
+    def to_rexiaai_function_call(self):
+        return {"name": "search", "parameters": {}}
+
+
+class RecordingWorker:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.seen = None
+
+    def create_prompt(self, task, messages):
+        self.seen = list(messages)
+        return task
+
+    def action(self, prompt, worker_name):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("worker failed")
+        return f"{worker_name}: done"
+
+    async def aaction(self, prompt, worker_name):
+        await asyncio.sleep(self.delay)
+        return f"{worker_name}: done"
+
+
+def component(name, depends_on=None, **kwargs):
+    return Component(name, CollaborationChannel("task"), RecordingWorker(**kwargs), depends_on=depends_on)
+
+
+class TestComponentGraph(unittest.TestCase):
+    def test_components_see_ancestor_messages_in_component_order(self):
+        a, b = component("a", delay=0.05), component("b")
+        c = component("c", depends_on=["a", "b"])
+        d = component("d", depends_on=["c"])
+        responses = ComponentGraph([a, b, c, d]).run(RunContext(task="task"))
+        self.assertEqual(a.worker.seen, [])
+        self.assertEqual(b.worker.seen, [])
+        self.assertEqual(d.worker.seen, ["a: done", "b: done", "c: done"])
+        self.assertEqual(responses["d"], "d: done")
+
+    def test_independent_components_run_concurrently(self):
+        components = [component(name, delay=0.2) for name in "abc"]
+        started = time.monotonic()
+        asyncio.run(ComponentGraph(components).arun(RunContext(task="task")))
+        self.assertLess(time.monotonic() - started, 0.4)
+
+    def test_skipped_components_count_as_done(self):
+        a = component("a")
+        b = component("b", depends_on=["a"])
+        responses = ComponentGraph([a, b]).run(RunContext(task="task"), skip=["a"])
+        self.assertEqual(list(responses), ["b"])
+        self.assertEqual(b.worker.seen, [])
+
+    def test_first_error_is_raised_and_dependants_do_not_run(self):
+        a = component("a", fail=True)
+        b = component("b", depends_on=["a"])
+        with self.assertRaises(RuntimeError):
+            ComponentGraph([a, b]).run(RunContext(task="task"))
+        self.assertIsNone(b.worker.seen)
+
+    def test_invalid_graphs_are_rejected(self):
+        with self.assertRaises(ValueError):
+            ComponentGraph([component("a", depends_on=["missing"])])
+        with self.assertRaises(ValueError):
+            ComponentGraph([component("a", depends_on=["b"]), component("b", depends_on=["a"])])
+
+    def test_reflect_workflow_overlaps_planning_and_tools(self):
+        delay = 0.2
+        llm = EchoLLM(delay=delay)
+        llm.tools = {"search": FakeTool()}
+        workflow = ReflectWorkflow(llm=llm, task="task")
+        context = workflow.create_context()
+        started = time.monotonic()
+        workflow.run(context)
+        elapsed = time.monotonic() - started
+        self.assertEqual(len(context.channel.messages), 4)
+        self.assertTrue(context.channel.messages[-1].startswith("finalise:"))
+        self.assertEqual(llm.max_in_flight, 2)
+        self.assertLess(elapsed, 3.6 * delay)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+import io
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from docker.models.containers import ExecResult
+from rexia_ai.common import ContainerPool, ContainerisedCodeTester, ContainerisedToolRunner, SandboxManager
+
+
+def _namespaces_available():
+    if shutil.which("unshare") is None or shutil.which("nsenter") is None:
+        return False
+    probe = subprocess.run(["unshare", "-rpf", "--mount-proc", "true"], capture_output=True)
+    return probe.returncode == 0
+
+
+NAMESPACES_AVAILABLE = _namespaces_available()
+
+
+class FakeContainer:
+    """
+    A local stand-in for a container: a PID namespace whose PID 1 sleeps, with its own /app and
+    /tmp directories. put_archive unpacks into /app and exec_run runs commands in the namespace,
+    so the job script's `kill -9 -1` only reaches the fake container's processes.
+    """
+
+    def __init__(self):
+        if not NAMESPACES_AVAILABLE:
+            raise unittest.SkipTest("unprivileged PID namespaces are not available")
+        self.root = tempfile.mkdtemp()
+        self.paths = {"app": os.path.join(self.root, "app"), "tmp": os.path.join(self.root, "tmp")}
+        for path in self.paths.values():
+            os.mkdir(path)
+        self.removed = False
+        self.execs = 0
+        self.archives = 0
+        self.unshare = subprocess.Popen(
+            ["unshare", "-rpf", "--mount-proc", "sleep", "infinity"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self.init_pid = self._wait_for_init()
+
+    def _wait_for_init(self):
+        children = f"/proc/{self.unshare.pid}/task/{self.unshare.pid}/children"
+        for _ in range(500):
+            with open(children) as f:
+                pids = f.read().split()
+            if pids:
+                return pids[0]
+            time.sleep(0.01)
+        raise RuntimeError("Fake container did not start")
+
+    def _local(self, part):
+        return re.sub(r"/(app|tmp)\b", lambda match: self.paths[match.group(1)], part)
+
+    def put_archive(self, path, data):
+        self.archives += 1
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            tar.extractall(self._local(path))
+        return True
+
+    def exec_run(self, cmd, workdir, demux):
+        self.execs += 1
+        nsenter = ["nsenter", "-t", self.init_pid, "-U", "-p", "-m", "--preserve-credentials"]
+        nsenter.append(f"--wd={self._local(workdir)}")
+        command = nsenter + [sys.executable if part == "python" else self._local(part) for part in cmd]
+        env = dict(os.environ, TMPDIR=self.paths["tmp"])
+        completed = subprocess.run(command, env=env, capture_output=True)
+        status = completed.returncode if completed.returncode >= 0 else 128 - completed.returncode
+        return ExecResult(status, (completed.stdout or None, completed.stderr or None))
+
+    def remove(self, v, force):
+        self.removed = True
+        self.unshare.kill()
+        self.unshare.wait()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class FakeClient:
+    def __init__(self, start_delay=0.0):
+        self.containers = self
+        self.started = []
+        self.start_delay = start_delay
+        self.kwargs = None
+
+    def run(self, image, **kwargs):
+        time.sleep(self.start_delay)
+        self.kwargs = kwargs
+        container = FakeContainer()
+        self.started.append(container)
+        return container
+
+
+class Adder:
+    @classmethod
+    def setUpClass(cls):
+        pass
+
+    @classmethod
+    def test_adds(cls, add):
+        assert add(2, 3) == 5
+
+
+class TestContainerPool(unittest.TestCase):
+    def test_containers_are_reused_and_sandboxed(self):
+        client = FakeClient()
+        pool = ContainerPool(client, size=1)
+        for i in range(3):
+            status, stdout, _ = pool.run({"main.py": f"print({i})"}, ["python", "main.py"], 5)
+            self.assertEqual((status, stdout.strip()), (0, str(i)))
+
+        self.assertEqual(len(client.started), 1)
+        self.assertEqual(client.kwargs["network_mode"], "none")
+        self.assertTrue(client.kwargs["read_only"])
+        self.assertNotIn("volumes", client.kwargs)
+        self.assertEqual(client.kwargs["mounts"][0]["Target"], "/app")
+        self.assertEqual(client.started[0].archives, 3)
+        self.assertEqual(pool.get_stats()["jobs"], 3)
+        pool.close()
+        self.assertTrue(client.started[0].removed)
+
+    def test_warm_containers_skip_start_up(self):
+        client = FakeClient(start_delay=0.3)
+        pool = ContainerPool(client, size=2)
+        pool.warm()
+        started = time.monotonic()
+        pool.run({"main.py": "pass"}, ["python", "main.py"], 5)
+        self.assertLess(time.monotonic() - started, 0.3)
+        self.assertEqual(pool.get_stats()["idle"], 2)
+        pool.close()
+
+    def test_containers_are_recycled_after_max_jobs(self):
+        client = FakeClient()
+        pool = ContainerPool(client, size=1, max_jobs=2)
+        for _ in range(3):
+            pool.run({"main.py": "pass"}, ["python", "main.py"], 5)
+        self.assertEqual(len(client.started), 2)
+        self.assertTrue(client.started[0].removed)
+        self.assertEqual(pool.get_stats()["recycled"], 1)
+        pool.close()
+
+    def test_containers_are_recycled_after_a_crash_or_timeout(self):
+        client = FakeClient()
+        pool = ContainerPool(client, size=1)
+        status, _, _ = pool.run({"main.py": "import os; os._exit(3)"}, ["python", "main.py"], 5)
+        self.assertEqual(status, 3)
+        status, _, _ = pool.run({"main.py": "import time; time.sleep(5)"}, ["python", "main.py"], 1)
+        self.assertEqual(status, 137)
+
+        stats = pool.get_stats()
+        self.assertEqual((stats["failures"], stats["timeouts"], stats["recycled"]), (1, 1, 2))
+        self.assertTrue(client.started[0].removed)
+        pool.close()
+
+    def test_files_from_earlier_jobs_are_removed(self):
+        pool = ContainerPool(FakeClient(), size=1)
+        pool.run({"main.py": "pass", "old.py": ""}, ["python", "main.py"], 5)
+        status, stdout, _ = pool.run(
+            {"main.py": "import os; print(sorted(os.listdir('.')))"}, ["python", "main.py"], 5
+        )
+        self.assertEqual(stdout.strip(), "['main.py']")
+        pool.close()
+
+    def test_files_are_sent_as_a_tar_archive(self):
+        archive = ContainerPool._archive({"main.py": "print('hi')", "pkg/mod.py": "x = 1"}, "job")
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            self.assertEqual(tar.getnames(), ["job", "job/main.py", "job/pkg/mod.py"])
+            self.assertEqual(tar.extractfile("job/pkg/mod.py").read(), b"x = 1")
+
+    def test_killed_exec_replaces_the_container(self):
+        client = FakeClient()
+        pool = ContainerPool(client, size=1)
+        # Kills the job script before it can empty /app.
+        status, _, _ = pool.run({"main.py": "import os; os.kill(-1, 9)", "left.txt": ""}, ["python", "main.py"], 5)
+        self.assertEqual(status, 137)
+        self.assertTrue(client.started[0].removed)
+
+        status, stdout, _ = pool.run({"main.py": "import os; print(len(os.listdir('..')))"}, ["python", "main.py"], 5)
+        self.assertEqual((status, stdout.strip()), (0, "1"))
+        self.assertEqual(len(client.started), 2)
+        pool.close()
+
+    def test_jobs_do_not_run_over_files_left_in_app(self):
+        client = FakeClient()
+        pool = ContainerPool(client, size=1)
+        pool.warm()
+        client.started[0].put_archive("/app", ContainerPool._archive({"stale.py": ""}, "earlier-job"))
+        status, stdout, _ = pool.run({"main.py": "import os; print(os.listdir('..'))"}, ["python", "main.py"], 5)
+
+        self.assertEqual(status, 0)
+        self.assertNotIn("earlier-job", stdout)
+        self.assertEqual(pool.get_stats()["dirty"], 1)
+        self.assertTrue(client.started[0].removed)
+        pool.close()
+
+    def test_tmp_and_processes_do_not_survive_a_job(self):
+        client = FakeClient()
+        pool = ContainerPool(client, size=1)
+        leave_behind = (
+            "import subprocess, tempfile\n"
+            "open(tempfile.gettempdir() + '/secret', 'w').write('x')\n"
+            "subprocess.Popen(['sleep', '60'], start_new_session=True)\n"
+        )
+        pool.run({"main.py": leave_behind}, ["python", "main.py"], 5)
+        inspect = (
+            "import os, tempfile\n"
+            "pids = [name for name in os.listdir('/proc') if name.isdigit()]\n"
+            "comms = sorted(open(f'/proc/{pid}/comm').read().strip() for pid in pids)\n"
+            "print(os.listdir(tempfile.gettempdir()), comms.count('sleep'), len(comms))\n"
+        )
+        status, stdout, _ = pool.run({"main.py": inspect}, ["python", "main.py"], 5)
+
+        # PID 1, the job script, timeout and the job itself.
+        self.assertEqual((status, stdout.strip()), (0, "[] 1 4"))
+        self.assertEqual(pool.get_stats()["dirty"], 1)
+        self.assertEqual(len(client.started), 2)
+        self.assertTrue(client.started[0].removed)
+        pool.close()
+
+    def test_jobs_wait_when_every_container_is_busy(self):
+        client = FakeClient()
+        pool = ContainerPool(client, size=1)
+        threads = [
+            threading.Thread(target=pool.run, args=({"main.py": "import time; time.sleep(0.2)"}, ["python", "main.py"], 5))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(client.started), 1)
+        self.assertEqual(pool.get_stats()["waits"], 1)
+        pool.close()
+
+
+class TestContainerisedRunners(unittest.TestCase):
+    def test_code_tester_runs_tests_in_the_pool(self):
+        with mock.patch("docker.from_env", return_value=FakeClient()):
+            manager = SandboxManager()
+            tester = ContainerisedCodeTester(manager=manager)
+        results = tester.execute_code("def add(a, b):\n    return a + b\n", Adder)
+        self.assertTrue(results["all_passed"], results)
+        self.assertEqual(results["passed"], ["test_adds"])
+        manager.close()
+
+    def test_tool_runner_runs_code_in_the_pool(self):
+        with mock.patch("docker.from_env", return_value=FakeClient()):
+            manager = SandboxManager()
+            runner = ContainerisedToolRunner(manager=manager)
+        result = runner.execute_code("def main():\n    return 42\n")
+        self.assertEqual(result, {"success": True, "output": '{"result": 42}\n'})
+        manager.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from rexia_ai.base import BaseWorker
+from rexia_ai.common import ContextWindow, Utility
+
+
+class FakeModel:
+    def __init__(self, context_window):
+        self.context_window = context_window
+        self.tools = {}
+
+
+class TestContextWindow(unittest.TestCase):
+    def test_small_history_is_unchanged(self):
+        window = ContextWindow(max_tokens=1000)
+        messages = ["plan_worker: step one", "tool_worker: result"]
+        self.assertEqual(window.build("task", messages), messages)
+
+    def test_prompt_size_stops_growing_with_history(self):
+        window = ContextWindow(max_tokens=300, keep_recent=2, summary_tokens=20)
+        sizes = []
+        messages = []
+        for i in range(40):
+            messages.append(f"worker_{i}: " + "x" * 200)
+            built = window.build("task", messages)
+            sizes.append(sum(Utility.estimate_tokens(m) for m in built))
+        self.assertLessEqual(max(sizes), 300 + 20)
+        self.assertEqual(built[-2:], messages[-2:])
+        self.assertTrue(built[0].startswith("["))
+
+    def test_relevant_older_messages_are_kept_verbatim(self):
+        window = ContextWindow(max_tokens=120, keep_recent=1, summary_tokens=5)
+        relevant = "research_worker: the capital of France is Paris"
+        messages = [relevant] + [f"worker_{i}: " + "y" * 100 for i in range(5)] + ["final"]
+        built = window.build("What is the capital of France?", messages)
+        self.assertIn(relevant, built)
+        self.assertEqual(built[-1], "final")
+
+    def test_recent_messages_past_the_budget_are_dropped_not_emptied(self):
+        window = ContextWindow(max_tokens=50, keep_recent=3)
+        messages = ["a: " + "x" * 400, "b: " + "y" * 400, "c: " + "z" * 400]
+        built = window.build("task", messages)
+
+        self.assertNotIn("", built)
+        self.assertEqual(built[0], "[2 earlier messages omitted to fit the context window]")
+        self.assertTrue(built[1].startswith("c: "))
+        stats = window.get_stats()
+        self.assertEqual((stats["summarised"], stats["dropped"]), (1, 2))
+
+    def test_summaries_are_cached_per_message(self):
+        calls = []
+
+        def summarise(message, max_tokens):
+            calls.append(message)
+            return message[:10]
+
+        window = ContextWindow(max_tokens=60, keep_recent=1, summariser=summarise)
+        messages = ["a" * 400, "b" * 400, "recent"]
+        window.build("task", messages)
+        window.build("task", messages + ["newer"])
+        self.assertEqual(sorted(calls), ["a" * 400, "b" * 400])
+        self.assertEqual(window.get_stats()["summary_cache"]["hits"], 2)
+
+    def test_worker_prompt_uses_model_context_window(self):
+        worker = BaseWorker(FakeModel(ContextWindow(max_tokens=100, keep_recent=1)))
+        messages = ["old: " + "z" * 2000, "recent: keep me"]
+        prompt = worker._format_additional_context(messages, "task")
+        self.assertIn("recent: keep me", prompt)
+        self.assertNotIn("z" * 2000, prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import asyncio
+import functools
+import json
+import unittest
+from rexia_ai.agents import Agent
+from rexia_ai.structure import RexiaAIResponse
+from rexia_ai.workflows import EarlyExitPolicy, ReflectWorkflow
+from agent_batch_test import EchoLLM
+
+
+class ConfidentLLM(EchoLLM):
+    def __init__(self, confidence, tool_calls=None):
+        super().__init__(delay=0.0)
+        self.confidence = confidence
+        self.tool_calls = tool_calls or []
+        self.calls = 0
+
+    def _respond(self, query):
+        self.calls += 1
+        return json.dumps({
+            "question": "q", "plan": [], "tool_calls": self.tool_calls, "answer": ["42"],
+            "confidence_score": self.confidence, "chain_of_reasoning": [],
+        })
+
+
+class TestEarlyExitPolicy(unittest.TestCase):
+    def run_workflow(self, llm, policy):
+        workflow = ReflectWorkflow(llm=llm, task="task", early_exit=policy)
+        context = workflow.create_context()
+        workflow.run(context)
+        return context.channel.messages
+
+    def test_confident_answer_skips_finalise(self):
+        policy = EarlyExitPolicy(threshold=90)
+        llm = ConfidentLLM(confidence=97)
+        messages = self.run_workflow(llm, policy)
+        self.assertEqual(llm.calls, 2)
+        self.assertTrue(messages[-1].startswith("work:"))
+        self.assertEqual(policy.get_stats()["exits"], 1)
+        self.assertEqual(policy.get_stats()["skip_rate"], 1.0)
+
+    def test_unconfident_answer_is_finalised(self):
+        policy = EarlyExitPolicy(threshold=90)
+        llm = ConfidentLLM(confidence=60)
+        messages = self.run_workflow(llm, policy)
+        self.assertEqual(llm.calls, 3)
+        self.assertTrue(messages[-1].startswith("finalise:"))
+        stats = policy.get_stats()
+        self.assertEqual((stats["evaluated"], stats["exits"]), (1, 0))
+        self.assertGreater(stats["mean_finalise_latency"], 0)
+
+    def test_pending_tool_calls_fail_validation(self):
+        policy = EarlyExitPolicy(threshold=90)
+        llm = ConfidentLLM(confidence=99, tool_calls=[{"name": "search", "parameters": {}}])
+        self.assertTrue(self.run_workflow(llm, policy)[-1].startswith("finalise:"))
+
+    def test_custom_validator(self):
+        policy = EarlyExitPolicy(threshold=50, validator=lambda response: response.answer == ["43"])
+        self.assertTrue(self.run_workflow(ConfidentLLM(confidence=99), policy)[-1].startswith("finalise:"))
+
+    def test_agent_returns_work_answer_on_early_exit(self):
+        policy = EarlyExitPolicy(threshold=90)
+        llm = ConfidentLLM(confidence=95)
+        agent = Agent(llm=llm, task="task", workflow=functools.partial(ReflectWorkflow, early_exit=policy))
+        response = asyncio.run(agent.ainvoke())
+        self.assertIsInstance(response, RexiaAIResponse)
+        self.assertEqual(response.answer, ["42"])
+        self.assertEqual(llm.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
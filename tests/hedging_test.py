@@ -0,0 +1,92 @@
+import asyncio
+import time
+import unittest
+from rexia_ai.llms import HedgePolicy, RexiaAIOpenAIPool
+from openai_pool_test import FakeEndpoint
+
+
+def warm_up(policy, latency=0.01, samples=20):
+    """Give the policy enough latency samples to start hedging."""
+    for _ in range(samples):
+        policy._record_latency(latency)
+
+
+class TestHedgePolicy(unittest.TestCase):
+    def test_no_hedge_before_min_samples(self):
+        policy = HedgePolicy(min_samples=20, max_hedge_rate=1.0)
+        calls = []
+
+        def slow():
+            calls.append("primary")
+            time.sleep(0.05)
+            return "primary"
+
+        self.assertEqual(policy.call(slow, lambda: calls.append("hedge") or "hedge"), "primary")
+        self.assertEqual(calls, ["primary"])
+        self.assertEqual(policy.get_stats()["hedges"], 0)
+
+    def test_hedge_wins_when_primary_is_slow(self):
+        policy = HedgePolicy(max_hedge_rate=1.0)
+        warm_up(policy)
+
+        def slow():
+            time.sleep(0.5)
+            return "primary"
+
+        started = time.monotonic()
+        self.assertEqual(policy.call(slow, lambda: "hedge"), "hedge")
+        self.assertLess(time.monotonic() - started, 0.4)
+        stats = policy.get_stats()
+        self.assertEqual((stats["hedges"], stats["hedge_wins"]), (1, 1))
+
+    def test_budget_caps_hedge_rate(self):
+        policy = HedgePolicy(max_hedge_rate=0.5)
+        warm_up(policy)
+
+        def slow():
+            time.sleep(0.05)
+            return "primary"
+
+        for _ in range(6):
+            policy.call(slow, slow)
+        stats = policy.get_stats()
+        self.assertLessEqual(stats["hedge_rate"], 0.5)
+        self.assertGreater(stats["hedges"], 0)
+
+    def test_async_hedge_cancels_loser(self):
+        policy = HedgePolicy(max_hedge_rate=1.0)
+        warm_up(policy)
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "primary"
+
+        async def fast():
+            return "hedge"
+
+        self.assertEqual(asyncio.run(policy.acall(slow, fast)), "hedge")
+        self.assertEqual(cancelled, [True])
+
+    def test_pool_hedges_to_another_endpoint(self):
+        slow = FakeEndpoint("http://slow/v1", latency=1.0)
+        fast = FakeEndpoint("http://fast/v1")
+        policy = HedgePolicy(max_hedge_rate=1.0)
+        warm_up(policy)
+        pool = RexiaAIOpenAIPool([slow, fast], hedging=policy)
+        # Make the slow endpoint the first choice.
+        pool._states[1].outstanding = 1
+
+        response = asyncio.run(pool.ainvoke("hello"))
+
+        self.assertEqual(response, "http://fast/v1: hello")
+        self.assertEqual(policy.get_stats()["hedge_wins"], 1)
+        self.assertEqual([s["outstanding"] for s in pool.get_stats()], [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,8 +40,9 @@ class TestImageAnalysisTool(unittest.TestCase):
         )
 
     def test_response_format(self):
-        response = self.agent.invoke()
-        messages = self.agent.workflow.channel.messages
+        context = self.agent.create_context()
+        response = self.agent.invoke(context=context)
+        messages = context.channel.messages
         verified_response = self.llm_verification.verify(
             LLMVerification.get_verification_prompt()
             + "\n\n Task:" + self.agent.task
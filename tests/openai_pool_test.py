@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+from rexia_ai.common import InMemoryCache
+from rexia_ai.llms import RexiaAIOpenAIPool
+from rexia_ai.llms.rexia_ai_openai import APICallError
+
+
+class FakeEndpoint:
+    """Stands in for a RexiaAIOpenAI endpoint without making network calls."""
+
+    def __init__(self, base_url, fail=False, latency=0.0):
+        self.openai_api_base = base_url
+        self.model_name = "lm-studio"
+        self.temperature = 0.0
+        self.max_tokens = 4096
+        self.tools = {}
+        self.structured_output = None
+        self.prefix_tracker = None
+        self.fail = fail
+        self.latency = latency
+        self.calls = 0
+
+    def with_sampling(self, temperature, seed=None):
+        sampled = FakeEndpoint(self.openai_api_base)
+        sampled.temperature = temperature
+        return sampled
+
+    def _invoke_once(self, query, response_schema=None):
+        self.calls += 1
+        if self.fail:
+            raise APICallError(f"{self.openai_api_base} is down")
+        return f"{self.openai_api_base}: {query}"
+
+    async def _ainvoke_once(self, query, response_schema=None):
+        await asyncio.sleep(self.latency)
+        return self._invoke_once(query)
+
+
+class TestRexiaAIOpenAIPool(unittest.TestCase):
+    def test_fails_over_to_a_different_endpoint(self):
+        down = FakeEndpoint("http://down/v1", fail=True)
+        up = FakeEndpoint("http://up/v1")
+        pool = RexiaAIOpenAIPool([down, up])
+
+        self.assertEqual(pool.invoke("hello"), "http://up/v1: hello")
+        self.assertEqual((down.calls, up.calls), (1, 1))
+
+    def test_ejects_unhealthy_endpoint(self):
+        down = FakeEndpoint("http://down/v1", fail=True)
+        up = FakeEndpoint("http://up/v1")
+        pool = RexiaAIOpenAIPool([down, up], failure_threshold=2, recovery_timeout=60)
+
+        for _ in range(10):
+            pool.invoke("hello")
+
+        self.assertEqual(down.calls, 2)
+        self.assertFalse(pool.get_stats()[0]["healthy"])
+
+    def test_ejected_endpoint_gets_a_trial_after_recovery_timeout(self):
+        flaky = FakeEndpoint("http://flaky/v1", fail=True)
+        up = FakeEndpoint("http://up/v1")
+        pool = RexiaAIOpenAIPool([flaky, up], failure_threshold=1, recovery_timeout=0)
+
+        pool.invoke("hello")
+        flaky.fail = False
+        for _ in range(4):
+            pool.invoke("hello")
+
+        self.assertTrue(pool.get_stats()[0]["healthy"])
+        self.assertGreater(flaky.calls, 1)
+
+    def test_spreads_concurrent_requests_by_outstanding_count(self):
+        endpoints = [FakeEndpoint(f"http://replica-{i}/v1", latency=0.05) for i in range(3)]
+        pool = RexiaAIOpenAIPool(endpoints)
+
+        async def run():
+            return await asyncio.gather(*(pool.ainvoke(str(i)) for i in range(9)))
+
+        asyncio.run(run())
+        self.assertEqual([endpoint.calls for endpoint in endpoints], [3, 3, 3])
+
+    def test_raises_when_every_endpoint_fails(self):
+        pool = RexiaAIOpenAIPool([FakeEndpoint("http://down/v1", fail=True)], max_attempts=1)
+        with self.assertRaises(APICallError):
+            pool.invoke("hello")
+
+    def test_sampled_view_bypasses_the_cache_and_shares_endpoint_state(self):
+        endpoint = FakeEndpoint("http://up/v1")
+        pool = RexiaAIOpenAIPool([endpoint], cache=InMemoryCache())
+        pool.invoke("hello")
+
+        view = pool.with_sampling(0.7, seed=1)
+        self.assertEqual(view.invoke("hello"), "http://up/v1: hello")
+        self.assertIsNotNone(pool.cache)
+        self.assertEqual(pool.cache.get_stats()["hits"], 0)
+        self.assertEqual(pool.get_stats()[0]["requests"], 2)
+        # The view's request went to a sampled copy of the endpoint.
+        self.assertEqual(endpoint.calls, 1)
+
+    def test_tools_are_shared_with_endpoints(self):
+        endpoints = [FakeEndpoint("http://a/v1"), FakeEndpoint("http://b/v1")]
+        pool = RexiaAIOpenAIPool(endpoints)
+        pool.tools = {"google_search": object()}
+        self.assertTrue(all("google_search" in endpoint.tools for endpoint in endpoints))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from langchain_openai import ChatOpenAI
+from rexia_ai.agents.workers import FinaliseWorker, PlanWorker, ToolWorker
+from rexia_ai.common import PrefixTracker
+from rexia_ai.llms import RexiaAIOpenAI
+
+
+class FakeModel:
+    def __init__(self, prefix_caching):
+        self.tools = {}
+        self.context_window = None
+        self.prefix_caching = prefix_caching
+
+
+class TestPrefixTracker(unittest.TestCase):
+    def test_measures_longest_prefix_shared_with_recent_prompts(self):
+        tracker = PrefixTracker(window=2)
+        self.assertEqual(tracker.record("static A task"), 0)
+        self.assertEqual(tracker.record("static B task"), 7)
+        self.assertEqual(tracker.record("static A other"), 9)
+        stats = tracker.get_stats()
+        self.assertEqual(stats["prompts"], 3)
+        self.assertEqual(stats["last_shared_prefix"], 9)
+        self.assertAlmostEqual(stats["shared_prefix_ratio"], 16 / 40)
+
+    def test_prefix_layout_puts_task_and_chat_last(self):
+        worker = PlanWorker(FakeModel(prefix_caching=True))
+        prompt = worker.create_prompt("the task", ["plan_worker: hello"])
+        self.assertTrue(prompt.startswith(worker.get_structured_output_prompt()))
+        self.assertTrue(prompt.endswith("plan_worker: hello"))
+        self.assertLess(prompt.index("the task"), prompt.index("plan_worker: hello"))
+
+    def test_prefix_layout_shares_more_prompt_between_stages(self):
+        def shared(prefix_caching):
+            model = FakeModel(prefix_caching)
+            messages = ["plan_worker: step one"]
+            first = PlanWorker(model).create_prompt("task", messages)
+            second = FinaliseWorker(model).create_prompt("task", messages + ["tool_worker: done"])
+            return PrefixTracker.shared_prefix_length(first, second)
+
+        self.assertGreater(shared(True), shared(False) + 500)
+
+    def test_same_worker_prompts_differ_only_at_the_tail(self):
+        worker = ToolWorker(FakeModel(prefix_caching=True))
+        first = worker.create_prompt("task", ["a"])
+        second = worker.create_prompt("task", ["a", "b"])
+        self.assertTrue(second.startswith(first))
+
+    def test_llm_records_shared_prefix_of_sent_prompts(self):
+        llm = RexiaAIOpenAI(
+            base_url="http://localhost:8000/v1", model="test-model", temperature=0, api_key="key",
+            prefix_caching=True,
+        )
+        with mock.patch.object(ChatOpenAI, "invoke", lambda self, query, **kwargs: SimpleNamespace(content="{}")):
+            llm.invoke("instructions then task one")
+            llm.invoke("instructions then task two")
+        self.assertEqual(llm.prefix_tracker.get_stats()["last_shared_prefix"], len("instructions then task "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from unittest import mock
+from rexia_ai.agents.workers import PlanWorker, ToolWorker
+from rexia_ai.common import PromptTemplate
+
+
+class FakeTool:
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def to_rexiaai_tool(self):
+        self.calls += 1
+        return {"name": self.name}
+
+    def to_rexiaai_function_call(self):
+        return {"name": self.name, "parameters": {}}
+
+
+class FakeModel:
+    def __init__(self, tools):
+        self.tools = tools
+        self.context_window = None
+
+
+class TestPromptTemplate(unittest.TestCase):
+    def test_render_places_context_between_static_parts(self):
+        template = PromptTemplate(prefix="before ", suffix=" after")
+        self.assertEqual(template.render("task"), "before task after")
+
+    def test_tool_catalogue_is_rendered_once_per_tool_set(self):
+        tool = FakeTool("search")
+        worker = ToolWorker(FakeModel({"search": tool}))
+        worker.create_prompt("task one", ["a"])
+        second = worker.create_prompt("task two", ["b"])
+        self.assertEqual(tool.calls, 1)
+        self.assertIn("task two", second)
+
+    def test_template_is_invalidated_when_tools_change(self):
+        model = FakeModel({"search": FakeTool("search")})
+        worker = ToolWorker(model)
+        self.assertNotIn("calculator", worker.create_prompt("task", []))
+        model.tools["calculator"] = FakeTool("calculator")
+        self.assertIn("calculator", worker.create_prompt("task", []))
+
+    def test_prompt_matches_unformatted_layout(self):
+        model = FakeModel({"search": FakeTool("search")})
+        worker = ToolWorker(model)
+        context = worker._format_additional_context(["chat"], "task")
+        expected = (
+            f"base\n\n{context}\n\n{worker.get_structured_output_prompt()}"
+            f"\n\nAvailable Tools (Use only these, tools not here will fail):\n{worker._get_available_tools()}\n\n"
+        )
+        self.assertEqual(worker.get_prompt_template("base").render(context), expected)
+
+    def test_workers_without_tools_ignore_tool_changes(self):
+        model = FakeModel({})
+        worker = PlanWorker(model)
+        with mock.patch.object(worker, "_build_prompt_template", wraps=worker._build_prompt_template) as build:
+            worker.create_prompt("task", [])
+            model.tools["search"] = FakeTool("search")
+            prompt = worker.create_prompt("task", [])
+        self.assertEqual(build.call_count, 1)
+        self.assertNotIn("Available Tools", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import time
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from langchain_openai import ChatOpenAI
+from rexia_ai.llms import RexiaAIOpenAI, RateLimiter
+from rexia_ai.llms.rexia_ai_openai import APICallError, MAX_RETRY_WAIT
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_caps_requests_in_flight(self):
+        limiter = RateLimiter(max_in_flight=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def call():
+            limiter.acquire()
+            try:
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.pop()
+            finally:
+                limiter.release()
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(max(peak), 2)
+        self.assertEqual(limiter.get_stats()["requests"], 6)
+
+    def test_requests_per_minute_bucket_delays_burst(self):
+        limiter = RateLimiter(requests_per_minute=600)
+        limiter._request_tokens = 1
+        started = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release()
+        # Two extra requests at 10 per second need about 0.2 seconds of refill.
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+        self.assertEqual(limiter.get_stats()["throttled"], 2)
+
+    def test_defer_pauses_async_callers(self):
+        limiter = RateLimiter()
+        limiter.defer(0.1)
+
+        async def acquire():
+            started = time.monotonic()
+            await limiter.aacquire()
+            limiter.release()
+            return time.monotonic() - started
+
+        self.assertGreaterEqual(asyncio.run(acquire()), 0.09)
+
+    def test_shared_per_endpoint(self):
+        first = RateLimiter.for_endpoint("http://shared-test/v1", "model", max_in_flight=4)
+        second = RateLimiter.for_endpoint("http://shared-test/v1", "model", max_in_flight=4)
+        other = RateLimiter.for_endpoint("http://shared-test/v1", "other-model", max_in_flight=4)
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_reads_retry_after_headers(self):
+        error = Exception("429")
+        error.response = SimpleNamespace(headers={"retry-after": "3"})
+        self.assertEqual(RateLimiter.get_retry_after(error), 3.0)
+        error.response = SimpleNamespace(headers={"retry-after-ms": "250"})
+        self.assertEqual(RateLimiter.get_retry_after(error), 0.25)
+        self.assertIsNone(RateLimiter.get_retry_after(Exception("no response")))
+
+
+class TestRexiaAIOpenAIRateLimit(unittest.TestCase):
+    def test_retry_waits_for_retry_after(self):
+        llm = RexiaAIOpenAI(
+            base_url="http://rate-limit-test/v1",
+            model="lm-studio",
+            temperature=0.0,
+            api_key="not-needed",
+            max_in_flight=1,
+        )
+        rate_limited = Exception("Too many requests")
+        rate_limited.response = SimpleNamespace(headers={"retry-after": "0.2"})
+        responses = [rate_limited, SimpleNamespace(content="Paris")]
+
+        def fake_invoke(self, query):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        started = time.monotonic()
+        with mock.patch.object(ChatOpenAI, "invoke", fake_invoke):
+            self.assertEqual(llm.invoke("What is the capital of France?"), "Paris")
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(llm.rate_limiter.get_stats()["in_flight"], 0)
+        self.assertEqual(llm.rate_limiter.get_stats()["deferrals"], 1)
+
+    def test_long_retry_after_is_capped(self):
+        llm = RexiaAIOpenAI(
+            base_url="http://rate-limit-cap-test/v1",
+            model="lm-studio",
+            temperature=0.0,
+            api_key="not-needed",
+        )
+        rate_limited = Exception("Too many requests")
+        rate_limited.response = SimpleNamespace(headers={"retry-after": "3600"})
+        waits = []
+
+        def fake_invoke(self, query):
+            raise rate_limited
+
+        with mock.patch.object(ChatOpenAI, "invoke", fake_invoke), mock.patch("time.sleep", waits.append):
+            with self.assertRaises(APICallError) as raised:
+                llm.invoke("What is the capital of France?")
+
+        self.assertEqual(raised.exception.retry_after, 3600.0)
+        self.assertEqual(waits, [MAX_RETRY_WAIT, MAX_RETRY_WAIT])
+
+    def test_long_retry_after_pauses_the_limiter_for_at_most_the_cap(self):
+        llm = RexiaAIOpenAI(
+            base_url="http://rate-limit-cap-test/v1",
+            model="lm-studio",
+            temperature=0.0,
+            api_key="not-needed",
+            rate_limiter=RateLimiter(max_in_flight=1),
+        )
+        rate_limited = Exception("Too many requests")
+        rate_limited.response = SimpleNamespace(headers={"retry-after": "3600"})
+        llm._api_call_error(rate_limited)
+        self.assertLessEqual(llm.rate_limiter._blocked_until - time.monotonic(), MAX_RETRY_WAIT)
+
+if __name__ == "__main__":
+    unittest.main()
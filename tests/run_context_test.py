@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from rexia_ai.agents import Agent
+from rexia_ai.common import RunContext, TaskStatus
+from rexia_ai.workflows import ReflectWorkflow
+from agent_batch_test import EchoLLM
+
+
+class TestRunContext(unittest.TestCase):
+    def setUp(self):
+        self.llm = EchoLLM()
+        self.agent = Agent(llm=self.llm, task="original task")
+        self.tasks = [f"task {i}" for i in range(8)]
+
+    def test_concurrent_invocations_on_one_agent(self):
+        workers = [self.agent.workflow.plan.worker, self.agent.workflow.finalise.worker]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(self.agent.invoke, self.tasks))
+        self.assertEqual([r.answer for r in responses], [[task] for task in self.tasks])
+        self.assertGreater(self.llm.max_in_flight, 1)
+        self.assertEqual(self.agent.task, "original task")
+        self.assertEqual([self.agent.workflow.plan.worker, self.agent.workflow.finalise.worker], workers)
+
+    def test_concurrent_async_invocations_on_one_agent(self):
+        async def run():
+            return await asyncio.gather(*(self.agent.ainvoke(task) for task in self.tasks))
+
+        responses = asyncio.run(run())
+        self.assertEqual([r.answer for r in responses], [[task] for task in self.tasks])
+        self.assertGreater(self.llm.max_in_flight, 1)
+
+    def test_workers_use_the_llm_of_the_run(self):
+        chosen = EchoLLM()
+        workflow = ReflectWorkflow(llm=self.llm, task="original task")
+        context = workflow.create_context("routed task", chosen)
+        workflow.run(context)
+        self.assertEqual(context.status, TaskStatus.COMPLETED)
+        self.assertEqual(len(context.channel.messages), 3)
+        self.assertEqual(self.llm.max_in_flight, 0)
+        self.assertGreater(chosen.max_in_flight, 0)
+        self.assertIs(workflow.plan.worker.model, self.llm)
+
+    def test_run_without_context_uses_the_workflow_channel(self):
+        workflow = ReflectWorkflow(llm=self.llm, task="original task")
+        workflow.run()
+        self.assertEqual(len(workflow.channel.messages), 3)
+        self.assertIsNone(RunContext.current())
+
+    def test_invoke_leaves_the_workflow_channel_alone(self):
+        channel = self.agent.workflow.channel
+        context = self.agent.create_context("task")
+        self.agent.invoke(context=context)
+        self.assertEqual(len(context.channel.messages), 3)
+        self.assertIs(self.agent.workflow.channel, channel)
+        self.assertEqual(channel.messages, [])
+
+    def test_task_complexity_is_kept_per_run(self):
+        complex_llm = EchoLLM()
+        self.agent.router = mock.Mock(
+            base_llm=self.llm, complex_llm=complex_llm, task_complexity_threshold=50
+        )
+        self.agent.router.route.side_effect = lambda task: 80 if task == "hard" else 20
+        hard, easy = self.agent.create_context("hard"), self.agent.create_context("easy")
+        self.assertEqual((hard.task_complexity, hard.llm), (80, complex_llm))
+        self.assertEqual((easy.task_complexity, easy.llm), (20, self.llm))
+        self.assertFalse(hasattr(self.agent, "task_complexity"))
+
+
+if __name__ == "__main__":
+    unittest.main()
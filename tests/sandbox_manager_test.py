@@ -0,0 +1,89 @@
+import threading
+import time
+import unittest
+from unittest import mock
+from rexia_ai.common import ContainerisedCodeTester, ContainerisedToolRunner, SandboxManager
+from container_pool_test import FakeClient
+
+
+class PingingClient(FakeClient):
+    def __init__(self, healthy=True):
+        super().__init__()
+        self.healthy = healthy
+        self.closed = False
+
+    def ping(self):
+        if not self.healthy:
+            raise ConnectionError("daemon not running")
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+class TestSandboxManager(unittest.TestCase):
+    def test_client_is_created_once_for_concurrent_runners(self):
+        with mock.patch("docker.from_env", return_value=PingingClient()) as from_env:
+            manager = SandboxManager(max_pool_size=4)
+            threads = [threading.Thread(target=lambda: manager.client) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            tester = ContainerisedCodeTester(manager=manager)
+            runner = ContainerisedToolRunner(manager=manager)
+
+        from_env.assert_called_once_with(max_pool_size=4, timeout=60)
+        self.assertIs(tester.client, runner.client)
+        self.assertIs(tester.backend, runner.backend)
+        self.assertEqual(manager.get_stats()["client_inits"], 1)
+        manager.close()
+
+    def test_runners_raise_when_docker_is_unavailable(self):
+        with mock.patch("docker.from_env", side_effect=Exception("no daemon")):
+            manager = SandboxManager()
+            with self.assertRaises(RuntimeError):
+                ContainerisedToolRunner(manager=manager)
+        stats = manager.get_stats()
+        self.assertFalse(stats["client_initialized"])
+        self.assertEqual((stats["client_init_failures"], stats["last_error"]), (1, "no daemon"))
+
+    def test_health_and_stats(self):
+        client = PingingClient()
+        with mock.patch("docker.from_env", return_value=client):
+            manager = SandboxManager()
+            self.assertTrue(manager.health()["healthy"])
+            pool = manager.get_pool("fake-image", size=1)
+        pool.run({"main.py": "pass"}, ["python", "main.py"], 5)
+
+        client.healthy = False
+        health = manager.health()
+        self.assertFalse(health["healthy"])
+        self.assertEqual(health["error"], "daemon not running")
+        self.assertEqual(manager.get_stats()["pools"][0]["jobs"], 1)
+
+        manager.close()
+        self.assertTrue(client.closed)
+        self.assertFalse(manager.get_stats()["client_initialized"])
+
+    def test_asking_for_a_larger_pool_grows_the_shared_one(self):
+        client = PingingClient()
+        with mock.patch("docker.from_env", return_value=client):
+            manager = SandboxManager()
+            pool = manager.get_pool("fake-image", size=1)
+            self.assertIs(manager.get_pool("fake-image", size=3), pool)
+            self.assertIs(manager.get_pool("fake-image", size=2), pool)
+
+        self.assertEqual(pool.size, 3)
+        deadline = time.monotonic() + 10
+        while pool.get_stats()["idle"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(pool.get_stats()["idle"], 3)
+        manager.close()
+
+    def test_instance_is_shared(self):
+        self.assertIs(SandboxManager.instance(), SandboxManager.instance())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from rexia_ai.base import BaseTool
+from rexia_ai.agents.workers import ToolWorker
+from rexia_ai.structure import StreamingResponseParser
+
+RESPONSE = json.dumps(
+    {
+        "question": 'What is "3 * 12"? {',
+        "plan": ["Call Multiply", "Report the result }"],
+        "tool_calls": [{"name": "Multiply", "parameters": {"a": 3, "b": 12}}],
+        "answer": ["36"],
+        "confidence_score": 95.0,
+        "chain_of_reasoning": ["3 * 12 = 36"],
+    },
+    indent=2,
+)
+
+
+class MultiplyTool(BaseTool):
+    """Records when it runs relative to the stream."""
+
+    def __init__(self, stream_finished):
+        super().__init__(name="Multiply", func=self.multiply, description="Multiply two numbers")
+        self.stream_finished = stream_finished
+        self.ran_before_stream_finished = None
+
+    def multiply(self, a, b):
+        self.ran_before_stream_finished = not self.stream_finished.is_set()
+        return a * b
+
+    def to_rexiaai_tool(self):
+        return []
+
+    def to_rexiaai_function_call(self):
+        return {"name": "multiply"}
+
+
+class FakeStreamingModel:
+    """Streams a fixed response and waits for the tool to run before finishing."""
+
+    streaming = True
+
+    def __init__(self):
+        self.stream_finished = threading.Event()
+        self.tools = {"Multiply": MultiplyTool(self.stream_finished)}
+        self.tool_ran = threading.Event()
+
+    def stream_text(self, query):
+        split = RESPONSE.index('"answer"')
+        yield RESPONSE[:split]
+        self.tool_ran.wait(timeout=2)
+        yield RESPONSE[split:]
+        self.stream_finished.set()
+
+    async def astream_text(self, query):
+        split = RESPONSE.index('"answer"')
+        yield RESPONSE[:split]
+        for _ in range(200):
+            if self.tools["Multiply"].ran_before_stream_finished is not None:
+                break
+            await asyncio.sleep(0.01)
+        yield RESPONSE[split:]
+        self.stream_finished.set()
+
+
+class FakeModel:
+    """Returns the same response without streaming."""
+
+    streaming = False
+
+    def __init__(self):
+        self.tools = {"Multiply": MultiplyTool(threading.Event())}
+
+    def invoke(self, query):
+        return RESPONSE
+
+
+class TestStreamingResponseParser(unittest.TestCase):
+    def test_emits_fields_in_order_for_any_chunk_size(self):
+        text = "```json\n" + RESPONSE + "\n```"
+        for size in (1, 5, len(text)):
+            parser = StreamingResponseParser()
+            names = []
+            for i in range(0, len(text), size):
+                names += [name for name, _ in parser.feed(text[i : i + size])]
+            self.assertEqual(
+                names,
+                ["question", "plan", "tool_calls", "answer", "confidence_score", "chain_of_reasoning"],
+            )
+            self.assertTrue(parser.is_complete)
+            self.assertEqual(parser.text, text)
+            self.assertEqual(parser.fields, json.loads(RESPONSE))
+
+    def test_field_is_emitted_before_the_response_ends(self):
+        parser = StreamingResponseParser()
+        split = RESPONSE.index('"answer"')
+        fields = dict(parser.feed(RESPONSE[:split]))
+        self.assertEqual(fields["tool_calls"][0]["name"], "Multiply")
+        self.assertFalse(parser.is_complete)
+        self.assertEqual(parser.to_response().plan[0], "Call Multiply")
+
+
+class TestToolWorkerStreaming(unittest.TestCase):
+    def test_tool_calls_start_before_stream_finishes(self):
+        model = FakeStreamingModel()
+        tool = model.tools["Multiply"]
+        original = tool.multiply
+
+        def multiply(a, b):
+            result = original(a, b)
+            model.tool_ran.set()
+            return result
+
+        tool.multiply = multiply
+        response = ToolWorker(model).action("prompt", "tool_worker")
+
+        self.assertEqual(response, "tool_worker: {'Multiply': 36}")
+        self.assertTrue(tool.ran_before_stream_finished)
+
+    def test_async_tool_calls_start_before_stream_finishes(self):
+        model = FakeStreamingModel()
+        response = asyncio.run(ToolWorker(model).aaction("prompt", "tool_worker"))
+
+        self.assertEqual(response, "tool_worker: {'Multiply': 36}")
+        self.assertTrue(model.tools["Multiply"].ran_before_stream_finished)
+
+    def test_tool_calls_run_once_the_response_is_complete_without_streaming(self):
+        with mock.patch("rexia_ai.agents.workers.tool.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor:
+            response = ToolWorker(FakeModel()).action("prompt", "tool_worker")
+
+        self.assertEqual(response, "tool_worker: {'Multiply': 36}")
+        # Only the tool calls need threads.
+        self.assertEqual(executor.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from langchain_openai import ChatOpenAI
+from rexia_ai.base import BaseWorker
+from rexia_ai.llms import RexiaAIOpenAI
+from rexia_ai.llms.rexia_ai_openai import STRUCTURED_OUTPUT_UNSUPPORTED
+from rexia_ai.structure import LLMOutput
+
+SCHEMA = LLMOutput.get_json_schema()
+RESPONSE = '{"question": "q", "plan": [], "tool_calls": [], "answer": ["42"], "confidence_score": 90, "chain_of_reasoning": []}'
+
+
+class ServerError(Exception):
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def make_llm(mode, base_url="http://localhost:8000/v1"):
+    return RexiaAIOpenAI(
+        base_url=base_url, model="test-model", temperature=0, api_key="key", structured_output=mode
+    )
+
+
+class TestStructuredOutput(unittest.TestCase):
+    def setUp(self):
+        STRUCTURED_OUTPUT_UNSUPPORTED.clear()
+
+    def test_request_parameters_for_each_mode(self):
+        self.assertEqual(
+            make_llm("json_schema")._structured_output_kwargs(SCHEMA)["response_format"]["json_schema"]["schema"],
+            SCHEMA,
+        )
+        self.assertEqual(
+            make_llm("json_object")._structured_output_kwargs(SCHEMA),
+            {"response_format": {"type": "json_object", "schema": SCHEMA}},
+        )
+        self.assertEqual(
+            make_llm("guided_json")._structured_output_kwargs(SCHEMA),
+            {"extra_body": {"guided_json": SCHEMA}},
+        )
+        self.assertEqual(make_llm(None)._structured_output_kwargs(SCHEMA), {})
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            make_llm("grammar")
+
+    def test_falls_back_once_when_server_rejects_schema(self):
+        llm = make_llm("json_schema")
+        calls = []
+
+        def invoke(self, query, **kwargs):
+            calls.append(kwargs)
+            if "response_format" in kwargs:
+                raise ServerError(400, "response_format json_schema is not supported")
+            return SimpleNamespace(content=RESPONSE)
+
+        with mock.patch.object(ChatOpenAI, "invoke", invoke):
+            self.assertEqual(llm.invoke("q", response_schema=SCHEMA), RESPONSE)
+            self.assertEqual(llm.invoke("q2", response_schema=SCHEMA), RESPONSE)
+
+        self.assertEqual(["response_format" in c for c in calls], [True, False, False])
+
+    def test_other_bad_requests_are_not_treated_as_unsupported(self):
+        llm = make_llm("guided_json")
+        self.assertFalse(
+            llm._structured_output_rejected(
+                ServerError(400, "maximum context length is 4096 tokens"), {"extra_body": {}}
+            )
+        )
+
+    def test_errors_that_only_mention_a_schema_are_not_treated_as_unsupported(self):
+        llm = make_llm("json_schema")
+        self.assertFalse(
+            llm._structured_output_rejected(
+                ServerError(400, "tool parameters do not match the function schema"), {"response_format": {}}
+            )
+        )
+
+    def test_prompt_example_matches_the_schema(self):
+        example = json.loads(LLMOutput.get_output_structure())
+        tool_call = LLMOutput.get_json_schema()["properties"]["tool_calls"]["items"]
+        for call in example["tool_calls"]:
+            self.assertIsInstance(call, dict)
+            self.assertEqual(sorted(call), sorted(tool_call["required"]))
+
+    def test_worker_requests_output_schema(self):
+        llm = make_llm("guided_json")
+        calls = []
+
+        def invoke(self, query, **kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(content=RESPONSE)
+
+        with mock.patch.object(ChatOpenAI, "invoke", invoke):
+            response = BaseWorker(llm)._invoke_model("prompt")
+
+        self.assertEqual(response.answer, ["42"])
+        self.assertEqual(calls, [{"extra_body": {"guided_json": SCHEMA}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
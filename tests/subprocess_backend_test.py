@@ -0,0 +1,81 @@
+import time
+import unittest
+from unittest import mock
+from rexia_ai.common import ContainerisedCodeTester, ContainerisedToolRunner, SubprocessBackend
+from rexia_ai.common.subprocess_backend import _unshare_available
+from container_pool_test import Adder
+
+
+class TestSubprocessBackend(unittest.TestCase):
+    def setUp(self):
+        self.backend = SubprocessBackend(memory_mb=256)
+
+    def test_runs_files_in_a_fresh_directory(self):
+        self.backend.run({"main.py": "open('left.txt', 'w').write('x')"}, ["python", "main.py"], 5)
+        status, stdout, stderr = self.backend.run(
+            {"main.py": "import os; print(sorted(os.listdir('.')))", "pkg/mod.py": ""}, ["python", "main.py"], 5
+        )
+        self.assertEqual((status, stdout.strip(), stderr), (0, "['main.py', 'pkg']", ""))
+
+    def test_environment_is_not_inherited(self):
+        _, stdout, _ = self.backend.run(
+            {"main.py": "import os, sys; print('OPENAI_API_KEY' in os.environ, sys.flags.ignore_environment)"},
+            ["python", "main.py"],
+            5,
+        )
+        self.assertEqual(stdout.strip(), "False 1")
+
+    def test_wall_clock_timeout_kills_the_job(self):
+        started = time.monotonic()
+        status, _, _ = self.backend.run({"main.py": "import time; time.sleep(10)"}, ["python", "main.py"], 1)
+        self.assertEqual(status, 124)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(self.backend.get_stats()["timeouts"], 1)
+
+    def test_memory_limit(self):
+        status, _, stderr = self.backend.run({"main.py": "x = bytearray(1024 ** 3)"}, ["python", "main.py"], 5)
+        self.assertEqual(status, 1)
+        self.assertIn("MemoryError", stderr)
+
+    def test_limits_without_prlimit(self):
+        with mock.patch("rexia_ai.common.subprocess_backend.shutil.which", return_value=None):
+            status, stdout, stderr = self.backend.run(
+                {"main.py": "import resource; print(resource.getrlimit(resource.RLIMIT_CPU)); bytearray(1024 ** 3)"},
+                ["python", "main.py"],
+                5,
+            )
+        self.assertEqual((status, stdout.strip()), (1, "(30, 30)"))
+        self.assertIn("MemoryError", stderr)
+
+    def test_process_that_leaves_the_group_does_not_hang_the_caller(self):
+        escape = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(6)'], start_new_session=True)\n"
+            "time.sleep(10)\n"
+        )
+        started = time.monotonic()
+        status, _, _ = self.backend.run({"main.py": escape}, ["python", "main.py"], 1)
+        self.assertEqual(status, 124)
+        self.assertLess(time.monotonic() - started, 5)
+
+    @unittest.skipUnless(_unshare_available(), "unprivileged namespaces are not available")
+    def test_jobs_have_no_network(self):
+        _, stdout, _ = self.backend.run(
+            {"main.py": "import socket; print([name for _, name in socket.if_nameindex()])"}, ["python", "main.py"], 5
+        )
+        self.assertEqual(stdout.strip(), "['lo']")
+
+    def test_runners_use_the_backend(self):
+        tester = ContainerisedCodeTester(backend=self.backend)
+        results = tester.execute_code("def add(a, b):\n    return a - b\n", Adder)
+        self.assertFalse(results["all_passed"])
+        self.assertEqual(results["failed"][0]["name"], "test_adds")
+        self.assertIsNone(tester.client)
+
+        runner = ContainerisedToolRunner(backend=self.backend)
+        result = runner.execute_code("def main():\n    return 42\n")
+        self.assertEqual(result, {"success": True, "output": '{"result": 42}\n'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+from rexia_ai.agents.workers import TDDWorker
+from rexia_ai.common import InMemoryCache, SubprocessBackend
+from rexia_ai.llms import RexiaAIOpenAI
+from rexia_ai.structure import RexiaAIResponse
+
+
+class Arithmetic:
+    @classmethod
+    def setUpClass(cls):
+        pass
+
+    @classmethod
+    def test_adds(cls, add):
+        assert add(2, 3) == 5
+
+    @classmethod
+    def test_adds_negatives(cls, add):
+        assert add(-2, -3) == -5
+
+
+WRONG = "def add(a, b):\n    return 0\n"
+HALF_RIGHT = "def add(a, b):\n    return abs(a) + abs(b)\n"
+RIGHT = "def add(a, b):\n    return a + b\n"
+SLOW_RIGHT = "import time\n\ndef add(a, b):\n    time.sleep(3)\n    return a + b\n"
+
+
+class ScriptedTDDWorker(TDDWorker):
+    """Answers each model call with the next code in a script and records the prompts."""
+
+    def __init__(self, script, **kwargs):
+        super().__init__(model=None, execution_backend=SubprocessBackend(), **kwargs)
+        self.set_test_class(Arithmetic)
+        self.script = list(script)
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def _invoke_model(self, prompt, on_field=None, model=None):
+        with self.lock:
+            self.prompts.append(prompt)
+            code = self.script.pop(0)
+        return RexiaAIResponse(question="add", answer=code)
+
+    async def _ainvoke_model(self, prompt, on_field=None, model=None):
+        return self._invoke_model(prompt)
+
+
+class TestTDDWorkerBestOfN(unittest.TestCase):
+    def test_first_passing_candidate_wins(self):
+        worker = ScriptedTDDWorker([WRONG, RIGHT, HALF_RIGHT], best_of_n=3)
+        result = worker.action("prompt", "tdd")
+        self.assertIn("return a + b", result)
+        self.assertEqual(len(worker.prompts), 3)
+
+    def test_slow_candidates_do_not_delay_the_winner(self):
+        worker = ScriptedTDDWorker([SLOW_RIGHT, RIGHT], best_of_n=2)
+        started = time.monotonic()
+        result = worker.action("prompt", "tdd")
+        self.assertLess(time.monotonic() - started, 2.5)
+        self.assertNotIn("sleep", result)
+
+    def test_best_failing_candidate_seeds_the_repair_round(self):
+        worker = ScriptedTDDWorker([WRONG, HALF_RIGHT, WRONG, RIGHT], best_of_n=2)
+        result = worker.action("prompt", "tdd")
+        self.assertIn("return a + b", result)
+        repair_prompt = worker.prompts[2]
+        self.assertTrue(repair_prompt.startswith("prompt"))
+        self.assertIn("abs(a) + abs(b)", repair_prompt)
+        self.assertIn("test_adds_negatives", repair_prompt)
+
+    def test_duplicate_candidates_are_tested_once(self):
+        commented = '# adds\ndef add(a, b):\n    """Add two numbers."""\n    return a+b\n'
+        worker = ScriptedTDDWorker([RIGHT, commented, RIGHT], best_of_n=3)
+        self.assertEqual(len(worker._unique_candidates([worker._invoke_model("p") for _ in range(3)])), 1)
+
+    def test_raises_when_no_round_passes(self):
+        worker = ScriptedTDDWorker([WRONG] * 4, best_of_n=2, repair_rounds=1)
+        with self.assertRaisesRegex(Exception, "test_adds"):
+            worker.action("prompt", "tdd")
+        self.assertEqual(worker.script, [])
+
+    def test_async_best_of_n(self):
+        worker = ScriptedTDDWorker([HALF_RIGHT, WRONG, RIGHT, WRONG], best_of_n=2)
+        result = asyncio.run(worker.aaction("prompt", "tdd"))
+        self.assertIn("return a + b", result)
+        self.assertIn("abs(a) + abs(b)", worker.prompts[2])
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            TDDWorker(model=None, best_of_n=0)
+
+
+class TestTDDWorkerCandidateSampling(unittest.TestCase):
+    """A cached model at temperature 0 answers one prompt the same way unless candidates bypass both."""
+
+    def setUp(self):
+        self.model = RexiaAIOpenAI(
+            base_url="http://localhost:1234/v1",
+            model="lm-studio",
+            temperature=0.0,
+            api_key="not-needed",
+            cache=InMemoryCache(),
+        )
+        self.samples = []
+
+        def greedy_unless_seeded(llm, query, response_schema=None):
+            self.samples.append((llm.temperature, llm.seed))
+            code = RIGHT if llm.seed == 1 else WRONG
+            return json.dumps({"question": "add", "answer": code})
+
+        async def agreedy_unless_seeded(llm, query, response_schema=None):
+            return greedy_unless_seeded(llm, query, response_schema)
+
+        for name, fake in (("_invoke_once", greedy_unless_seeded), ("_ainvoke_once", agreedy_unless_seeded)):
+            patcher = mock.patch.object(RexiaAIOpenAI, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # An earlier, cached answer to the same prompt.
+        self.model.invoke("prompt")
+
+    def make_worker(self):
+        worker = TDDWorker(self.model, execution_backend=SubprocessBackend(), best_of_n=2, repair_rounds=0)
+        worker.set_test_class(Arithmetic)
+        return worker
+
+    def test_candidates_bypass_the_cache_and_vary_sampling(self):
+        result = self.make_worker().action("prompt", "tdd")
+
+        self.assertIn("return a + b", result)
+        self.assertEqual(sorted(self.samples[1:]), [(0.7, 0), (0.8, 1)])
+        self.assertEqual((self.model.temperature, self.model.seed), (0.0, None))
+        self.assertEqual(self.model.cache.size(), 1)
+
+    def test_async_candidates_bypass_the_cache_and_vary_sampling(self):
+        result = asyncio.run(self.make_worker().aaction("prompt", "tdd"))
+
+        self.assertIn("return a + b", result)
+        self.assertEqual(sorted(self.samples[1:]), [(0.7, 0), (0.8, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
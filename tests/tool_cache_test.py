@@ -0,0 +1,168 @@
+import os
+import time
+import asyncio
+import tempfile
+import threading
+import unittest
+from rexia_ai.common import InMemoryCache, SQLiteCache, ToolCache
+from rexia_ai.agents.workers import ToolWorker
+from rexia_ai.structure import RexiaAIResponse
+from tool_worker_test import AsyncSleepTool, SleepTool
+
+
+class CountingTool(SleepTool):
+    """Counts its calls and can raise instead of answering."""
+
+    cache_ttl = 60.0
+
+    def __init__(self, name="Quote", fail=False):
+        super().__init__(name=name)
+        self.calls = 0
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def sleep(self, seconds, label):
+        with self._lock:
+            self.calls += 1
+        time.sleep(seconds)
+        if self.fail:
+            raise RuntimeError("boom")
+        return label
+
+
+class FakeModel:
+    def __init__(self, *tools, tool_cache=None):
+        self.tools = {tool.name: tool for tool in tools}
+        self.tool_cache = tool_cache
+
+
+def calls(*calls):
+    return RexiaAIResponse.from_json(
+        {
+            "tool_calls": [
+                {"name": name, "parameters": {"seconds": seconds, "label": label}}
+                for name, seconds, label in calls
+            ]
+        }
+    )
+
+
+class TestToolCache(unittest.TestCase):
+    def test_key_normalises_arguments(self):
+        self.assertEqual(
+            ToolCache.key("quote", {"symbol": " IBM ", "full": True}),
+            ToolCache.key("quote", {"full": True, "symbol": "IBM"}),
+        )
+        self.assertNotEqual(ToolCache.key("quote", {"symbol": "IBM"}), ToolCache.key("news", {"symbol": "IBM"}))
+
+    def test_results_are_reused_until_they_expire(self):
+        cache = ToolCache()
+        calls = []
+
+        def quote(symbol):
+            calls.append(symbol)
+            return f"{symbol} {len(calls)}"
+
+        self.assertEqual(cache.call("quote", {"symbol": "IBM"}, 0.1, quote), "IBM 1")
+        self.assertEqual(cache.call("quote", {"symbol": "IBM"}, 0.1, quote), "IBM 1")
+        time.sleep(0.15)
+        self.assertEqual(cache.call("quote", {"symbol": "IBM"}, 0.1, quote), "IBM 2")
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+    def test_no_ttl_is_never_cached(self):
+        cache = ToolCache()
+        values = iter(["a", "b"])
+        self.assertEqual(cache.call("next", {}, None, lambda: next(values)), "a")
+        self.assertEqual(cache.call("next", {}, None, lambda: next(values)), "b")
+        self.assertEqual(cache.get_stats()["size"], 0)
+
+    def test_errors_are_not_cached(self):
+        cache = ToolCache()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            cache.call("fail", {}, 60, fail)
+        self.assertEqual(cache.call("fail", {}, 60, lambda: "ok"), "ok")
+
+    def test_disk_backend_shares_results_between_caches(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tools.sqlite")
+            ToolCache(SQLiteCache(path)).call("quote", {"symbol": "IBM"}, 60, lambda symbol: "142")
+            self.assertEqual(
+                ToolCache(SQLiteCache(path)).call("quote", {"symbol": "IBM"}, 60, lambda symbol: "new"), "142"
+            )
+
+    def test_backend_evicts_least_recently_used(self):
+        cache = ToolCache(InMemoryCache(max_entries=1))
+        cache.call("quote", {"symbol": "IBM"}, 60, lambda symbol: symbol)
+        cache.call("quote", {"symbol": "MSFT"}, 60, lambda symbol: symbol)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+
+class TestToolWorkerCache(unittest.TestCase):
+    def test_concurrent_identical_calls_share_one_fetch(self):
+        tool = CountingTool()
+        cache = ToolCache()
+        worker = ToolWorker(FakeModel(tool, tool_cache=cache))
+        results = worker._handle_tool_calls(calls(*[("Quote", 0.1, "142")] * 4))
+
+        self.assertEqual(list(results.values()), ["142"] * 4)
+        self.assertEqual(tool.calls, 1)
+        stats = cache.get_stats()
+        self.assertEqual((stats["fetches"], stats["coalesced"]), (1, 3))
+        self.assertEqual(stats["hit_ratio"], 0.75)
+
+    def test_results_are_reused_across_runs(self):
+        tool = CountingTool()
+        worker = ToolWorker(FakeModel(tool, tool_cache=ToolCache()))
+        worker._handle_tool_calls(calls(("Quote", 0, "142")))
+        self.assertEqual(worker._handle_tool_calls(calls(("Quote", 0, "142"))), {"Quote": "142"})
+        self.assertEqual(tool.calls, 1)
+
+    def test_tools_without_ttl_are_not_cached(self):
+        tool = CountingTool()
+        tool.cache_ttl = None
+        worker = ToolWorker(FakeModel(tool, tool_cache=ToolCache()))
+        worker._handle_tool_calls(calls(("Quote", 0, "142"), ("Quote", 0, "142")))
+        self.assertEqual(tool.calls, 2)
+
+    def test_waiting_calls_see_the_error(self):
+        tool = CountingTool(fail=True)
+        worker = ToolWorker(FakeModel(tool, tool_cache=ToolCache()))
+        results = worker._handle_tool_calls(calls(("Quote", 0.1, ""), ("Quote", 0.1, "")))
+        self.assertEqual(list(results.values()), ["Error executing sleep in Quote: boom"] * 2)
+        self.assertEqual(tool.calls, 1)
+
+    def test_async_identical_calls_share_one_fetch(self):
+        tool = AsyncSleepTool()
+        tool.cache_ttl = 60.0
+        cache = ToolCache()
+        worker = ToolWorker(FakeModel(tool, tool_cache=cache))
+        results = asyncio.run(worker._ahandle_tool_calls(calls(*[("Sleep", 0.1, "a")] * 3)))
+
+        self.assertEqual(results, {"Sleep": "a", "Sleep #2": "a", "Sleep #3": "a"})
+        self.assertEqual(cache.get_stats()["fetches"], 1)
+
+    def test_waiting_call_fetches_when_the_first_call_times_out(self):
+        tool = AsyncSleepTool()
+        tool.cache_ttl = 60.0
+        cache = ToolCache()
+
+        async def run():
+            leader = asyncio.create_task(
+                asyncio.wait_for(cache.acall("Sleep", {"seconds": 0.2, "label": "a"}, 60.0, tool.sleep), 0.1)
+            )
+            await asyncio.sleep(0.05)
+            waiter = asyncio.create_task(cache.acall("Sleep", {"seconds": 0.2, "label": "a"}, 60.0, tool.sleep))
+            return await asyncio.gather(leader, waiter, return_exceptions=True)
+
+        leader, waiter = asyncio.run(run())
+        self.assertIsInstance(leader, asyncio.TimeoutError)
+        self.assertEqual(waiter, "a")
+        self.assertEqual(cache.get_stats()["fetches"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import asyncio
+import time
+import unittest
+from rexia_ai.base import BaseTool
+from rexia_ai.agents.workers import ToolWorker
+from rexia_ai.structure import RexiaAIResponse
+
+
+class SleepTool(BaseTool):
+    """Sleeps for the given number of seconds and returns its label."""
+
+    def __init__(self, name="Sleep", timeout=None):
+        super().__init__(name=name, func=self.sleep, description="Sleep for a while")
+        self.timeout = timeout
+
+    def sleep(self, seconds, label):
+        time.sleep(seconds)
+        return label
+
+    def to_rexiaai_tool(self):
+        return []
+
+    def to_rexiaai_function_call(self):
+        return {"name": "sleep"}
+
+
+class AsyncSleepTool(SleepTool):
+    """Awaits for the given number of seconds and returns its label."""
+
+    async def sleep(self, seconds, label):
+        await asyncio.sleep(seconds)
+        return label
+
+
+class FailingTool(SleepTool):
+    """Always raises."""
+
+    def sleep(self, seconds, label):
+        raise RuntimeError("boom")
+
+
+class FakeModel:
+    def __init__(self, *tools):
+        self.tools = {tool.name: tool for tool in tools}
+
+
+def calls(*calls):
+    return RexiaAIResponse.from_json(
+        {
+            "tool_calls": [
+                {"name": name, "parameters": {"seconds": seconds, "label": label}}
+                for name, seconds, label in calls
+            ]
+        }
+    )
+
+
+class TestToolWorkerToolCalls(unittest.TestCase):
+    def test_tool_calls_run_concurrently(self):
+        worker = ToolWorker(FakeModel(SleepTool()))
+        started = time.monotonic()
+        results = worker._handle_tool_calls(calls(*[("Sleep", 0.2, str(i)) for i in range(4)]))
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(list(results.values()), ["0", "1", "2", "3"])
+
+    def test_results_keep_call_order_and_repeated_calls(self):
+        worker = ToolWorker(FakeModel(SleepTool(), SleepTool("Other")))
+        results = worker._handle_tool_calls(
+            calls(("Sleep", 0.2, "a"), ("Other", 0.0, "b"), ("Sleep", 0.0, "c"), ("Missing", 0, ""))
+        )
+        self.assertEqual(list(results), ["Sleep", "Other", "Sleep #2", "Missing"])
+        self.assertEqual(results["Sleep"], "a")
+        self.assertEqual(results["Sleep #2"], "c")
+        self.assertEqual(results["Missing"], "Error: Tool Missing not found.")
+
+    def test_max_tool_workers_bounds_concurrency(self):
+        worker = ToolWorker(FakeModel(SleepTool()), max_tool_workers=1)
+        started = time.monotonic()
+        worker._handle_tool_calls(calls(("Sleep", 0.1, "a"), ("Sleep", 0.1, "b")))
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    def test_tool_timeout(self):
+        worker = ToolWorker(FakeModel(SleepTool(timeout=0.1)))
+        started = time.monotonic()
+        results = worker._handle_tool_calls(calls(("Sleep", 1.0, "slow")))
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(results["Sleep"], "Error: sleep in Sleep timed out after 0.1 seconds.")
+
+    def test_timeout_counts_from_when_a_queued_call_starts(self):
+        worker = ToolWorker(FakeModel(SleepTool(timeout=0.5)), max_tool_workers=2)
+        results = worker._handle_tool_calls(calls(*[("Sleep", 0.3, str(i)) for i in range(4)]))
+        self.assertEqual(list(results.values()), ["0", "1", "2", "3"])
+
+    def test_timed_out_call_frees_its_worker(self):
+        worker = ToolWorker(FakeModel(SleepTool(timeout=0.2)), max_tool_workers=1)
+        started = time.monotonic()
+        results = worker._handle_tool_calls(calls(("Sleep", 2.0, "slow"), ("Sleep", 0.0, "fast")))
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(results["Sleep #2"], "fast")
+
+    def test_tool_errors_are_reported(self):
+        worker = ToolWorker(FakeModel(FailingTool("Fail"), SleepTool()))
+        results = worker._handle_tool_calls(calls(("Fail", 0, ""), ("Sleep", 0, "ok")))
+        self.assertEqual(results, {"Fail": "Error executing sleep in Fail: boom", "Sleep": "ok"})
+
+    def test_async_tool_in_sync_worker(self):
+        worker = ToolWorker(FakeModel(AsyncSleepTool()))
+        results = worker._handle_tool_calls(calls(("Sleep", 0.0, "a"), ("Sleep", 0.0, "b")))
+        self.assertEqual(results, {"Sleep": "a", "Sleep #2": "b"})
+
+    def test_async_tool_calls_run_concurrently(self):
+        worker = ToolWorker(FakeModel(AsyncSleepTool(), SleepTool("Blocking")))
+        started = time.monotonic()
+        results = asyncio.run(
+            worker._ahandle_tool_calls(
+                calls(("Sleep", 0.2, "a"), ("Blocking", 0.2, "b"), ("Sleep", 0.2, "c"))
+            )
+        )
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(results, {"Sleep": "a", "Blocking": "b", "Sleep #2": "c"})
+
+    def test_async_tool_timeout(self):
+        worker = ToolWorker(FakeModel(AsyncSleepTool(timeout=0.1)))
+        results = asyncio.run(worker._ahandle_tool_calls(calls(("Sleep", 1.0, "slow"))))
+        self.assertEqual(results["Sleep"], "Error: sleep in Sleep timed out after 0.1 seconds.")
+
+    def test_async_timeout_counts_from_when_a_queued_call_starts(self):
+        worker = ToolWorker(FakeModel(AsyncSleepTool(timeout=0.5)), max_tool_workers=2)
+        results = asyncio.run(worker._ahandle_tool_calls(calls(*[("Sleep", 0.3, str(i)) for i in range(4)])))
+        self.assertEqual(list(results.values()), ["0", "1", "2", "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
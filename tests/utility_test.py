@@ -0,0 +1,59 @@
+import json
+import unittest
+from rexia_ai.common import Utility, TieredJSONParser
+from rexia_ai.structure import RexiaAIResponse
+
+
+class TestExtractJsonString(unittest.TestCase):
+    def test_extracts_object_from_surrounding_text(self):
+        text = 'Here is my answer:\n```json\n{"answer": ["42"]}\n```\nThanks!'
+        self.assertEqual(Utility.extract_json_string(text), '{"answer": ["42"]}')
+
+    def test_handles_deep_nesting(self):
+        obj = {"tool_calls": [{"name": "Search", "parameters": {"filter": {"and": [{"or": [{"eq": {"a": 1}}]}]}}}]}
+        text = "prefix " + json.dumps(obj) + " suffix"
+        self.assertEqual(json.loads(Utility.extract_json_string(text)), obj)
+
+    def test_ignores_braces_and_escaped_quotes_in_strings(self):
+        obj = {"answer": ['print("{")', 'x = "\\"}"', "}}}"], "plan": ["{ not an object"]}
+        text = json.dumps(obj) + ' and {"second": 1}'
+        self.assertEqual(json.loads(Utility.extract_json_string(text)), obj)
+
+    def test_returns_first_of_several_objects(self):
+        self.assertEqual(Utility.extract_json_string('{"a": 1} {"b": 2}'), '{"a": 1}')
+
+    def test_falls_back_to_outermost_complete_object(self):
+        text = '{"truncated": {"inner": {"x": 1}}, "more": {"y": 2}'
+        self.assertEqual(Utility.extract_json_string(text), '{"inner": {"x": 1}}')
+
+    def test_returns_text_without_object(self):
+        self.assertEqual(Utility.extract_json_string("no json here }"), "no json here }")
+
+
+class TestTieredJSONParser(unittest.TestCase):
+    def test_valid_json_uses_fast_path(self):
+        parser = TieredJSONParser()
+        self.assertEqual(parser.parse('{"answer": ["42"]}'), {"answer": ["42"]})
+        self.assertEqual(parser.get_stats(), {"json": 1, "json_repair": 0, "json5": 0, "failures": 0})
+
+    def test_malformed_json_is_repaired(self):
+        parser = TieredJSONParser()
+        self.assertEqual(parser.parse('{"answer": ["42"], "plan": ["a",]'), {"answer": ["42"], "plan": ["a"]})
+        self.assertEqual(parser.get_stats()["json_repair"], 1)
+
+    def test_unparseable_input_raises(self):
+        parser = TieredJSONParser()
+        with self.assertRaises(ValueError):
+            parser.parse("not json at all")
+        self.assertEqual(parser.get_stats()["failures"], 1)
+
+    def test_response_round_trips_through_fast_path(self):
+        response = RexiaAIResponse(question="q", answer=["    indented", "{braces}"], confidence_score=90.0)
+        parser = TieredJSONParser()
+        parsed = parser.parse(str(response))
+        self.assertEqual(parsed, response.to_dict())
+        self.assertEqual(parser.get_stats()["json"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()